@@ -0,0 +1,39 @@
+"""promote domain_guess_verified to a boolean column
+
+Revision ID: 0010_domain_guess_verified
+Revises: 0009_add_config_table
+Create Date: 2026-10-15
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0010_domain_guess_verified"
+down_revision = "0009_add_config_table"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "businesses",
+        sa.Column("domain_guess_verified", sa.Boolean(), nullable=False, server_default=sa.false()),
+    )
+    # Backfill from the legacy JSONB flag so already-guessed rows are not re-queued.
+    op.execute(
+        "UPDATE businesses SET domain_guess_verified = true "
+        "WHERE raw ? 'domain_guess_verified'"
+    )
+    op.create_index(
+        "businesses_domain_guess_pending_idx",
+        "businesses",
+        [sa.text("lead_score DESC NULLS LAST")],
+        postgresql_where=sa.text(
+            "domain_guess_verified IS false AND (website_url IS NULL OR website_url = '')"
+        ),
+    )
+
+
+def downgrade():
+    op.drop_index("businesses_domain_guess_pending_idx", table_name="businesses")
+    op.drop_column("businesses", "domain_guess_verified")
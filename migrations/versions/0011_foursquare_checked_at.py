@@ -0,0 +1,31 @@
+"""track foursquare enrichment/verification in indexed columns
+
+Revision ID: 0011_foursquare_checked_at
+Revises: 0010_domain_guess_verified
+Create Date: 2026-10-15
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0011_foursquare_checked_at"
+down_revision = "0010_domain_guess_verified"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column("businesses", sa.Column("foursquare_enriched_at", sa.DateTime(timezone=True)))
+    op.add_column("businesses", sa.Column("foursquare_verified_at", sa.DateTime(timezone=True)))
+    # Backfill from the legacy JSONB keys so processed rows are not re-queued.
+    op.execute("UPDATE businesses SET foursquare_enriched_at = now() WHERE raw ? 'foursquare'")
+    op.execute("UPDATE businesses SET foursquare_verified_at = now() WHERE raw ? 'foursquare_verified'")
+    op.create_index("businesses_foursquare_enriched_at_idx", "businesses", ["foursquare_enriched_at"])
+    op.create_index("businesses_foursquare_verified_at_idx", "businesses", ["foursquare_verified_at"])
+
+
+def downgrade():
+    op.drop_index("businesses_foursquare_verified_at_idx", table_name="businesses")
+    op.drop_index("businesses_foursquare_enriched_at_idx", table_name="businesses")
+    op.drop_column("businesses", "foursquare_verified_at")
+    op.drop_column("businesses", "foursquare_enriched_at")
@@ -0,0 +1,30 @@
+"""persistent cache of google places text search responses
+
+Revision ID: 0012_places_cache
+Revises: 0011_foursquare_checked_at
+Create Date: 2026-10-15
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "0012_places_cache"
+down_revision = "0011_foursquare_checked_at"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "places_cache",
+        sa.Column("key", sa.Text(), primary_key=True),
+        sa.Column("response", postgresql.JSONB()),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+    )
+    op.create_index("places_cache_created_at_idx", "places_cache", ["created_at"])
+
+
+def downgrade():
+    op.drop_index("places_cache_created_at_idx", table_name="places_cache")
+    op.drop_table("places_cache")
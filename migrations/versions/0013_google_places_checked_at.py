@@ -0,0 +1,48 @@
+"""track google places enrichment/verification in indexed columns
+
+Revision ID: 0013_google_places_checked_at
+Revises: 0012_places_cache
+Create Date: 2026-10-15
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0013_google_places_checked_at"
+down_revision = "0012_places_cache"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column("businesses", sa.Column("google_places_enriched_at", sa.DateTime(timezone=True)))
+    op.add_column("businesses", sa.Column("google_places_verified_at", sa.DateTime(timezone=True)))
+    # Backfill from the legacy JSONB keys so processed rows are not re-queued.
+    op.execute("UPDATE businesses SET google_places_enriched_at = now() WHERE raw ? 'google_places'")
+    op.execute(
+        "UPDATE businesses SET google_places_verified_at = now() "
+        "WHERE raw ? 'google_places_verified'"
+    )
+    op.create_index(
+        "businesses_google_places_enrich_pending_idx",
+        "businesses",
+        ["created_at"],
+        postgresql_where=sa.text(
+            "google_places_enriched_at IS NULL AND name IS NOT NULL AND name <> ''"
+        ),
+    )
+    op.create_index(
+        "businesses_google_places_verify_pending_idx",
+        "businesses",
+        [sa.text("lead_score DESC"), "created_at"],
+        postgresql_where=sa.text(
+            "google_places_verified_at IS NULL AND (website_url IS NULL OR website_url = '')"
+        ),
+    )
+
+
+def downgrade():
+    op.drop_index("businesses_google_places_verify_pending_idx", table_name="businesses")
+    op.drop_index("businesses_google_places_enrich_pending_idx", table_name="businesses")
+    op.drop_column("businesses", "google_places_verified_at")
+    op.drop_column("businesses", "google_places_enriched_at")
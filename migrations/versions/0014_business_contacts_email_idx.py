@@ -0,0 +1,27 @@
+"""partial index on business_contacts for email contacts
+
+Revision ID: 0014_business_contacts_email_idx
+Revises: 0013_google_places_checked_at
+Create Date: 2026-10-15
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0014_business_contacts_email_idx"
+down_revision = "0013_google_places_checked_at"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "business_contacts_email_business_idx",
+        "business_contacts",
+        ["business_id"],
+        postgresql_where=sa.text("contact_type = 'email'"),
+    )
+
+
+def downgrade():
+    op.drop_index("business_contacts_email_business_idx", table_name="business_contacts")
@@ -0,0 +1,27 @@
+"""partial index ordering website-less businesses by score for google verify
+
+Revision ID: 0015_no_website_score_idx
+Revises: 0014_business_contacts_email_idx
+Create Date: 2026-10-15
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0015_no_website_score_idx"
+down_revision = "0014_business_contacts_email_idx"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "businesses_no_website_score_created_idx",
+        "businesses",
+        [sa.text("lead_score DESC"), "created_at"],
+        postgresql_where=sa.text("website_url IS NULL OR website_url = ''"),
+    )
+
+
+def downgrade():
+    op.drop_index("businesses_no_website_score_created_idx", table_name="businesses")
@@ -0,0 +1,54 @@
+"""track google search verification and hunter enrichment in indexed columns
+
+Revision ID: 0016_search_hunter_checked_at
+Revises: 0015_no_website_score_idx
+Create Date: 2026-10-15
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0016_search_hunter_checked_at"
+down_revision = "0015_no_website_score_idx"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column("businesses", sa.Column("google_search_verified_at", sa.DateTime(timezone=True)))
+    op.add_column("businesses", sa.Column("hunter_enriched_at", sa.DateTime(timezone=True)))
+    # Backfill from the legacy JSONB keys so processed rows are not re-queued.
+    op.execute(
+        "UPDATE businesses SET google_search_verified_at = now() "
+        "WHERE raw ? 'google_search_verified'"
+    )
+    op.execute("UPDATE businesses SET hunter_enriched_at = now() WHERE raw ? 'hunter_enriched'")
+    # Superseded by the pending-queue index below, which also excludes verified rows.
+    op.drop_index("businesses_no_website_score_created_idx", table_name="businesses")
+    op.create_index(
+        "businesses_google_search_pending_idx",
+        "businesses",
+        [sa.text("lead_score DESC"), "created_at"],
+        postgresql_where=sa.text(
+            "google_search_verified_at IS NULL AND (website_url IS NULL OR website_url = '')"
+        ),
+    )
+    op.create_index(
+        "businesses_hunter_pending_idx",
+        "businesses",
+        [sa.text("lead_score DESC")],
+        postgresql_where=sa.text("hunter_enriched_at IS NULL"),
+    )
+
+
+def downgrade():
+    op.drop_index("businesses_hunter_pending_idx", table_name="businesses")
+    op.drop_index("businesses_google_search_pending_idx", table_name="businesses")
+    op.create_index(
+        "businesses_no_website_score_created_idx",
+        "businesses",
+        [sa.text("lead_score DESC"), "created_at"],
+        postgresql_where=sa.text("website_url IS NULL OR website_url = ''"),
+    )
+    op.drop_column("businesses", "hunter_enriched_at")
+    op.drop_column("businesses", "google_search_verified_at")
@@ -0,0 +1,40 @@
+"""index the google places enrich queue in its keyset order
+
+Revision ID: 0017_places_enrich_order_idx
+Revises: 0016_search_hunter_checked_at
+Create Date: 2026-10-15
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0017_places_enrich_order_idx"
+down_revision = "0016_search_hunter_checked_at"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # The enrich batch pages by (website_url IS NOT NULL, created_at, id);
+    # the created_at-only index from 0013 could not serve that ORDER BY.
+    op.drop_index("businesses_google_places_enrich_pending_idx", table_name="businesses")
+    op.create_index(
+        "businesses_google_places_enrich_pending_idx",
+        "businesses",
+        [sa.text("(website_url IS NOT NULL)"), "created_at", "id"],
+        postgresql_where=sa.text(
+            "google_places_enriched_at IS NULL AND name IS NOT NULL AND name <> ''"
+        ),
+    )
+
+
+def downgrade():
+    op.drop_index("businesses_google_places_enrich_pending_idx", table_name="businesses")
+    op.create_index(
+        "businesses_google_places_enrich_pending_idx",
+        "businesses",
+        ["created_at"],
+        postgresql_where=sa.text(
+            "google_places_enriched_at IS NULL AND name IS NOT NULL AND name <> ''"
+        ),
+    )
@@ -93,8 +93,12 @@ class ConfigSchema:
     # Export
     export_dir: str = field(default_factory=lambda: os.getenv("EXPORT_DIR", "./exports"))
 
+    # Redis (optional; shared cross-process counters such as API quotas)
+    redis_url: Optional[str] = field(default_factory=lambda: _env_str("REDIS_URL"))
+
     # --- API keys (third-party services) ---
     google_places_api_key: Optional[str] = field(default_factory=lambda: _env_str("GOOGLE_PLACES_API_KEY"))
+    google_places_monthly_quota: int = field(default_factory=lambda: _env_int("GOOGLE_PLACES_MONTHLY_QUOTA", 9500))
     foursquare_api_key: Optional[str] = field(default_factory=lambda: _env_str("FOURSQUARE_API_KEY"))
     openrouter_api_key: Optional[str] = field(default_factory=lambda: _env_str("OPENROUTER_API_KEY"))
     gemini_api_key: Optional[str] = field(default_factory=lambda: _env_str("GEMINI_API_KEY"))
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import logging
 from contextlib import contextmanager
-from sqlalchemy import create_engine
+
+import orjson
+from sqlalchemy import create_engine, make_url
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 from .config import load_config
 
@@ -14,7 +16,17 @@ class Base(DeclarativeBase):
     pass
 
 
+def _json_serializer(value) -> str:
+    # orjson is several times faster than stdlib json for the raw/details
+    # JSONB payloads; OPT_NON_STR_KEYS keeps json.dumps' int-key behaviour.
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 _config = load_config()
+_engine_kwargs = {}
+if make_url(_config.database_url).get_driver_name() == "psycopg2":
+    # Batch executemany() for UPDATEs too (INSERTs already use insertmanyvalues)
+    _engine_kwargs["executemany_mode"] = "values_plus_batch"
 _engine = create_engine(
     _config.database_url,
     pool_pre_ping=True,
@@ -22,6 +34,9 @@ _engine = create_engine(
     max_overflow=20,    # Allow bursts up to 30 total connections
     pool_recycle=3600,  # Recycle connections after 1 hour to prevent stale connections
     pool_timeout=30,    # Timeout after 30 seconds waiting for a connection from the pool
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
+    **_engine_kwargs,
 )
 SessionLocal = sessionmaker(bind=_engine, expire_on_commit=False)
 
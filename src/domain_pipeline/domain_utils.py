@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Optional
 from urllib.parse import urlparse
 
@@ -135,6 +136,7 @@ def extract_domain_from_email(email: str) -> Optional[str]:
     return normalize_domain(email)
 
 
+@lru_cache(maxsize=4096)
 def is_public_email_domain(domain: str) -> bool:
     if not domain:
         return False
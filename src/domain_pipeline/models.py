@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import uuid
 from typing import Optional
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, Numeric, Text, UniqueConstraint, Index
+from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, Numeric, Text, UniqueConstraint, Index, false, or_
+from sqlalchemy.ext.mutable import MutableDict
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 from sqlalchemy.dialects.postgresql import UUID, JSONB, CITEXT
@@ -150,6 +151,8 @@ class Business(Base):
         UniqueConstraint("source", "source_id", name="businesses_source_uidx"),
         Index("businesses_lead_score_idx", "lead_score"),
         Index("businesses_city_idx", "city_id"),
+        Index("businesses_foursquare_enriched_at_idx", "foursquare_enriched_at"),
+        Index("businesses_foursquare_verified_at_idx", "foursquare_verified_at"),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -164,7 +167,16 @@ class Business(Base):
     scored_at: Mapped[Optional[DateTime]] = mapped_column(DateTime(timezone=True))
     lat: Mapped[Optional[float]] = mapped_column(Numeric)
     lon: Mapped[Optional[float]] = mapped_column(Numeric)
-    raw: Mapped[Optional[dict]] = mapped_column(JSONB)
+    # MutableDict tracks top-level key writes, so workers can update raw in
+    # place instead of copying and reassigning the whole document.
+    raw: Mapped[Optional[dict]] = mapped_column(MutableDict.as_mutable(JSONB))
+    domain_guess_verified: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False, server_default=false())
+    foursquare_enriched_at: Mapped[Optional[DateTime]] = mapped_column(DateTime(timezone=True))
+    foursquare_verified_at: Mapped[Optional[DateTime]] = mapped_column(DateTime(timezone=True))
+    google_places_enriched_at: Mapped[Optional[DateTime]] = mapped_column(DateTime(timezone=True))
+    google_places_verified_at: Mapped[Optional[DateTime]] = mapped_column(DateTime(timezone=True))
+    google_search_verified_at: Mapped[Optional[DateTime]] = mapped_column(DateTime(timezone=True))
+    hunter_enriched_at: Mapped[Optional[DateTime]] = mapped_column(DateTime(timezone=True))
     created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
     city_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("cities.id", ondelete="SET NULL"))
@@ -174,6 +186,57 @@ class Business(Base):
     exports: Mapped[list[BusinessOutreachExport]] = relationship("BusinessOutreachExport", back_populates="business", cascade="all, delete-orphan")
 
 
+# Partial index backing the domain-guess work queue: only rows that still
+# need a guess are indexed, in the same order run_batch consumes them.
+Index(
+    "businesses_domain_guess_pending_idx",
+    Business.lead_score.desc().nullslast(),
+    postgresql_where=(
+        Business.domain_guess_verified.is_(False)
+        & or_(Business.website_url.is_(None), Business.website_url == "")
+    ),
+)
+
+# Partial indexes backing the Google Places work queues.
+Index(
+    "businesses_google_places_enrich_pending_idx",
+    Business.website_url.isnot(None),
+    Business.created_at,
+    Business.id,
+    postgresql_where=(
+        Business.google_places_enriched_at.is_(None)
+        & Business.name.isnot(None)
+        & (Business.name != "")
+    ),
+)
+Index(
+    "businesses_google_places_verify_pending_idx",
+    Business.lead_score.desc(),
+    Business.created_at,
+    postgresql_where=(
+        Business.google_places_verified_at.is_(None)
+        & or_(Business.website_url.is_(None), Business.website_url == "")
+    ),
+)
+
+# Partial indexes backing the Google search verification and Hunter queues,
+# in the order their run_batch consumes them.
+Index(
+    "businesses_google_search_pending_idx",
+    Business.lead_score.desc(),
+    Business.created_at,
+    postgresql_where=(
+        Business.google_search_verified_at.is_(None)
+        & or_(Business.website_url.is_(None), Business.website_url == "")
+    ),
+)
+Index(
+    "businesses_hunter_pending_idx",
+    Business.lead_score.desc(),
+    postgresql_where=Business.hunter_enriched_at.is_(None),
+)
+
+
 class BusinessOutreachExport(Base):
     __tablename__ = "business_outreach_exports"
     __table_args__ = (
@@ -208,6 +271,14 @@ class BusinessContact(Base):
     business: Mapped[Business] = relationship("Business", back_populates="contacts")
 
 
+# Partial index for "does this business have an email contact" lookups.
+Index(
+    "business_contacts_email_business_idx",
+    BusinessContact.business_id,
+    postgresql_where=BusinessContact.contact_type == "email",
+)
+
+
 class BusinessDomainLink(Base):
     __tablename__ = "business_domain_links"
     __table_args__ = (
@@ -262,3 +333,15 @@ class JobCheckpoint(Base):
     updated_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
     job_run: Mapped[Optional[JobRun]] = relationship("JobRun", back_populates="checkpoints")
+
+
+# Google Places Text Search responses, keyed by normalized query + rounded location.
+class PlacesCacheEntry(Base):
+    __tablename__ = "places_cache"
+    __table_args__ = (
+        Index("places_cache_created_at_idx", "created_at"),
+    )
+
+    key: Mapped[str] = mapped_column(Text, primary_key=True)
+    response: Mapped[Optional[dict]] = mapped_column(JSONB)
+    created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
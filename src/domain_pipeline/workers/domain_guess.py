@@ -12,15 +12,16 @@ from __future__ import annotations
 import logging
 import re
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from typing import Optional
 
 import httpx
-from sqlalchemy import or_, not_, select
+from sqlalchemy import or_, select
 
 from ..db import session_scope
 from ..jobs import complete_job, fail_job, start_job
 from ..models import Business, City
+from .business_leads import compute_verification_confidence
 
 logger = logging.getLogger(__name__)
 
@@ -496,14 +497,42 @@ def _domains_related(original_domain: str, final_domain: str) -> bool:
     return False
 
 
-def _fetch_page(url: str) -> tuple[int, str, str, str]:
-    """Fetch a page and return (status_code, body_text, final_url, title).
+# meta description / og:title / og:site_name, in either attribute order.
+# These are reliable even on SPAs whose visible text is rendered by JS.
+_META_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'<meta[^>]*name=["\']description["\'][^>]*content=["\']([^"\']+)',
+        r'<meta[^>]*content=["\']([^"\']+)["\'][^>]*name=["\']description["\']',
+        r'<meta[^>]*property=["\']og:title["\'][^>]*content=["\']([^"\']+)',
+        r'<meta[^>]*content=["\']([^"\']+)["\'][^>]*property=["\']og:title["\']',
+        r'<meta[^>]*property=["\']og:site_name["\'][^>]*content=["\']([^"\']+)',
+        r'<meta[^>]*content=["\']([^"\']+)["\'][^>]*property=["\']og:site_name["\']',
+    )
+]
+_TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+
+
+def _extract_meta_text(head_section: str) -> str:
+    """Join the meta description/og:title/og:site_name values found in the
+    (lowercased) head section into a single space-separated string."""
+    meta_parts = []
+    for pattern in _META_PATTERNS:
+        m = pattern.search(head_section)
+        if m:
+            meta_parts.append(m.group(1))
+    return " ".join(meta_parts)
+
+
+def _fetch_page(url: str) -> tuple[int, str, str, str, str]:
+    """Fetch a page and return (status_code, body_text, final_url, title, meta_text).
+
+    ``meta_text`` is the pre-joined meta description/og values, extracted once
+    here so the validator does not rebuild it for every check.
 
-    Returns (0, "", "", "") on any error.
+    Returns (0, "", "", "", "") on any error.
     """
     try:
-        from urllib.parse import urlparse
-
         with httpx.Client(
             follow_redirects=True,
             timeout=(2.0, 5.0),
@@ -513,13 +542,13 @@ def _fetch_page(url: str) -> tuple[int, str, str, str]:
             resp = client.get(url)
             body = resp.text
             final_url = str(resp.url)
-            # Extract title
-            import re as _re
-            m = _re.search(r"<title[^>]*>(.*?)</title>", body[:5000], _re.IGNORECASE | _re.DOTALL)
+            head_section = body[:5000]
+            m = _TITLE_RE.search(head_section)
             title = m.group(1).strip()[:200].lower() if m else ""
-            return (resp.status_code, body, final_url, title)
+            meta_text = _extract_meta_text(head_section.lower())
+            return (resp.status_code, body, final_url, title, meta_text)
     except Exception:
-        return (0, "", "", "")
+        return (0, "", "", "", "")
 
 
 def _word_in_text(word: str, text: str) -> bool:
@@ -551,6 +580,7 @@ def _is_valid_business_site(
     body: str,
     final_url: str,
     title: str,
+    meta_text: str | None = None,
 ) -> bool:
     """Validate that a live domain is a real business website for this business.
 
@@ -660,20 +690,10 @@ def _is_valid_business_site(
     # - meta description and og:title (reliable even on SPAs)
     # - first 5000 chars of body (up from 3000 — catches Wix/React sites)
     head_section = body_lower[:5000]
-    meta_parts = []
-    for pattern in [
-        r'<meta[^>]*name=["\']description["\'][^>]*content=["\']([^"\']+)',
-        r'<meta[^>]*content=["\']([^"\']+)["\'][^>]*name=["\']description["\']',
-        r'<meta[^>]*property=["\']og:title["\'][^>]*content=["\']([^"\']+)',
-        r'<meta[^>]*content=["\']([^"\']+)["\'][^>]*property=["\']og:title["\']',
-        r'<meta[^>]*property=["\']og:site_name["\'][^>]*content=["\']([^"\']+)',
-        r'<meta[^>]*content=["\']([^"\']+)["\'][^>]*property=["\']og:site_name["\']',
-    ]:
-        m = re.search(pattern, head_section, re.IGNORECASE)
-        if m:
-            meta_parts.append(m.group(1))
+    if meta_text is None:
+        meta_text = _extract_meta_text(head_section)
 
-    check_text = title + " " + " ".join(meta_parts) + " " + body_lower[:5000]
+    check_text = title + " " + meta_text + " " + head_section
 
     # ----- Detect title-is-domain-name pages (near-parked) -----
     # If the page title is just the domain name itself (e.g. "etihads.net"),
@@ -877,7 +897,6 @@ def _is_valid_business_site(
                 # Title is just the domain name — word appears in title only
                 # because of domain echo, not because the page is about this biz.
                 # Require the word in meta description or og:title instead.
-                meta_text = " ".join(meta_parts)
                 if not _word_in_text(the_word, meta_text):
                     logger.debug(
                         "Reject %s for '%s' — single word, title is domain echo, not in meta ('%s')",
@@ -950,38 +969,59 @@ def _check_candidates(
 
     Returns the best (most specific, longest base name) live, non-parked,
     content-relevant URL for this business.
+
+    HEAD checks are consumed as they complete and each live domain is
+    validated immediately. As soon as a valid site is found that no
+    still-pending candidate could outrank (by base-name length), the
+    remaining checks are cancelled and the result returned.
     """
     if not candidates:
         return None
 
-    live_domains: list[tuple[str, int | None]] = []
-
-    with ThreadPoolExecutor(max_workers=min(max_workers, len(candidates))) as pool:
-        futures = {pool.submit(_check_domain, c, timeout): c for c in candidates}
-        for future in as_completed(futures):
-            try:
-                domain, alive, status = future.result()
-                if alive:
-                    live_domains.append((domain, status))
-            except Exception:
-                continue
-
-    # Sort by specificity: longer base name = more specific = higher priority.
-    # "mortonmotor.com" (11-char base) beats "morton.com" (6-char base).
-    live_domains.sort(key=lambda x: _domain_base_length(x[0]), reverse=True)
-
-    # Check live domains: parking + content relevance in priority order
-    for domain, status in live_domains:
-        url = f"https://{domain}"
-        code, body, final_url, title = _fetch_page(url)
-        if _is_valid_business_site(url, business_name, code, body, final_url, title):
-            return url
+    live_domains: list[str] = []
+    best: tuple[int, str] | None = None  # (base length, url)
+
+    pool = ThreadPoolExecutor(max_workers=min(max_workers, len(candidates)))
+    try:
+        pending = {pool.submit(_check_domain, c, timeout): c for c in candidates}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                pending.pop(future)
+                try:
+                    domain, alive, status = future.result()
+                except Exception:
+                    continue
+                if not alive:
+                    continue
+                live_domains.append(domain)
+
+                # Sort by specificity: longer base name = more specific = higher priority.
+                # "mortonmotor.com" (11-char base) beats "morton.com" (6-char base).
+                base_len = _domain_base_length(domain)
+                if best is not None and base_len <= best[0]:
+                    continue
+                url = f"https://{domain}"
+                code, body, final_url, title, meta_text = _fetch_page(url)
+                if _is_valid_business_site(url, business_name, code, body, final_url, title, meta_text):
+                    best = (base_len, url)
+
+            if best is not None and all(
+                _domain_base_length(c) <= best[0] for c in pending.values()
+            ):
+                break
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    if best is not None:
+        return best[1]
 
     # If HTTPS all failed, try HTTP variants
-    for domain, status in live_domains:
+    live_domains.sort(key=_domain_base_length, reverse=True)
+    for domain in live_domains:
         url = f"http://{domain}"
-        code, body, final_url, title = _fetch_page(url)
-        if _is_valid_business_site(url, business_name, code, body, final_url, title):
+        code, body, final_url, title, meta_text = _fetch_page(url)
+        if _is_valid_business_site(url, business_name, code, body, final_url, title, meta_text):
             return url
 
     return None
@@ -1046,12 +1086,7 @@ def run_batch(
                 .where(Business.name.isnot(None))
                 .where(Business.name != "")
                 .where(or_(Business.website_url.is_(None), Business.website_url == ""))
-                .where(
-                    or_(
-                        Business.raw.is_(None),
-                        not_(Business.raw.has_key("domain_guess_verified")),
-                    )
-                )
+                .where(Business.domain_guess_verified.is_(False))
                 .order_by(Business.lead_score.desc().nullslast(), Business.created_at)
             )
             if min_score > 0:
@@ -1108,6 +1143,7 @@ def run_batch(
                 )
                 total_candidates_checked += candidates_checked
 
+                confidence_before = compute_verification_confidence(business.raw)
                 raw = dict(business.raw or {})
                 raw["domain_guess_verified"] = True
                 raw["domain_guess_result"] = result_key
@@ -1123,7 +1159,11 @@ def run_batch(
                     )
 
                 business.raw = raw
-                business.scored_at = None
+                business.domain_guess_verified = True
+                # Only queue a rescore when the outcome can move the score:
+                # a new website, or a change in the verification-confidence cap.
+                if found_url or compute_verification_confidence(raw) != confidence_before:
+                    business.scored_at = None
                 processed += 1
 
                 # Flush every 50 rows to keep transactions short
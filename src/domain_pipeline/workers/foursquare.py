@@ -11,13 +11,24 @@ from __future__ import annotations
 
 import logging
 import re
+import sys
+import threading
 import time
+import unicodedata
+import uuid
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from typing import Any, Optional
 
 from tenacity import retry, wait_exponential, stop_after_attempt, retry_if_exception_type
 
 import requests
-from sqlalchemy import exists, not_, or_, select
+from rapidfuzz import fuzz
+from rapidfuzz import utils as fuzz_utils
+from requests.adapters import HTTPAdapter
+from sqlalchemy import bindparam, cast, exists, func, insert, lambda_stmt, not_, or_, select, update
+from sqlalchemy.dialects.postgresql import JSONB
 
 from ..config import load_config
 from ..db import session_scope
@@ -31,38 +42,156 @@ VERIFY_JOB_NAME = "foursquare_verify_websites"
 
 PLACES_SEARCH_URL = "https://api.foursquare.com/v3/places/search"
 
+# Concurrent searches per batch, and the shared request-rate ceiling they
+# are paced against (previously a fixed 150ms sleep between serial calls).
+SEARCH_WORKERS = 4
+MAX_REQUESTS_PER_SECOND = 10.0
+# Businesses fetched per server-side cursor round-trip.
+STREAM_PARTITION_SIZE = 500
+
+# Process-wide LRU of search results keyed on (query, lat, lon) with the
+# coordinates rounded to 3 decimals (~100m), so repeated and near-duplicate
+# searches across batches don't spend free-tier quota. Only successful
+# responses (including "no results") are cached, never errors.
+SEARCH_CACHE_SIZE = 4096
+_search_cache: OrderedDict[tuple, Optional[dict[str, Any]]] = OrderedDict()
+_search_cache_lock = threading.Lock()
+_SEARCH_FAILED = object()
+
+
+def _search_cache_key(query: str, lat: Optional[float], lon: Optional[float]) -> tuple:
+    return (
+        query,
+        round(lat, 3) if lat is not None else None,
+        round(lon, 3) if lon is not None else None,
+    )
+
+
+def _header_float(headers, *names: str) -> Optional[float]:
+    """Return the first of ``names`` present in ``headers`` as a float."""
+    for name in names:
+        value = headers.get(name)
+        if value is None:
+            continue
+        try:
+            return float(value)
+        except ValueError:
+            continue
+    return None
+
 
 class FoursquareClient:
-    """Foursquare Places API v3 client."""
+    """Foursquare Places API v3 client.
 
-    def __init__(self, api_key: str) -> None:
+    Thread-safe: ``search`` may be called from several worker threads; calls
+    are spaced at most ``max_rps`` per second across all of them, and slowed
+    further when the API's rate-limit headers ask for it.
+    """
+
+    def __init__(self, api_key: str, max_rps: float = MAX_REQUESTS_PER_SECOND) -> None:
         self.session = requests.Session()
         self.session.headers.update({
             "Authorization": api_key,
             "Accept": "application/json",
+            "Connection": "keep-alive",
         })
+        # Pool sized above SEARCH_WORKERS so concurrent searches reuse warm
+        # TLS connections instead of overflowing and reconnecting.
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, pool_block=True)
+        self.session.mount("https://", adapter)
         self._calls_made = 0
+        # _base_interval is the configured ceiling; _min_interval widens
+        # from it when the API's rate-limit headers say quota is running low.
+        self._base_interval = 1.0 / max_rps if max_rps > 0 else 0.0
+        self._min_interval = self._base_interval
+        self._next_allowed = 0.0
+        self._lock = threading.Lock()
 
     @property
     def calls_made(self) -> int:
         return self._calls_made
 
-    def return_none_on_error(retry_state):
-        return None
+    def _throttle(self) -> None:
+        """Reserve the next request slot and sleep until it arrives."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_allowed)
+            self._next_allowed = slot + self._min_interval
+            self._calls_made += 1
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+    def _adapt_rate(self, resp: requests.Response) -> None:
+        """Re-pace requests from the response's rate-limit headers.
+
+        On 429, hold all workers until ``Retry-After`` has elapsed. Otherwise
+        spread the remaining quota evenly over the time left in the window
+        (``RateLimit-Reset / RateLimit-Remaining``), never going faster than
+        the configured ceiling.
+        """
+        headers = resp.headers
+        if resp.status_code == 429:
+            retry_after = _header_float(headers, "Retry-After")
+            if retry_after:
+                with self._lock:
+                    self._next_allowed = max(self._next_allowed, time.monotonic() + retry_after)
+            return
+
+        remaining = _header_float(headers, "RateLimit-Remaining", "X-RateLimit-Remaining")
+        reset = _header_float(headers, "RateLimit-Reset", "X-RateLimit-Reset")
+        if remaining is None or reset is None:
+            return
+        if reset > 1_000_000_000:
+            # Some APIs send an epoch timestamp rather than delta-seconds
+            reset = max(reset - time.time(), 0.0)
+        with self._lock:
+            self._min_interval = max(self._base_interval, reset / max(remaining, 1.0))
+
+    def search(
+        self,
+        query: str,
+        lat: Optional[float] = None,
+        lon: Optional[float] = None,
+    ) -> Optional[dict[str, Any]]:
+        """Search for a place. Returns the top result or None.
+
+        Served from the module-level LRU when an equivalent search was
+        already answered; cache hits do not count towards ``calls_made``.
+        """
+        key = _search_cache_key(query, lat, lon)
+        with _search_cache_lock:
+            if key in _search_cache:
+                _search_cache.move_to_end(key)
+                return _search_cache[key]
+
+        place = self._search_uncached(query, lat, lon)
+        if place is _SEARCH_FAILED:
+            return None
+
+        with _search_cache_lock:
+            _search_cache[key] = place
+            _search_cache.move_to_end(key)
+            while len(_search_cache) > SEARCH_CACHE_SIZE:
+                _search_cache.popitem(last=False)
+        return place
+
+    def return_failed_on_error(retry_state):
+        return _SEARCH_FAILED
 
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
         retry=retry_if_exception_type(requests.RequestException),
-        retry_error_callback=return_none_on_error
+        retry_error_callback=return_failed_on_error
     )
-    def search(
+    def _search_uncached(
         self,
         query: str,
         lat: Optional[float] = None,
         lon: Optional[float] = None,
-    ) -> Optional[dict[str, Any]]:
-        """Search for a place. Returns the top result or None."""
+    ) -> Any:
+        """Call the search endpoint. Returns the top result, None, or _SEARCH_FAILED."""
         params: dict[str, Any] = {
             "query": query,
             "limit": 1,
@@ -73,12 +202,13 @@ class FoursquareClient:
             params["ll"] = f"{lat},{lon}"
             params["radius"] = 2000
 
+        self._throttle()
         resp = self.session.get(
             PLACES_SEARCH_URL,
             params=params,
             timeout=10,
         )
-        self._calls_made += 1
+        self._adapt_rate(resp)
 
         if resp.status_code == 429:
             resp.raise_for_status()
@@ -89,7 +219,7 @@ class FoursquareClient:
                 resp.status_code,
                 resp.text[:200],
             )
-            return None
+            return _SEARCH_FAILED
 
         data = resp.json()
         results = data.get("results", [])
@@ -99,35 +229,179 @@ class FoursquareClient:
         return results[0]
 
 
-def _is_good_match(business: Business, place: dict) -> bool:
-    """Validate that the Foursquare result matches our business."""
-    place_name = (place.get("name") or "").lower()
-    business_name = (business.name or "").lower()
+_MATCH_STOP_WORDS = frozenset({
+    "the", "a", "an", "and", "&", "of", "in", "at", "to", "for", "-", "le", "la", "les", "de", "du",
+})
+# Minimum rapidfuzz token_set_ratio (0-100) for a place to count as our business.
+MATCH_THRESHOLD = 70
+
+
+def _normalize_name(name: Optional[str]) -> str:
+    """Lowercase, strip accents and drop stop words, for _is_good_match."""
+    text = unicodedata.normalize("NFKD", (name or "").lower())
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    return " ".join(w for w in text.split() if w not in _MATCH_STOP_WORDS)
 
-    if not place_name or not business_name:
-        return False
 
-    stop_words = {"the", "a", "an", "and", "&", "of", "in", "at", "to", "for", "-", "le", "la", "les", "de", "du"}
-    biz_words = set(business_name.split()) - stop_words
-    place_words = set(place_name.split()) - stop_words
+def _is_good_match(biz_name: str, place: dict) -> bool:
+    """Validate that the Foursquare result matches our business.
 
-    if not biz_words:
+    ``biz_name`` is the business name already passed through
+    ``_normalize_name``. Uses token_set_ratio so word order, punctuation
+    ("Lou" vs "Lou's") and extra words on either side don't break a match.
+    """
+    place_name = _normalize_name(place.get("name"))
+    if not biz_name or not place_name:
         return False
+    score = fuzz.token_set_ratio(biz_name, place_name, processor=fuzz_utils.default_process)
+    return score >= MATCH_THRESHOLD
+
+
+def _stream_partitions(session, stmt):
+    """Yield the statement's Business rows in lists of STREAM_PARTITION_SIZE.
+
+    Uses a server-side cursor (yield_per) so unlimited batches never hold
+    the full result set, with its raw JSONB, in memory at once. Once the
+    caller has finished with a partition its changes are flushed and the
+    rows are expunged, so the identity map stays bounded too.
+    """
+    result = session.execute(stmt.execution_options(yield_per=STREAM_PARTITION_SIZE))
+    for partition in result.scalars().partitions():
+        businesses = list(partition)
+        yield businesses
+        session.flush()
+        for business in businesses:
+            session.expunge(business)
 
-    overlap = biz_words & place_words
-    return len(overlap) >= max(1, len(biz_words) * 0.5)
+
+def _load_existing_phones(session, business_ids: list[uuid.UUID]) -> defaultdict[uuid.UUID, set[str]]:
+    """Fetch stored phone contacts for a batch of businesses in one query.
+
+    Replaces a per-row existence SELECT with an in-memory membership check.
+    """
+    phones_by_biz: defaultdict[uuid.UUID, set[str]] = defaultdict(set)
+    if not business_ids:
+        return phones_by_biz
+    existing = session.execute(
+        select(BusinessContact.business_id, BusinessContact.value)
+        .where(BusinessContact.business_id.in_(business_ids))
+        .where(BusinessContact.contact_type == "phone")
+    ).all()
+    for business_id, value in existing:
+        phones_by_biz[business_id].add(value)
+    return phones_by_biz
+
+
+def _load_city_names(session, businesses: list[Business]) -> dict[uuid.UUID, str]:
+    """Map city_id → city name for the cities referenced by a batch.
+
+    Cheaper than joining and hydrating a full City row per business when
+    only the name is needed for the search query.
+    """
+    city_ids = {b.city_id for b in businesses if b.city_id}
+    if not city_ids:
+        return {}
+    # Interned so every query suffix for the same city shares one string.
+    return {
+        city_id: sys.intern(name)
+        for city_id, name in session.execute(
+            select(City.id, City.name).where(City.id.in_(city_ids))
+        )
+        if name
+    }
+
+
+_RAW_PATCH_STMTS: dict[str, Any] = {}
+
+
+def _raw_patch_stmt(checked_column: str):
+    """UPDATE merging ``:raw_patch`` into raw, clearing scored_at and
+    stamping ``checked_column``, keyed on ``:b_id`` for executemany."""
+    stmt = _RAW_PATCH_STMTS.get(checked_column)
+    if stmt is None:
+        table = Business.__table__
+        stmt = (
+            update(table)
+            .where(table.c.id == bindparam("b_id"))
+            .values({
+                table.c.raw: func.coalesce(table.c.raw, cast({}, JSONB))
+                .op("||")(bindparam("raw_patch", type_=JSONB)),
+                table.c.scored_at: None,
+                table.c[checked_column]: bindparam("checked_at"),
+            })
+        )
+        _RAW_PATCH_STMTS[checked_column] = stmt
+    return stmt
+
+
+def _flush_raw_patches(session, pending_patches: list[dict], checked_column: str) -> None:
+    """Apply buffered raw patches with a single executemany UPDATE.
+
+    The Business rows are never dirtied through the ORM, so flush doesn't
+    emit one full-row UPDATE (with the whole raw document) per business;
+    only the new keys travel and Postgres merges them with ``||``. The
+    in-memory ``raw`` goes stale, which is fine as partitions are
+    expunged once processed.
+    """
+    if pending_patches:
+        session.connection().execute(_raw_patch_stmt(checked_column), pending_patches)
+        pending_patches.clear()
+
+
+def _flush_contacts(session, pending_contacts: list[dict]) -> None:
+    """Insert buffered BusinessContact rows with a single executemany."""
+    if pending_contacts:
+        session.execute(insert(BusinessContact), pending_contacts)
+        pending_contacts.clear()
 
 
 def _build_search_query(business: Business, city_name: Optional[str] = None) -> str:
-    """Build search query from business name + city."""
-    parts = []
-    if business.name:
-        parts.append(business.name)
-    if business.address:
-        parts.append(business.address)
-    elif city_name:
-        parts.append(city_name)
-    return " ".join(parts)
+    """Build search query from business name + address (or city)."""
+    location = business.address or city_name
+    if not business.name:
+        return location or ""
+    if not location:
+        return business.name
+    return f"{business.name} {location}"
+
+
+def _search_args(business: Business, city_name: Optional[str]) -> Optional[tuple[str, Optional[float], Optional[float]]]:
+    """Return the (query, lat, lon) search arguments, or None if there is nothing to search."""
+    query = _build_search_query(business, city_name)
+    if not query.strip():
+        return None
+    return (
+        query,
+        float(business.lat) if business.lat is not None else None,
+        float(business.lon) if business.lon is not None else None,
+    )
+
+
+def _search_all(
+    client: FoursquareClient,
+    searches: list[Optional[tuple[str, Optional[float], Optional[float]]]],
+) -> list[Optional[dict[str, Any]]]:
+    """Run the batch's searches concurrently, preserving input order.
+
+    Searches that share a cache key (same query, same rounded coordinates)
+    are issued once and the result is reused, so duplicates in a batch
+    neither race each other past the LRU nor spend extra quota.
+
+    Only the HTTP calls run in worker threads; callers apply results to the
+    session sequentially.
+    """
+    unique: dict[tuple, tuple[str, Optional[float], Optional[float]]] = {}
+    for args in searches:
+        if args is not None:
+            unique.setdefault(_search_cache_key(*args), args)
+
+    with ThreadPoolExecutor(max_workers=SEARCH_WORKERS) as executor:
+        results = dict(zip(unique, executor.map(lambda args: client.search(*args), unique.values())))
+
+    return [
+        results[_search_cache_key(*args)] if args is not None else None
+        for args in searches
+    ]
 
 
 def run_batch(
@@ -167,110 +441,99 @@ def run_batch(
         run = start_job(session, JOB_NAME, scope=scope or priority)
 
         try:
-            stmt = (
-                select(Business, City)
-                .outerjoin(City, Business.city_id == City.id)
+            # lambda_stmt caches the constructed statement per code path, so
+            # repeated runs skip rebuilding/compiling it; only the bound
+            # values (batch_size) vary.
+            stmt = lambda_stmt(lambda: (
+                select(Business)
                 .where(Business.name.isnot(None))
                 .where(Business.name != "")
-                .where(
-                    or_(
-                        Business.raw.is_(None),
-                        not_(Business.raw.has_key("foursquare")),
-                    )
-                )
-            )
+                .where(Business.foursquare_enriched_at.is_(None))
+            ))
 
             if priority == "no_contacts":
-                has_any_contact = exists(
+                stmt += lambda s: s.where(not_(exists(
                     select(BusinessContact.id)
                     .where(BusinessContact.business_id == Business.id)
-                )
-                stmt = stmt.where(not_(has_any_contact))
+                )))
             elif priority == "no_phone":
-                has_phone = exists(
+                stmt += lambda s: s.where(not_(exists(
                     select(BusinessContact.id)
                     .where(BusinessContact.business_id == Business.id)
                     .where(BusinessContact.contact_type == "phone")
-                )
-                stmt = stmt.where(not_(has_phone))
+                )))
 
-            stmt = stmt.order_by(
+            stmt += lambda s: s.order_by(
                 Business.website_url.isnot(None).asc(),
                 Business.created_at,
             )
 
             if batch_size is not None:
-                stmt = stmt.limit(batch_size)
-
-            rows = session.execute(stmt).all()
-
-            if not rows:
-                complete_job(session, run, processed_count=0, details={
-                    "priority": priority, "enriched": 0, "phones_added": 0, "api_calls": 0,
-                })
-                return {"processed": 0, "enriched": 0, "phones_added": 0, "api_calls": 0}
+                stmt += lambda s: s.limit(batch_size)
 
             processed = 0
             enriched = 0
             phones_added = 0
-
-            for business, city in rows:
-                city_name = city.name if city else None
-                query = _build_search_query(business, city_name)
-                if not query.strip():
-                    processed += 1
-                    continue
-
-                place = client.search(
-                    query=query,
-                    lat=float(business.lat) if business.lat is not None else None,
-                    lon=float(business.lon) if business.lon is not None else None,
-                )
-
-                if place and _is_good_match(business, place):
-                    raw = dict(business.raw) if business.raw else {}
-                    enrichment = {
-                        "fsq_id": place.get("fsq_id"),
-                        "name": place.get("name"),
-                        "phone": place.get("tel"),
-                        "website": place.get("website"),
-                        "rating": place.get("rating"),
-                        "categories": [
-                            c.get("name") for c in (place.get("categories") or [])
-                        ],
-                    }
-                    raw["foursquare"] = enrichment
-                    business.raw = raw
-                    business.scored_at = None
-                    enriched += 1
-
-                    # Add phone if found and not already stored
-                    phone = (place.get("tel") or "").strip()
-                    if phone:
-                        existing = session.execute(
-                            select(BusinessContact.id)
-                            .where(BusinessContact.business_id == business.id)
-                            .where(BusinessContact.contact_type == "phone")
-                            .where(BusinessContact.value == phone)
-                        ).scalar()
-                        if not existing:
-                            session.add(BusinessContact(
-                                business_id=business.id,
-                                contact_type="phone",
-                                value=phone,
-                                source="foursquare",
-                            ))
+            pending_contacts: list[dict] = []
+            pending_patches: list[dict] = []
+
+            for businesses in _stream_partitions(session, stmt):
+                phones_by_biz = _load_existing_phones(session, [b.id for b in businesses])
+                city_names = _load_city_names(session, businesses)
+                searches = [
+                    _search_args(business, city_names.get(business.city_id))
+                    for business in businesses
+                ]
+                places = _search_all(client, searches)
+                checked_at = datetime.now(timezone.utc)
+
+                for business, args, place in zip(businesses, searches, places):
+                    if args is None:
+                        processed += 1
+                        continue
+
+                    if place and _is_good_match(_normalize_name(business.name), place):
+                        enrichment = {
+                            "fsq_id": place.get("fsq_id"),
+                            "name": place.get("name"),
+                            "phone": place.get("tel"),
+                            "website": place.get("website"),
+                            "rating": place.get("rating"),
+                            "categories": [
+                                c.get("name") for c in (place.get("categories") or [])
+                            ],
+                        }
+                        pending_patches.append({
+                            "b_id": business.id,
+                            "raw_patch": {"foursquare": enrichment},
+                            "checked_at": checked_at,
+                        })
+                        enriched += 1
+
+                        # Add phone if found and not already stored
+                        phone = (place.get("tel") or "").strip()
+                        if phone and phone not in phones_by_biz[business.id]:
+                            pending_contacts.append({
+                                "business_id": business.id,
+                                "contact_type": "phone",
+                                "value": phone,
+                                "source": "foursquare",
+                            })
+                            phones_by_biz[business.id].add(phone)
                             phones_added += 1
 
-                processed += 1
-                if processed % 50 == 0:
-                    session.flush()
-                    logger.info(
-                        "Foursquare enrichment: %d/%d processed, %d enriched, %d phones",
-                        processed, len(rows), enriched, phones_added,
-                    )
-                time.sleep(0.15)
-
+                    processed += 1
+                    if processed % 50 == 0:
+                        _flush_contacts(session, pending_contacts)
+                        _flush_raw_patches(session, pending_patches, "foursquare_enriched_at")
+                        session.flush()
+                        logger.info(
+                            "Foursquare enrichment: %d processed, %d enriched, %d phones",
+                            processed, enriched, phones_added,
+                        )
+
+            _flush_contacts(session, pending_contacts)
+            _flush_raw_patches(session, pending_patches, "foursquare_enriched_at")
             details = {
                 "priority": priority, "enriched": enriched,
                 "phones_added": phones_added, "api_calls": client.calls_made,
@@ -318,123 +581,90 @@ def verify_websites(
         run = start_job(session, VERIFY_JOB_NAME, scope=scope)
 
         try:
-            stmt = (
-                select(Business, City)
-                .outerjoin(City, Business.city_id == City.id)
+            stmt = lambda_stmt(lambda: (
+                select(Business)
                 .where(Business.name.isnot(None))
                 .where(Business.name != "")
                 .where(or_(Business.website_url.is_(None), Business.website_url == ""))
                 .where(Business.lead_score >= min_score)
-                .where(
-                    or_(
-                        Business.raw.is_(None),
-                        not_(Business.raw.has_key("foursquare_verified")),
-                    )
-                )
+                .where(Business.foursquare_verified_at.is_(None))
                 .order_by(Business.lead_score.desc(), Business.created_at)
-            )
+            ))
 
             if batch_size is not None:
-                stmt = stmt.limit(batch_size)
-
-            rows = session.execute(stmt).all()
-
-            if not rows:
-                complete_job(session, run, processed_count=0, details={
-                    "min_score": min_score, "websites_found": 0,
-                    "no_website_confirmed": 0, "no_match": 0, "api_calls": 0,
-                })
-                return {
-                    "processed": 0, "websites_found": 0,
-                    "no_website_confirmed": 0, "no_match": 0, "api_calls": 0,
-                }
+                stmt += lambda s: s.limit(batch_size)
 
             processed = 0
             websites_found = 0
             no_website_confirmed = 0
             no_match = 0
-
-            for business, city in rows:
-                city_name = city.name if city else None
-                query = _build_search_query(business, city_name)
-                if not query.strip():
-                    processed += 1
-                    continue
-
-                place = client.search(
-                    query=query,
-                    lat=float(business.lat) if business.lat is not None else None,
-                    lon=float(business.lon) if business.lon is not None else None,
-                )
-
-                raw = dict(business.raw) if business.raw else {}
-
-                if not place:
-                    raw["foursquare_verified"] = True
-                    raw["foursquare_verify_result"] = "no_match"
-                    business.raw = raw
-                    business.scored_at = None
-                    no_match += 1
+            pending_contacts: list[dict] = []
+            pending_patches: list[dict] = []
+
+            for businesses in _stream_partitions(session, stmt):
+                phones_by_biz = _load_existing_phones(session, [b.id for b in businesses])
+                city_names = _load_city_names(session, businesses)
+                searches = [
+                    _search_args(business, city_names.get(business.city_id))
+                    for business in businesses
+                ]
+                places = _search_all(client, searches)
+                checked_at = datetime.now(timezone.utc)
+
+                for business, args, place in zip(businesses, searches, places):
+                    if args is None:
+                        processed += 1
+                        continue
+
+                    raw_updates: dict[str, Any] = {"foursquare_verified": True}
+
+                    if not place:
+                        raw_updates["foursquare_verify_result"] = "no_match"
+                        no_match += 1
+                    elif not _is_good_match(_normalize_name(business.name), place):
+                        raw_updates["foursquare_verify_result"] = "poor_match"
+                        raw_updates["foursquare_verify_name"] = place.get("name")
+                        no_match += 1
+                    else:
+                        raw_updates["foursquare_verify_name"] = place.get("name")
+                        website = (place.get("website") or "").strip()
+                        if website:
+                            business.website_url = website
+                            raw_updates["foursquare_verify_result"] = "has_website"
+                            raw_updates["foursquare_website"] = website
+                            websites_found += 1
+                        else:
+                            raw_updates["foursquare_verify_result"] = "no_website"
+                            no_website_confirmed += 1
+
+                        # Enrich with phone if available
+                        phone = (place.get("tel") or "").strip()
+                        if phone and phone not in phones_by_biz[business.id]:
+                            pending_contacts.append({
+                                "business_id": business.id,
+                                "contact_type": "phone",
+                                "value": phone,
+                                "source": "foursquare",
+                            })
+                            phones_by_biz[business.id].add(phone)
+
+                    pending_patches.append({
+                        "b_id": business.id,
+                        "raw_patch": raw_updates,
+                        "checked_at": checked_at,
+                    })
                     processed += 1
-                    time.sleep(0.15)
-                    continue
-
-                if not _is_good_match(business, place):
-                    raw["foursquare_verified"] = True
-                    raw["foursquare_verify_result"] = "poor_match"
-                    raw["foursquare_verify_name"] = place.get("name")
-                    business.raw = raw
-                    business.scored_at = None
-                    no_match += 1
-                    processed += 1
-                    time.sleep(0.15)
-                    continue
-
-                website = (place.get("website") or "").strip()
-
-                if website:
-                    business.website_url = website
-                    raw["foursquare_verified"] = True
-                    raw["foursquare_verify_result"] = "has_website"
-                    raw["foursquare_website"] = website
-                    raw["foursquare_verify_name"] = place.get("name")
-                    business.raw = raw
-                    business.scored_at = None
-                    websites_found += 1
-                else:
-                    raw["foursquare_verified"] = True
-                    raw["foursquare_verify_result"] = "no_website"
-                    raw["foursquare_verify_name"] = place.get("name")
-                    business.raw = raw
-                    business.scored_at = None
-                    no_website_confirmed += 1
-
-                # Enrich with phone if available
-                phone = (place.get("tel") or "").strip()
-                if phone:
-                    existing = session.execute(
-                        select(BusinessContact.id)
-                        .where(BusinessContact.business_id == business.id)
-                        .where(BusinessContact.contact_type == "phone")
-                        .where(BusinessContact.value == phone)
-                    ).scalar()
-                    if not existing:
-                        session.add(BusinessContact(
-                            business_id=business.id,
-                            contact_type="phone",
-                            value=phone,
-                            source="foursquare",
-                        ))
-
-                processed += 1
-                if processed % 50 == 0:
-                    session.flush()
-                    logger.info(
-                        "Foursquare verification: %d/%d, %d websites, %d no website, %d no match",
-                        processed, len(rows), websites_found, no_website_confirmed, no_match,
-                    )
-                time.sleep(0.15)
-
+                    if processed % 50 == 0:
+                        _flush_contacts(session, pending_contacts)
+                        _flush_raw_patches(session, pending_patches, "foursquare_verified_at")
+                        session.flush()
+                        logger.info(
+                            "Foursquare verification: %d processed, %d websites, %d no website, %d no match",
+                            processed, websites_found, no_website_confirmed, no_match,
+                        )
+
+            _flush_contacts(session, pending_contacts)
+            _flush_raw_patches(session, pending_patches, "foursquare_verified_at")
             details = {
                 "min_score": min_score, "websites_found": websites_found,
                 "no_website_confirmed": no_website_confirmed, "no_match": no_match,
@@ -12,21 +12,34 @@ Free tier: 10,000 calls/month on Essentials SKUs.
 """
 from __future__ import annotations
 
+import hashlib
 import logging
+import string
+import threading
 import time
+import unicodedata
+import uuid
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Any, Optional
 from urllib.parse import quote_plus
 
 from tenacity import retry, wait_exponential, stop_after_attempt, retry_if_exception_type
 
-import requests
-from sqlalchemy import and_, exists, func, not_, or_, select
+import httpx
+import orjson
+import redis
+from sqlalchemy import and_, bindparam, cast, delete, func, or_, select, tuple_, update
+from sqlalchemy.dialects.postgresql import JSONB, insert as pg_insert
+from sqlalchemy.orm import load_only
 
 from ..config import load_config
 from ..db import session_scope
 from ..domain_utils import normalize_domain
 from ..jobs import complete_job, fail_job, start_job
-from ..models import Business, BusinessContact, City
+from ..models import Business, BusinessContact, City, PlacesCacheEntry
 
 logger = logging.getLogger(__name__)
 
@@ -51,32 +64,160 @@ SEARCH_FIELD_MASK = ",".join([
     "places.location",
 ])
 
+# Concurrent Text Search calls per batch, and the shared request-rate ceiling
+# they are paced against (previously a fixed 150ms sleep between serial calls).
+SEARCH_WORKERS = 8
+MAX_REQUESTS_PER_SECOND = 10.0
+
+# Monthly call counters in Redis outlive their month by ~10 days, then expire.
+QUOTA_KEY_TTL_SECONDS = 40 * 86400
+
+# Text Search responses (including "no results") are kept in places_cache for
+# this long, so re-runs, verify-after-enrich and near-duplicate OSM rows don't
+# spend free-tier quota on a query that was already answered. Each enrich or
+# verify run deletes rows past the TTL (via places_cache_created_at_idx).
+PLACES_CACHE_TTL = timedelta(days=30)
+
+# Businesses fetched per server-side cursor round-trip.
+STREAM_PARTITION_SIZE = 200
+# The only Business columns the workers read (including the keyset
+# pagination columns); raw in particular is patched server-side and never
+# needs to be loaded.
+_BUSINESS_SEARCH_COLUMNS = (
+    Business.id, Business.name, Business.address, Business.website_url,
+    Business.lat, Business.lon, Business.city_id,
+    Business.lead_score, Business.created_at,
+)
+_SEARCH_FAILED = object()
+
+
+def _places_cache_key(query: str, lat: Optional[float], lon: Optional[float]) -> str:
+    """sha1 of the normalized query and the location rounded to 3 decimals (~110m)."""
+    normalized = " ".join(unicodedata.normalize("NFKD", query).casefold().split())
+    lat_part = f"{lat:.3f}" if lat is not None else ""
+    lon_part = f"{lon:.3f}" if lon is not None else ""
+    return hashlib.sha1(f"{normalized}|{lat_part}|{lon_part}".encode()).hexdigest()
+
+
+class _RateLimiter:
+    """Leaky bucket spacing ``acquire()`` calls at least 1/max_rps apart.
+
+    Thread-safe; callers reserve the next free slot under the lock and sleep
+    outside it, so waiting threads queue up in order.
+    """
+
+    def __init__(self, max_rps: float) -> None:
+        self._interval = 1.0 / max_rps if max_rps > 0 else 0.0
+        self._next_allowed = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_allowed)
+            self._next_allowed = slot + self._interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+# Process-wide, so every PlacesClient (e.g. run_batch and verify_websites
+# running side by side in the API server) shares the one QPS budget.
+_rate_limiter = _RateLimiter(MAX_REQUESTS_PER_SECOND)
+
+
+class PlacesQuotaExceeded(RuntimeError):
+    """The shared monthly Google Places call budget is used up."""
+
+
+class PlacesQuotaUnavailable(RuntimeError):
+    """The Redis quota counter could not be reached while REDIS_URL is set."""
+
 
 class PlacesClient:
-    """Google Places API (New) client with session pooling."""
+    """Google Places API (New) client over a pooled HTTP/2 connection.
+
+    Thread-safe: ``text_search`` may be called from several worker threads.
+    Every API call, retries included, first takes a slot from
+    ``rate_limiter`` (the shared process-wide limiter by default).
+
+    With ``redis_client`` set, each call is also counted against
+    ``monthly_quota`` in a per-month Redis counter shared by every process,
+    and raises ``PlacesQuotaExceeded`` once the budget is spent, so parallel
+    workers can't silently run past the free tier. If that Redis is down,
+    calls raise ``PlacesQuotaUnavailable`` instead of going uncounted.
+    """
 
-    def __init__(self, api_key: str) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        rate_limiter: Optional[_RateLimiter] = None,
+        redis_client: Optional[redis.Redis] = None,
+        monthly_quota: int = 9500,
+    ) -> None:
         self.api_key = api_key
-        self.session = requests.Session()
-        self.session.headers.update({
-            "Content-Type": "application/json",
-            "X-Goog-Api-Key": api_key,
-        })
+        # HTTP/2 multiplexes the search workers' concurrent calls over one
+        # TLS connection instead of a handshake per pooled HTTP/1.1 socket.
+        self.session = httpx.Client(
+            http2=True,
+            headers={
+                "Content-Type": "application/json",
+                "X-Goog-Api-Key": api_key,
+            },
+            timeout=10.0,
+            # Keep idle connections well past httpx's 5s default so the gap
+            # while a partition's results are written to the DB doesn't
+            # cost a fresh TLS handshake on the next partition.
+            limits=httpx.Limits(
+                max_connections=20, max_keepalive_connections=20, keepalive_expiry=60.0,
+            ),
+        )
         self._calls_made = 0
+        self._rate_limiter = rate_limiter or _rate_limiter
+        self._redis = redis_client
+        self._monthly_quota = monthly_quota
+        self._lock = threading.Lock()
+        # Single-flight map: cache key → Future of the call currently
+        # answering it, shared by any other thread asking the same thing.
+        self._inflight: dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
 
     @property
     def calls_made(self) -> int:
         return self._calls_made
 
-    def return_none_on_error(retry_state):
-        return None
+    def _reserve_quota(self) -> None:
+        """Count one call against the shared monthly budget, if configured.
+
+        Fails closed: if Redis is configured but unreachable, raises
+        PlacesQuotaUnavailable rather than making calls nobody is counting.
+        """
+        if self._redis is None:
+            return
+        key = f"places_calls:{datetime.now(timezone.utc):%Y-%m}"
+        try:
+            used = self._redis.incr(key)
+            if used == 1:
+                self._redis.expire(key, QUOTA_KEY_TTL_SECONDS)
+            if used > self._monthly_quota:
+                self._redis.decr(key)
+        except redis.RedisError as exc:
+            raise PlacesQuotaUnavailable(
+                f"Google Places quota counter unavailable ({exc}); check REDIS_URL "
+                "or unset it to run without the shared monthly quota"
+            ) from exc
+        if used > self._monthly_quota:
+            raise PlacesQuotaExceeded(
+                f"Google Places monthly quota of {self._monthly_quota} calls reached"
+            )
+
+    def _throttle(self) -> None:
+        """Reserve quota, wait for a rate-limiter slot and count the call."""
+        self._reserve_quota()
+        self._rate_limiter.acquire()
+        with self._lock:
+            self._calls_made += 1
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(requests.RequestException),
-        retry_error_callback=return_none_on_error
-    )
     def text_search(
         self,
         query: str,
@@ -85,9 +226,55 @@ class PlacesClient:
     ) -> Optional[dict[str, Any]]:
         """Search for a place by text query.
 
-        Returns the top result or None if no match found.
+        Returns the top result or None if no match found (or the call failed).
         Uses the Essentials-tier Text Search (New) endpoint.
         """
+        place = self._text_search(query, location_lat, location_lon)
+        return None if place is _SEARCH_FAILED else place
+
+    def search_once(
+        self,
+        key: str,
+        query: str,
+        location_lat: Optional[float] = None,
+        location_lon: Optional[float] = None,
+    ) -> Any:
+        """Like ``_text_search``, but concurrent callers passing the same
+        ``key`` (see ``_places_cache_key``) share one API call."""
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+        if not owner:
+            return future.result()
+
+        try:
+            future.set_result(self._text_search(query, location_lat, location_lon))
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+        return future.result()
+
+    def return_failed_on_error(retry_state):
+        return _SEARCH_FAILED
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        retry=retry_if_exception_type(httpx.HTTPError),
+        retry_error_callback=return_failed_on_error
+    )
+    def _text_search(
+        self,
+        query: str,
+        location_lat: Optional[float] = None,
+        location_lon: Optional[float] = None,
+    ) -> Any:
+        """Call Text Search. Returns the top result, None, or _SEARCH_FAILED."""
         body: dict[str, Any] = {
             "textQuery": query,
             "maxResultCount": 1,
@@ -105,13 +292,12 @@ class PlacesClient:
                 }
             }
 
+        self._throttle()
         resp = self.session.post(
             PLACES_TEXT_SEARCH_URL,
-            json=body,
+            content=orjson.dumps(body),
             headers={"X-Goog-FieldMask": SEARCH_FIELD_MASK},
-            timeout=10,
         )
-        self._calls_made += 1
 
         if resp.status_code == 429:
             resp.raise_for_status()
@@ -122,9 +308,9 @@ class PlacesClient:
                 resp.status_code,
                 resp.text[:200],
             )
-            return None
+            return _SEARCH_FAILED
 
-        data = resp.json()
+        data = orjson.loads(resp.content)
         places = data.get("places", [])
         if not places:
             return None
@@ -132,10 +318,11 @@ class PlacesClient:
         return places[0]
 
 
-def _build_search_query(business: Business, city_name: Optional[str] = None) -> str:
+def _build_search_query(business: Business, city_name: Optional[str] = None) -> tuple[str, bool]:
     """Build a search query from business name + address/city.
 
-    The more specific the query, the better the match accuracy.
+    The more specific the query, the better the match accuracy. Returns the
+    query and whether it carries a disambiguator (address or city).
     """
     parts = []
 
@@ -148,38 +335,42 @@ def _build_search_query(business: Business, city_name: Optional[str] = None) ->
     elif city_name:
         parts.append(city_name)
 
-    return " ".join(parts)
+    return " ".join(parts), len(parts) > 1
 
 
-def _is_good_match(business: Business, place: dict) -> bool:
-    """Basic validation that the Places result matches our business.
+# Very common words ignored when comparing business and place names.
+_STOP_WORDS: frozenset[str] = frozenset({
+    "the", "a", "an", "and", "&", "of", "in", "at", "to", "for", "-", "le", "la", "les", "de", "du",
+})
+_STRIP_PUNCTUATION = str.maketrans("", "", string.punctuation)
 
-    Prevents enriching business A with data from business B.
-    """
-    place_name = (place.get("displayName", {}).get("text") or "").lower()
-    business_name = (business.name or "").lower()
 
-    if not place_name or not business_name:
-        return False
+@lru_cache(maxsize=4096)
+def _name_tokens(name: Optional[str]) -> frozenset[str]:
+    """Casefolded, punctuation-stripped words of a name, minus stop words.
 
-    # Check if names share significant overlap
-    # Split both into words and check overlap
-    biz_words = set(business_name.split())
-    place_words = set(place_name.split())
+    Cached: chain and franchise names repeat across both businesses and
+    place results.
+    """
+    return frozenset((name or "").casefold().translate(_STRIP_PUNCTUATION).split()) - _STOP_WORDS
 
-    # Remove very common words
-    stop_words = {"the", "a", "an", "and", "&", "of", "in", "at", "to", "for", "-", "le", "la", "les", "de", "du"}
-    biz_words -= stop_words
-    place_words -= stop_words
 
+def _is_good_match(biz_words: frozenset[str], place: dict) -> bool:
+    """Basic validation that the Places result matches our business.
+
+    ``biz_words`` is the business name passed through ``_name_tokens``,
+    computed once per business. Prevents enriching business A with data
+    from business B.
+    """
     if not biz_words:
         return False
 
-    overlap = biz_words & place_words
-    overlap_ratio = len(overlap) / len(biz_words)
+    place_words = _name_tokens(place.get("displayName", {}).get("text"))
+    if not place_words:
+        return False
 
     # At least 50% of business name words should appear in the place name
-    return overlap_ratio >= 0.5
+    return len(biz_words & place_words) / len(biz_words) >= 0.5
 
 
 def _extract_contacts(place: dict) -> dict[str, Any]:
@@ -216,31 +407,300 @@ def _extract_contacts(place: dict) -> dict[str, Any]:
     return result
 
 
-def enrich_business(
-    business: Business,
-    city_name: Optional[str],
-    client: PlacesClient,
-    session,
-) -> Optional[dict]:
-    """Enrich a single business with Google Places data.
+def _search_args(business: Business, city_name: Optional[str]) -> Optional[tuple[str, Optional[float], Optional[float]]]:
+    """Return the (query, lat, lon) search arguments, or None if the search isn't worth a call.
 
-    Returns the enrichment data dict if successful, None if no match.
+    A bare name with neither an address/city nor coordinates to bias the
+    search matches the wrong place too often to spend quota on.
     """
-    query = _build_search_query(business, city_name)
+    query, has_disambiguator = _build_search_query(business, city_name)
     if not query.strip():
         return None
+    lat = float(business.lat) if business.lat is not None else None
+    lon = float(business.lon) if business.lon is not None else None
+    if not has_disambiguator and (lat is None or lon is None):
+        return None
+    return query, lat, lon
+
+
+def _load_cached_places(session, keys: set[str]) -> dict[str, Optional[dict[str, Any]]]:
+    """Fetch unexpired places_cache responses for ``keys`` in one query."""
+    if not keys:
+        return {}
+    return dict(session.execute(
+        select(PlacesCacheEntry.key, PlacesCacheEntry.response)
+        .where(PlacesCacheEntry.key.in_(keys))
+        .where(PlacesCacheEntry.created_at > func.now() - PLACES_CACHE_TTL)
+    ).all())
+
+
+def _store_cached_places(session, responses: dict[str, Optional[dict[str, Any]]]) -> None:
+    """Upsert fresh Text Search responses into places_cache."""
+    if not responses:
+        return
+    stmt = pg_insert(PlacesCacheEntry)
+    session.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[PlacesCacheEntry.key],
+            set_={"response": stmt.excluded.response, "created_at": func.now()},
+        ),
+        [{"key": key, "response": response} for key, response in responses.items()],
+    )
 
-    place = client.text_search(
-        query=query,
-        location_lat=float(business.lat) if business.lat is not None else None,
-        location_lon=float(business.lon) if business.lon is not None else None,
+
+def _purge_expired_places(session) -> int:
+    """Delete places_cache rows older than PLACES_CACHE_TTL; returns the count."""
+    result = session.execute(
+        delete(PlacesCacheEntry)
+        .where(PlacesCacheEntry.created_at <= func.now() - PLACES_CACHE_TTL)
     )
+    return result.rowcount or 0
+
 
+def _submit_searches(
+    session,
+    client: PlacesClient,
+    executor: ThreadPoolExecutor,
+    searches: list[Optional[tuple[str, Optional[float], Optional[float]]]],
+    force_refresh: bool,
+    inflight: dict[str, Future],
+) -> tuple[list[Optional[str]], dict[str, Any], dict[str, Future]]:
+    """Start resolving a partition's searches without waiting for the API.
+
+    Answers come from places_cache where possible (unless ``force_refresh``);
+    the remaining unique searches are submitted to ``executor``, reusing any
+    future in ``inflight`` (the previous partition's uncollected calls).
+    Returns (keys, cached results, futures) for ``_collect_searches``.
+    """
+    keys = [_places_cache_key(*args) if args is not None else None for args in searches]
+    unique = {key: args for key, args in zip(keys, searches) if key is not None}
+
+    results = {} if force_refresh else _load_cached_places(session, set(unique))
+    futures = {
+        key: inflight.get(key) or executor.submit(client.search_once, key, *args)
+        for key, args in unique.items()
+        if key not in results
+    }
+    return keys, results, futures
+
+
+def _collect_searches(
+    session,
+    submitted: tuple[list[Optional[str]], dict[str, Any], dict[str, Future]],
+) -> list[Optional[dict[str, Any]]]:
+    """Wait for a partition's API calls, cache the answers, and return the
+    places in input order. Failed calls are not cached."""
+    keys, results, futures = submitted
+    fetched = {key: future.result() for key, future in futures.items()}
+    fresh = {key: place for key, place in fetched.items() if place is not _SEARCH_FAILED}
+    _store_cached_places(session, fresh)
+    results.update(fresh)
+    return [results.get(key) if key is not None else None for key in keys]
+
+
+def _searched_partitions(
+    session,
+    client: PlacesClient,
+    stmt,
+    after,
+    limit: Optional[int] = None,
+    force_refresh: bool = False,
+):
+    """Yield (businesses, searches, places) for each partition of ``stmt``
+    (see ``_stream_partitions`` for ``after`` and ``limit``).
+
+    Pipelined one partition ahead: the next partition is read and its API
+    calls are in flight on the worker threads while the caller applies the
+    current one, so DB reads/writes and network time overlap instead of
+    alternating. All session access stays on the calling thread.
+    """
+    with ThreadPoolExecutor(max_workers=SEARCH_WORKERS) as executor:
+        ahead = None
+        for businesses in _stream_partitions(session, stmt, after, limit):
+            city_names = _load_city_names(session, businesses)
+            searches = [
+                _search_args(business, city_names.get(business.city_id))
+                for business in businesses
+            ]
+            inflight = ahead[2][2] if ahead is not None else {}
+            submitted = _submit_searches(session, client, executor, searches, force_refresh, inflight)
+            if ahead is not None:
+                yield ahead[0], ahead[1], _collect_searches(session, ahead[2])
+            ahead = (businesses, searches, submitted)
+        if ahead is not None:
+            yield ahead[0], ahead[1], _collect_searches(session, ahead[2])
+
+
+def _stream_partitions(session, stmt, after, limit: Optional[int] = None):
+    """Yield up to ``limit`` of the statement's Business rows in lists of
+    STREAM_PARTITION_SIZE, using keyset pagination.
+
+    Each partition is its own short ``LIMIT`` query continuing past the last
+    row seen (``after(last_business)`` returns the WHERE clause), rather than
+    one cursor held open for the whole run, so callers can commit between
+    partitions without an idle-in-transaction cursor spanning hours of API
+    calls. ``stmt`` must be ordered consistently with ``after`` and end in a
+    unique column.
+
+    A partition's rows are expunged when the next one is fetched; callers
+    only read them (writes go through _queue_raw_patch), so detaching is
+    safe even while they are still being applied.
+    """
+    remaining = limit
+    last = None
+    while remaining is None or remaining > 0:
+        size = STREAM_PARTITION_SIZE if remaining is None else min(STREAM_PARTITION_SIZE, remaining)
+        page = stmt if last is None else stmt.where(after(last))
+        businesses = list(session.scalars(page.limit(size)))
+        if not businesses:
+            return
+        yield businesses
+        for business in businesses:
+            session.expunge(business)
+        if len(businesses) < size:
+            return
+        last = businesses[-1]
+        if remaining is not None:
+            remaining -= len(businesses)
+
+
+def _load_city_names(session, businesses: list[Business]) -> dict[uuid.UUID, str]:
+    """Map city_id → city name for the cities referenced by a partition."""
+    city_ids = {b.city_id for b in businesses if b.city_id}
+    if not city_ids:
+        return {}
+    return dict(session.execute(
+        select(City.id, City.name).where(City.id.in_(city_ids))
+    ).all())
+
+
+def _load_existing_phones(session, business_ids: list[uuid.UUID]) -> defaultdict[uuid.UUID, set[str]]:
+    """Fetch stored phone contacts for a batch of businesses in one query.
+
+    Replaces a per-row existence SELECT with an in-memory membership check.
+    """
+    phones_by_biz: defaultdict[uuid.UUID, set[str]] = defaultdict(set)
+    if not business_ids:
+        return phones_by_biz
+    existing = session.execute(
+        select(BusinessContact.business_id, BusinessContact.value)
+        .where(BusinessContact.business_id.in_(business_ids))
+        .where(BusinessContact.contact_type == "phone")
+    ).all()
+    for business_id, value in existing:
+        phones_by_biz[business_id].add(value)
+    return phones_by_biz
+
+
+def _queue_phone(
+    business: Business,
+    phone: Optional[str],
+    known_phones: set[str],
+    pending_contacts: list[dict],
+) -> bool:
+    """Buffer a phone BusinessContact unless the business already has it."""
+    if not phone or phone in known_phones:
+        return False
+    pending_contacts.append({
+        "business_id": business.id,
+        "contact_type": "phone",
+        "value": phone,
+        "source": "google_places",
+    })
+    known_phones.add(phone)
+    return True
+
+
+def _flush_contacts(session, pending_contacts: list[dict]) -> None:
+    """Insert buffered BusinessContact rows with a single executemany.
+
+    ON CONFLICT DO NOTHING covers phones another worker stored since the
+    batch's existing contacts were loaded.
+    """
+    if pending_contacts:
+        session.execute(
+            pg_insert(BusinessContact).on_conflict_do_nothing(
+                index_elements=["business_id", "contact_type", "value"],
+            ),
+            pending_contacts,
+        )
+        pending_contacts.clear()
+
+
+_businesses = Business.__table__
+_RAW_PATCH_STMT = (
+    update(_businesses)
+    .where(_businesses.c.id == bindparam("b_id"))
+    .values({
+        _businesses.c.raw: func.coalesce(_businesses.c.raw, cast({}, JSONB))
+        .op("||")(bindparam("raw_patch", type_=JSONB)),
+        _businesses.c.scored_at: None,
+        _businesses.c.google_places_enriched_at: func.coalesce(
+            bindparam("enriched_at", type_=_businesses.c.google_places_enriched_at.type),
+            _businesses.c.google_places_enriched_at,
+        ),
+        _businesses.c.google_places_verified_at: func.coalesce(
+            bindparam("verified_at", type_=_businesses.c.google_places_verified_at.type),
+            _businesses.c.google_places_verified_at,
+        ),
+        _businesses.c.website_url: func.coalesce(
+            bindparam("website_url", type_=_businesses.c.website_url.type),
+            _businesses.c.website_url,
+        ),
+    })
+)
+
+
+def _queue_raw_patch(
+    pending_patches: list[dict],
+    business: Business,
+    raw_patch: dict[str, Any],
+    enriched: bool = False,
+    verified: bool = False,
+    website_url: Optional[str] = None,
+) -> None:
+    """Buffer a raw patch, stamping the enriched/verified queue columns and
+    setting website_url when one is given."""
+    now = datetime.now(timezone.utc)
+    pending_patches.append({
+        "b_id": business.id,
+        "raw_patch": raw_patch,
+        "enriched_at": now if enriched else None,
+        "verified_at": now if verified else None,
+        "website_url": website_url,
+    })
+
+
+def _flush_raw_patches(session, pending_patches: list[dict]) -> None:
+    """Apply buffered raw patches with a single executemany UPDATE.
+
+    Merges only the new keys into raw server-side (and clears scored_at)
+    instead of dirtying each Business, which would make flush send the
+    whole raw document back once per row.
+    """
+    if pending_patches:
+        session.connection().execute(_RAW_PATCH_STMT, pending_patches)
+        pending_patches.clear()
+
+
+def enrich_business(
+    business: Business,
+    place: Optional[dict[str, Any]],
+    known_phones: set[str],
+    pending_contacts: list[dict],
+    pending_patches: list[dict],
+) -> Optional[dict]:
+    """Enrich a single business with its Google Places search result.
+
+    New phone contacts and the raw update are appended to
+    ``pending_contacts`` / ``pending_patches`` for the next flush.
+    Returns the enrichment data dict if successful, None if no match.
+    """
     if not place:
         return None
 
     # Validate match quality
-    if not _is_good_match(business, place):
+    if not _is_good_match(_name_tokens(business.name), place):
         logger.debug(
             "Skipping poor match for '%s': got '%s'",
             business.name,
@@ -251,37 +711,39 @@ def enrich_business(
     enrichment = _extract_contacts(place)
 
     # Add phone as BusinessContact if we found one and business doesn't have it
-    if enrichment["phone"]:
-        existing_phone = session.execute(
-            select(BusinessContact.id)
-            .where(BusinessContact.business_id == business.id)
-            .where(BusinessContact.contact_type == "phone")
-            .where(BusinessContact.value == enrichment["phone"])
-        ).scalar()
-
-        if not existing_phone:
-            session.add(BusinessContact(
-                business_id=business.id,
-                contact_type="phone",
-                value=enrichment["phone"],
-                source="google_places",
-            ))
+    _queue_phone(business, enrichment["phone"], known_phones, pending_contacts)
 
     # Add website to raw data if business doesn't have one
     # (Don't set website_url — that would change lead eligibility)
     # Store it in raw for reference
-    raw = business.raw or {}
-    raw["google_places"] = enrichment
-    business.raw = raw
-    business.scored_at = None
+    _queue_raw_patch(pending_patches, business, {"google_places": enrichment}, enriched=True)
 
     return enrichment
 
 
+@lru_cache(maxsize=4)
+def _get_client(api_key: str, redis_url: Optional[str], monthly_quota: int) -> PlacesClient:
+    """Process-wide PlacesClient per configuration.
+
+    Reused across run_batch/verify_websites calls so the HTTP/2 connection
+    and single-flight map stay warm between jobs. calls_made is cumulative
+    per client, so callers report deltas.
+    """
+    redis_client = redis.Redis.from_url(redis_url) if redis_url else None
+    return PlacesClient(api_key, redis_client=redis_client, monthly_quota=monthly_quota)
+
+
+def _make_client(config) -> PlacesClient:
+    return _get_client(
+        config.google_places_api_key, config.redis_url, config.google_places_monthly_quota,
+    )
+
+
 def run_batch(
     limit: Optional[int] = None,
     scope: Optional[str] = None,
     priority: str = "no_contacts",
+    force_refresh: bool = False,
 ) -> dict:
     """Enrich businesses using Google Places API.
 
@@ -293,6 +755,7 @@ def run_batch(
             - "no_contacts": Businesses with no phone/email (default, highest impact)
             - "no_phone": Businesses that have email but no phone
             - "all": Any business without google_places enrichment
+        force_refresh: Ignore cached Places responses and query the API.
 
     Returns:
         Dict with processing stats.
@@ -313,104 +776,121 @@ def run_batch(
     elif limit is not None and limit <= 0:
         batch_size = None  # Unlimited
 
-    client = PlacesClient(config.google_places_api_key)
+    client = _make_client(config)
+    calls_start = client.calls_made
 
     with session_scope() as session:
         run = start_job(session, JOB_NAME, scope=scope or priority)
 
         try:
+            # Expired responses are never read again; drop them so the
+            # cache table doesn't grow without bound.
+            cache_purged = _purge_expired_places(session)
             # Build query based on priority
             stmt = (
-                select(Business, City)
-                .outerjoin(City, Business.city_id == City.id)
+                select(Business)
+                .options(load_only(*_BUSINESS_SEARCH_COLUMNS))
                 .where(Business.name.isnot(None))
                 .where(Business.name != "")
             )
 
             # Exclude already-enriched businesses
-            # Check raw JSONB for google_places key
-            stmt = stmt.where(
-                or_(
-                    Business.raw.is_(None),
-                    not_(Business.raw.has_key("google_places")),
-                )
-            )
+            stmt = stmt.where(Business.google_places_enriched_at.is_(None))
 
+            # Contact filters are LEFT JOIN ... IS NULL anti-joins, answered
+            # from the (business_id, contact_type, value) unique index. At
+            # most one row per business survives, so no GROUP BY is needed.
             if priority == "no_contacts":
                 # Businesses with NO contacts at all — highest impact
-                has_any_contact = exists(
-                    select(BusinessContact.id)
-                    .where(BusinessContact.business_id == Business.id)
+                stmt = (
+                    stmt.outerjoin(BusinessContact, BusinessContact.business_id == Business.id)
+                    .where(BusinessContact.id.is_(None))
                 )
-                stmt = stmt.where(not_(has_any_contact))
             elif priority == "no_phone":
                 # Businesses that have email but no phone
-                has_phone = exists(
-                    select(BusinessContact.id)
-                    .where(BusinessContact.business_id == Business.id)
-                    .where(BusinessContact.contact_type == "phone")
+                stmt = (
+                    stmt.outerjoin(BusinessContact, and_(
+                        BusinessContact.business_id == Business.id,
+                        BusinessContact.contact_type == "phone",
+                    ))
+                    .where(BusinessContact.id.is_(None))
                 )
-                stmt = stmt.where(not_(has_phone))
 
             # Prefer businesses without websites (our lead targets)
             stmt = stmt.order_by(
                 # No-website businesses first
                 Business.website_url.isnot(None).asc(),
                 Business.created_at,
+                Business.id,
             )
 
-            if batch_size is not None:
-                stmt = stmt.limit(batch_size)
-
-            rows = session.execute(stmt).all()
-
-            if not rows:
-                complete_job(session, run, processed_count=0, details={
-                    "priority": priority,
-                    "enriched": 0,
-                    "phones_added": 0,
-                    "api_calls": 0,
-                })
-                return {
-                    "processed": 0,
-                    "enriched": 0,
-                    "phones_added": 0,
-                    "api_calls": 0,
-                }
+            def after(last: Business):
+                return tuple_(
+                    Business.website_url.isnot(None), Business.created_at, Business.id,
+                ) > (last.website_url is not None, last.created_at, last.id)
 
             processed = 0
             enriched = 0
             phones_added = 0
-
-            for business, city in rows:
-                city_name = city.name if city else None
-                result = enrich_business(business, city_name, client, session)
-
-                if result:
-                    enriched += 1
-                    if result.get("phone"):
-                        phones_added += 1
-
-                processed += 1
-
-                # Commit every 50 businesses to avoid losing work
-                if processed % 50 == 0:
-                    session.flush()
-                    logger.info(
-                        "Google Places enrichment progress: %d/%d processed, "
-                        "%d enriched, %d phones added, %d API calls",
-                        processed, len(rows), enriched, phones_added, client.calls_made,
+            skipped_low_quality = 0
+
+            pending_contacts: list[dict] = []
+            pending_patches: list[dict] = []
+
+            for businesses, searches, places in _searched_partitions(
+                session, client, stmt, after, batch_size, force_refresh=force_refresh,
+            ):
+                phones_by_biz = _load_existing_phones(session, [b.id for b in businesses])
+
+                for business, args, place in zip(businesses, searches, places):
+                    if args is None:
+                        # Not searchable; stamp it so it leaves the queue.
+                        _queue_raw_patch(
+                            pending_patches, business,
+                            {"google_places_skipped": "low_quality"}, enriched=True,
+                        )
+                        skipped_low_quality += 1
+                        processed += 1
+                        continue
+
+                    result = enrich_business(
+                        business, place, phones_by_biz[business.id],
+                        pending_contacts, pending_patches,
                     )
 
-                # Respect rate limits — Google allows ~10 QPS on free tier
-                # Small delay to stay well under limit
-                time.sleep(0.15)
+                    if result:
+                        enriched += 1
+                        if result.get("phone"):
+                            phones_added += 1
 
+                    processed += 1
+
+                    # Commit every 50 businesses to avoid losing work
+                    if processed % 50 == 0:
+                        _flush_contacts(session, pending_contacts)
+                        _flush_raw_patches(session, pending_patches)
+                        session.flush()
+                        logger.info(
+                            "Google Places enrichment progress: %d processed, "
+                            "%d enriched, %d phones added, %d API calls",
+                            processed, enriched, phones_added, client.calls_made - calls_start,
+                        )
+
+                # Commit each partition so finished work is durable and no
+                # transaction stays open across the whole run.
+                _flush_contacts(session, pending_contacts)
+                _flush_raw_patches(session, pending_patches)
+                session.commit()
+
+            _flush_contacts(session, pending_contacts)
+            _flush_raw_patches(session, pending_patches)
             details = {
                 "priority": priority,
                 "enriched": enriched,
                 "phones_added": phones_added,
-                "api_calls": client.calls_made,
+                "skipped_low_quality": skipped_low_quality,
+                "api_calls": client.calls_made - calls_start,
+                "cache_purged": cache_purged,
             }
             complete_job(session, run, processed_count=processed, details=details)
 
@@ -418,12 +898,12 @@ def run_batch(
                 "processed": processed,
                 "enriched": enriched,
                 "phones_added": phones_added,
-                "api_calls": client.calls_made,
+                "api_calls": client.calls_made - calls_start,
             }
 
         except Exception as exc:
             fail_job(session, run, error=str(exc), details={
-                "api_calls": client.calls_made,
+                "api_calls": client.calls_made - calls_start,
             })
             raise
 
@@ -435,6 +915,7 @@ def verify_websites(
     limit: Optional[int] = None,
     min_score: float = 30.0,
     scope: Optional[str] = None,
+    force_refresh: bool = False,
 ) -> dict:
     """Verify whether potential leads actually have websites via Google Places.
 
@@ -453,6 +934,7 @@ def verify_websites(
         limit: Max businesses to verify. None = config batch_size, 0 = unlimited.
         min_score: Only verify businesses scoring at or above this threshold.
         scope: Job scope tag.
+        force_refresh: Ignore cached Places responses and query the API.
 
     Returns:
         Dict with processing stats.
@@ -474,168 +956,158 @@ def verify_websites(
     elif limit is not None and limit <= 0:
         batch_size = None  # Unlimited
 
-    client = PlacesClient(config.google_places_api_key)
+    client = _make_client(config)
+    calls_start = client.calls_made
 
     with session_scope() as session:
         run = start_job(session, VERIFY_JOB_NAME, scope=scope)
 
         try:
+            # Expired responses are never read again; drop them so the
+            # cache table doesn't grow without bound.
+            cache_purged = _purge_expired_places(session)
             # Find potential leads that haven't been website-verified yet.
-            # We use raw JSONB to track verification status:
-            #   raw["google_places_verified"] = True means we've checked this business.
             stmt = (
-                select(Business, City)
-                .outerjoin(City, Business.city_id == City.id)
+                select(Business)
+                .options(load_only(*_BUSINESS_SEARCH_COLUMNS))
                 .where(Business.name.isnot(None))
                 .where(Business.name != "")
                 .where(or_(Business.website_url.is_(None), Business.website_url == ""))
                 .where(Business.lead_score >= min_score)
-                .where(
-                    or_(
-                        Business.raw.is_(None),
-                        not_(Business.raw.has_key("google_places_verified")),
-                    )
-                )
-                .order_by(Business.lead_score.desc(), Business.created_at)
+                .where(Business.google_places_verified_at.is_(None))
+                .order_by(Business.lead_score.desc(), Business.created_at, Business.id)
             )
 
-            if batch_size is not None:
-                stmt = stmt.limit(batch_size)
-
-            rows = session.execute(stmt).all()
-
-            if not rows:
-                complete_job(session, run, processed_count=0, details={
-                    "min_score": min_score,
-                    "websites_found": 0,
-                    "no_website_confirmed": 0,
-                    "no_match": 0,
-                    "api_calls": 0,
-                })
-                return {
-                    "processed": 0,
-                    "websites_found": 0,
-                    "no_website_confirmed": 0,
-                    "no_match": 0,
-                    "api_calls": 0,
-                }
+            def after(last: Business):
+                return or_(
+                    Business.lead_score < last.lead_score,
+                    and_(
+                        Business.lead_score == last.lead_score,
+                        tuple_(Business.created_at, Business.id) > (last.created_at, last.id),
+                    ),
+                )
 
             processed = 0
             websites_found = 0
             no_website_confirmed = 0
             no_match = 0
-
-            for business, city in rows:
-                city_name = city.name if city else None
-                query = _build_search_query(business, city_name)
-                if not query.strip():
-                    processed += 1
-                    continue
-
-                place = client.text_search(
-                    query=query,
-                    location_lat=float(business.lat) if business.lat is not None else None,
-                    location_lon=float(business.lon) if business.lon is not None else None,
-                )
-
-                raw = business.raw or {}
-
-                if not place:
-                    # No Google Places result — can't verify
-                    raw["google_places_verified"] = True
-                    raw["google_places_verify_result"] = "no_match"
-                    business.raw = raw
-                    business.scored_at = None
-                    no_match += 1
-                    processed += 1
-                    time.sleep(0.15)
-                    continue
-
-                # Check match quality
-                if not _is_good_match(business, place):
-                    raw["google_places_verified"] = True
-                    raw["google_places_verify_result"] = "poor_match"
-                    raw["google_places_verify_name"] = (
-                        place.get("displayName", {}).get("text")
-                    )
-                    business.raw = raw
-                    business.scored_at = None
-                    no_match += 1
-                    processed += 1
-                    time.sleep(0.15)
-                    continue
-
-                # Good match — check for website
-                website = (place.get("websiteUri") or "").strip()
-
-                if website:
-                    # Google confirms this business HAS a website.
-                    # Set website_url so it gets excluded from leads on rescore.
-                    business.website_url = website
-                    raw["google_places_verified"] = True
-                    raw["google_places_verify_result"] = "has_website"
-                    raw["google_places_website"] = website
-                    raw["google_places_verify_name"] = (
-                        place.get("displayName", {}).get("text")
-                    )
-                    business.raw = raw
-                    websites_found += 1
-                    logger.debug(
-                        "Website found for '%s': %s", business.name, website,
+            skipped_low_quality = 0
+
+            pending_contacts: list[dict] = []
+            pending_patches: list[dict] = []
+
+            for businesses, searches, places in _searched_partitions(
+                session, client, stmt, after, batch_size, force_refresh=force_refresh,
+            ):
+                phones_by_biz = _load_existing_phones(session, [b.id for b in businesses])
+
+                for business, args, place in zip(businesses, searches, places):
+                    if args is None:
+                        # Not searchable; stamp it so it leaves the queue.
+                        # No google_places_verified key, so it doesn't count
+                        # as a verification source.
+                        _queue_raw_patch(
+                            pending_patches, business,
+                            {"google_places_skipped": "low_quality"}, verified=True,
+                        )
+                        skipped_low_quality += 1
+                        processed += 1
+                        continue
+
+                    raw_updates: dict[str, Any] = {}
+                    found_website = None
+
+                    if not place:
+                        # No Google Places result — can't verify
+                        raw_updates["google_places_verified"] = True
+                        raw_updates["google_places_verify_result"] = "no_match"
+                        _queue_raw_patch(pending_patches, business, raw_updates, verified=True)
+                        no_match += 1
+                        processed += 1
+                        continue
+
+                    # Check match quality
+                    if not _is_good_match(_name_tokens(business.name), place):
+                        raw_updates["google_places_verified"] = True
+                        raw_updates["google_places_verify_result"] = "poor_match"
+                        raw_updates["google_places_verify_name"] = (
+                            place.get("displayName", {}).get("text")
+                        )
+                        _queue_raw_patch(pending_patches, business, raw_updates, verified=True)
+                        no_match += 1
+                        processed += 1
+                        continue
+
+                    # Good match — check for website
+                    website = (place.get("websiteUri") or "").strip()
+
+                    if website:
+                        # Google confirms this business HAS a website.
+                        # Set website_url so it gets excluded from leads on rescore.
+                        found_website = website
+                        raw_updates["google_places_verified"] = True
+                        raw_updates["google_places_verify_result"] = "has_website"
+                        raw_updates["google_places_website"] = website
+                        raw_updates["google_places_verify_name"] = (
+                            place.get("displayName", {}).get("text")
+                        )
+                        websites_found += 1
+                        logger.debug(
+                            "Website found for '%s': %s", business.name, website,
+                        )
+                    else:
+                        # Google Places matched but no website — genuine lead candidate!
+                        raw_updates["google_places_verified"] = True
+                        raw_updates["google_places_verify_result"] = "no_website"
+                        raw_updates["google_places_verify_name"] = (
+                            place.get("displayName", {}).get("text")
+                        )
+                        no_website_confirmed += 1
+
+                    # Also enrich with phone if available and not already stored
+                    enrichment = _extract_contacts(place)
+                    _queue_phone(
+                        business, enrichment.get("phone"), phones_by_biz[business.id], pending_contacts,
                     )
-                else:
-                    # Google Places matched but no website — genuine lead candidate!
-                    raw["google_places_verified"] = True
-                    raw["google_places_verify_result"] = "no_website"
-                    raw["google_places_verify_name"] = (
-                        place.get("displayName", {}).get("text")
-                    )
-                    business.raw = raw
-                    no_website_confirmed += 1
-
-                # Also enrich with phone if available and not already stored
-                enrichment = _extract_contacts(place)
-                if enrichment.get("phone"):
-                    existing_phone = session.execute(
-                        select(BusinessContact.id)
-                        .where(BusinessContact.business_id == business.id)
-                        .where(BusinessContact.contact_type == "phone")
-                        .where(BusinessContact.value == enrichment["phone"])
-                    ).scalar()
-                    if not existing_phone:
-                        session.add(BusinessContact(
-                            business_id=business.id,
-                            contact_type="phone",
-                            value=enrichment["phone"],
-                            source="google_places",
-                        ))
-
-                # Store full enrichment data
-                raw["google_places"] = enrichment
-                business.raw = raw
-                business.scored_at = None
-
-                processed += 1
-
-                # Commit every 50
-                if processed % 50 == 0:
-                    session.flush()
-                    logger.info(
-                        "Website verification progress: %d/%d processed, "
-                        "%d have websites, %d confirmed no website, "
-                        "%d no match, %d API calls",
-                        processed, len(rows), websites_found,
-                        no_website_confirmed, no_match, client.calls_made,
+
+                    # Store full enrichment data
+                    raw_updates["google_places"] = enrichment
+                    _queue_raw_patch(
+                        pending_patches, business, raw_updates,
+                        enriched=True, verified=True, website_url=found_website,
                     )
 
-                time.sleep(0.15)
+                    processed += 1
 
+                    # Commit every 50
+                    if processed % 50 == 0:
+                        _flush_contacts(session, pending_contacts)
+                        _flush_raw_patches(session, pending_patches)
+                        session.flush()
+                        logger.info(
+                            "Website verification progress: %d processed, "
+                            "%d have websites, %d confirmed no website, "
+                            "%d no match, %d API calls",
+                            processed, websites_found,
+                            no_website_confirmed, no_match, client.calls_made - calls_start,
+                        )
+
+                # Commit each partition so finished work is durable and no
+                # transaction stays open across the whole run.
+                _flush_contacts(session, pending_contacts)
+                _flush_raw_patches(session, pending_patches)
+                session.commit()
+
+            _flush_contacts(session, pending_contacts)
+            _flush_raw_patches(session, pending_patches)
             details = {
                 "min_score": min_score,
                 "websites_found": websites_found,
                 "no_website_confirmed": no_website_confirmed,
                 "no_match": no_match,
-                "api_calls": client.calls_made,
+                "skipped_low_quality": skipped_low_quality,
+                "api_calls": client.calls_made - calls_start,
+                "cache_purged": cache_purged,
             }
             complete_job(session, run, processed_count=processed, details=details)
 
@@ -644,11 +1116,11 @@ def verify_websites(
                 "websites_found": websites_found,
                 "no_website_confirmed": no_website_confirmed,
                 "no_match": no_match,
-                "api_calls": client.calls_made,
+                "api_calls": client.calls_made - calls_start,
             }
 
         except Exception as exc:
             fail_job(session, run, error=str(exc), details={
-                "api_calls": client.calls_made,
+                "api_calls": client.calls_made - calls_start,
             })
             raise
@@ -15,15 +15,23 @@ from __future__ import annotations
 import logging
 import random
 import re
+import threading
 import time
-from typing import Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Optional
 from urllib.parse import parse_qs, unquote, urlparse
 
 from tenacity import retry, wait_exponential, stop_after_attempt, retry_if_exception_type
 
 import requests as http_requests
-from bs4 import BeautifulSoup
-from sqlalchemy import not_, or_, select
+from requests.adapters import HTTPAdapter
+from lxml import html as lxml_html
+from lxml.etree import ParserError, XPath
+from sqlalchemy import or_, select
 
 from ..db import session_scope
 from ..jobs import complete_job, fail_job, start_job
@@ -49,6 +57,12 @@ _GOOGLE_DOMAINS = {
     "US": "www.google.com",
 }
 
+# Businesses verified concurrently. Each Google TLD still gets at most one
+# request in flight (see _paced_search), so extra workers mainly overlap
+# different countries' queries with each other and with DB writes.
+SEARCH_WORKERS = 4
+_TLD_SLOTS = {domain: threading.Lock() for domain in set(_GOOGLE_DOMAINS.values())}
+
 _USER_AGENTS = [
     (
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
@@ -64,6 +78,68 @@ _USER_AGENTS = [
     ),
 ]
 
+# Shared across queries so sockets to www.google.* stay warm between
+# requests. User-Agent rotation stays per-request in _search_google.
+_SESSION = http_requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+# Compiled once: a single C-side traversal per SERP instead of bs4's Python
+# object model. Class tests match whole tokens, like bs4's ``class_=``.
+_G_RESULTS = XPath("//div[contains(concat(' ', normalize-space(@class), ' '), ' g ')]")
+_HREF = XPath("(.//a[@href])[1]/@href")
+_TITLE = XPath("(.//h3)[1]//text()")
+_SNIPPET = XPath(
+    "(.//div[contains(concat(' ', normalize-space(@class), ' '), ' VwiC3b ')]"
+    " | .//span[contains(concat(' ', normalize-space(@class), ' '), ' aCOpRe ')])[1]//text()"
+)
+_ALL_LINKS = XPath("//a[@href]")
+
+# Google serves SERPs as UTF-8; decoding in libxml2 skips requests' charset sniff.
+_SERP_PARSER = lxml_html.HTMLParser(encoding="utf-8")
+
+# Links back into Google itself (nav, cache, related searches).
+_GOOGLE_HREF_RE = re.compile(r"google\.(?:com|ca|ae)")
+
+# CAPTCHA / block page markers, scanned on the raw bytes of the page head.
+_BLOCK_RE = re.compile(rb"captcha|unusual traffic", re.IGNORECASE)
+_BLOCK_SCAN_BYTES = 65536
+
+# Organic SERPs fit well under this; larger bodies are interstitials
+# (consent walls, challenge forms) and are truncated rather than read whole.
+_MAX_SERP_BYTES = 512 * 1024
+
+
+def _joined_text(fragments: list[str]) -> str:
+    """Mirror bs4's ``get_text(strip=True)``: strip each fragment and concatenate."""
+    return "".join(part.strip() for part in fragments)
+
+
+@lru_cache(maxsize=8)
+def _search_endpoint(country: str | None) -> tuple[str, Mapping[str, str]]:
+    """Search URL and read-only base headers (everything but User-Agent) for a country."""
+    google_domain = _GOOGLE_DOMAINS.get(country or "", "www.google.com")
+    headers = MappingProxyType({
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.9",
+        "Accept-Encoding": "gzip, deflate",
+        "DNT": "1",
+        "Connection": "keep-alive",
+        "Upgrade-Insecure-Requests": "1",
+    })
+    return f"https://{google_domain}/search", headers
+
+
+def _read_capped(resp: http_requests.Response, limit: int) -> bytes:
+    """Read a streamed response body, stopping once ``limit`` bytes are in."""
+    chunks = []
+    total = 0
+    for chunk in resp.iter_content(65536):
+        chunks.append(chunk)
+        total += len(chunk)
+        if total >= limit:
+            break
+    return b"".join(chunks)
+
 
 def return_empty_on_error(retry_state):
     return []
@@ -83,18 +159,8 @@ def _search_google(query: str, country: str | None = None, max_results: int = 10
 
     Returns empty list with 'blocked' status on CAPTCHA/403.
     """
-    google_domain = _GOOGLE_DOMAINS.get(country or "", "www.google.com")
-    user_agent = random.choice(_USER_AGENTS)
-
-    headers = {
-        "User-Agent": user_agent,
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.9",
-        "Accept-Encoding": "gzip, deflate",
-        "DNT": "1",
-        "Connection": "keep-alive",
-        "Upgrade-Insecure-Requests": "1",
-    }
+    search_url, base_headers = _search_endpoint(country)
+    headers = {**base_headers, "User-Agent": random.choice(_USER_AGENTS)}
 
     params = {
         "q": query,
@@ -102,60 +168,58 @@ def _search_google(query: str, country: str | None = None, max_results: int = 10
         "hl": "en",
     }
 
-    resp = http_requests.get(
-        f"https://{google_domain}/search",
+    resp = _SESSION.get(
+        search_url,
         params=params,
         headers=headers,
         timeout=(5, 15),  # (connect_timeout, read_timeout)
         allow_redirects=True,
+        stream=True,
     )
+    with resp:
+        # Google CAPTCHA or block detection
+        if resp.status_code == 429 or resp.status_code == 403:
+            logger.warning(
+                "Google blocked request (status %d) for '%s'",
+                resp.status_code, query,
+            )
+            return []
 
-    # Google CAPTCHA or block detection
-    if resp.status_code == 429 or resp.status_code == 403:
-        logger.warning(
-            "Google blocked request (status %d) for '%s'",
-            resp.status_code, query,
-        )
-        return []
+        if resp.status_code != 200:
+            logger.warning("Google returned status %d for '%s'", resp.status_code, query)
+            return []
 
-    if resp.status_code != 200:
-        logger.warning("Google returned status %d for '%s'", resp.status_code, query)
-        return []
+        body = _read_capped(resp, _MAX_SERP_BYTES)
 
-    # Check for CAPTCHA in response body
-    if "captcha" in resp.text.lower() or "unusual traffic" in resp.text.lower():
+    # Check for CAPTCHA in response body; the block banner sits near the top
+    if _BLOCK_RE.search(body, 0, _BLOCK_SCAN_BYTES):
         logger.warning("Google CAPTCHA detected for '%s'", query)
         return []
 
-    soup = BeautifulSoup(resp.text, "html.parser")
+    try:
+        tree = lxml_html.fromstring(body, parser=_SERP_PARSER)
+    except ParserError:
+        return []
     results = []
 
     # Google organic results are in divs with class 'g'
-    for div in soup.find_all("div", class_="g"):
+    for div in _G_RESULTS(tree):
         # Find the link
-        link = div.find("a", href=True)
-        if not link:
+        hrefs = _HREF(div)
+        if not hrefs:
             continue
 
-        href = link.get("href", "")
+        href = str(hrefs[0])
         # Skip Google's own links and non-http links
         if not href.startswith("http"):
             continue
-        if "google.com" in href or "google.ca" in href or "google.ae" in href:
+        if _GOOGLE_HREF_RE.search(href):
             continue
 
-        # Extract title
-        title_el = div.find("h3")
-        title = title_el.get_text(strip=True) if title_el else ""
-
-        # Extract snippet
-        snippet_el = div.find("div", class_="VwiC3b") or div.find("span", class_="aCOpRe")
-        body = snippet_el.get_text(strip=True) if snippet_el else ""
-
         results.append({
-            "title": title,
+            "title": _joined_text(_TITLE(div)),
             "href": href,
-            "body": body,
+            "body": _joined_text(_SNIPPET(div)),
         })
 
         if len(results) >= max_results:
@@ -163,11 +227,11 @@ def _search_google(query: str, country: str | None = None, max_results: int = 10
 
     # Fallback: try alternative selectors if no results found
     if not results:
-        for a_tag in soup.find_all("a", href=True):
+        for a_tag in _ALL_LINKS(tree):
             href = a_tag.get("href", "")
             if not href.startswith("http"):
                 continue
-            if "google.com" in href or "google.ca" in href or "google.ae" in href:
+            if _GOOGLE_HREF_RE.search(href):
                 continue
 
             domain = _get_domain_from_url(href)
@@ -176,7 +240,7 @@ def _search_google(query: str, country: str | None = None, max_results: int = 10
             if domain in {"accounts.google.com", "support.google.com", "policies.google.com"}:
                 continue
 
-            title = a_tag.get_text(strip=True)
+            title = _joined_text(a_tag.xpath(".//text()"))
             if not title or len(title) < 3:
                 continue
 
@@ -192,7 +256,8 @@ def _search_google(query: str, country: str | None = None, max_results: int = 10
     return results
 
 
-def _build_google_queries(biz_name: str, city_name: str | None, category: str | None, country: str | None) -> list[str]:
+@lru_cache(maxsize=2048)
+def _build_google_queries(biz_name: str, city_name: str | None, category: str | None, country: str | None) -> tuple[str, ...]:
         """Generate search queries for Google with different strategies.
 
         1. Full name + city (broad)
@@ -216,14 +281,45 @@ def _build_google_queries(biz_name: str, city_name: str | None, category: str |
         elif category:
             queries.append(f"{biz_name} {category}")
 
-        # Deduplicate while preserving order
-        seen = set()
-        unique = []
-        for q in queries:
-            if q not in seen:
-                seen.add(q)
-                unique.append(q)
-        return unique
+        # Deduplicate while preserving order. Tuple, not list: the cached
+        # result is shared between callers.
+        return tuple(dict.fromkeys(queries))
+
+
+def _paced_search(query: str, country: str | None) -> list[dict]:
+    """Run one Google search while holding its TLD's slot.
+
+    The slot is kept through the politeness delay afterwards (3-5s, longer
+    after an empty page that may be a block), so each Google TLD still sees
+    one query at a time no matter how many workers are running.
+    """
+    google_domain = _GOOGLE_DOMAINS.get(country or "", "www.google.com")
+    with _TLD_SLOTS[google_domain]:
+        results = _search_google(query, country=country, max_results=10)
+        delay = 3.0 if results else 4.0
+        time.sleep(delay + random.uniform(0, 2.0))
+    return results
+
+
+def _verify_one(
+    biz_name: str,
+    city_name: str | None,
+    category: str | None,
+    country: str | None,
+) -> tuple[list[dict], str]:
+    """Try each query for one business until Google returns results.
+
+    Runs on a worker thread; touches no ORM state. Returns (results, query_used).
+    """
+    search_queries = _build_google_queries(biz_name, city_name, category, country)
+    results: list[dict] = []
+    query_used = search_queries[0]
+    for q in search_queries:
+        results = _paced_search(q, country)
+        query_used = q
+        if results:
+            break
+    return results, query_used
 
 
 def run_batch(
@@ -237,10 +333,12 @@ def run_batch(
     1. Search Google for the business name
     2. Analyze results — filter out directories/social media
     3. If a real business website is found, set business.website_url
-    4. Track result in business.raw["google_search_verified"]
+    4. Track result in business.raw["google_search_verified"] and
+       business.google_search_verified_at
 
     This is an ADDITIONAL verification stage on top of DDG.
-    FREE, no API key, but rate limited to ~15 businesses/min.
+    FREE, no API key; searches run on SEARCH_WORKERS threads but each
+    Google TLD is paced to one query every 3-5 seconds.
 
     Args:
         limit: Max businesses to verify. None = 50 default, 0 = unlimited.
@@ -268,12 +366,7 @@ def run_batch(
                 .where(Business.name != "")
                 .where(or_(Business.website_url.is_(None), Business.website_url == ""))
                 .where(Business.lead_score >= min_score)
-                .where(
-                    or_(
-                        Business.raw.is_(None),
-                        not_(Business.raw.has_key("google_search_verified")),
-                    )
-                )
+                .where(Business.google_search_verified_at.is_(None))
                 .order_by(Business.lead_score.desc(), Business.created_at)
             )
 
@@ -308,97 +401,103 @@ def run_batch(
             errors = 0
             consecutive_blocks = 0
 
-            for business, city in rows:
-                # Stop if Google is consistently blocking us
-                if consecutive_blocks >= 3:
-                    logger.warning(
-                        "Google blocking detected (%d consecutive), stopping batch early",
-                        consecutive_blocks,
-                    )
-                    break
-
-                city_name = city.name if city else None
-                country = city.country if city else None
-                biz_name = (business.name or "").strip()
-                if not biz_name:
-                    processed += 1
-                    continue
-
-                category = (business.category or "").strip() or None
-
-                # Build multiple search queries
-                search_queries = _build_google_queries(biz_name, city_name, category, country)
+            # Searches run on worker threads (paced per Google TLD); rows
+            # are applied here in order so the session stays on this thread.
+            row_iter = iter(rows)
+            pending: deque = deque()
+            with ThreadPoolExecutor(max_workers=SEARCH_WORKERS) as executor:
+                while True:
+                    # Keep a bounded window of businesses in flight
+                    while len(pending) < SEARCH_WORKERS * 2:
+                        row = next(row_iter, None)
+                        if row is None:
+                            break
+                        business, city = row
+                        biz_name = (business.name or "").strip()
+                        future = None
+                        if biz_name:
+                            future = executor.submit(
+                                _verify_one,
+                                biz_name,
+                                city.name if city else None,
+                                (business.category or "").strip() or None,
+                                city.country if city else None,
+                            )
+                        pending.append((business, biz_name, future))
+
+                    if not pending:
+                        break
 
-                # Try each query until we get results
-                results = []
-                query_used = search_queries[0]
-                was_blocked = False
+                    business, biz_name, future = pending.popleft()
+                    if future is None:
+                        processed += 1
+                        continue
+
+                    results, query_used = future.result()
+
+                    if business.raw is None:
+                        business.raw = {}
+                    raw = business.raw
+                    business.google_search_verified_at = datetime.now(timezone.utc)
+
+                    if not results:
+                        # Could be blocked or genuine no results — mark as inconclusive
+                        raw["google_search_verified"] = True
+                        raw["google_search_result"] = "no_results"
+                        raw["google_search_query"] = query_used
+                        business.scored_at = None
+                        inconclusive += 1
+                        blocked += 1
+                        consecutive_blocks += 1
+                        processed += 1
+
+                        # Stop if Google is consistently blocking us
+                        if consecutive_blocks >= 3:
+                            logger.warning(
+                                "Google blocking detected (%d consecutive), stopping batch early",
+                                consecutive_blocks,
+                            )
+                            for _, _, queued in pending:
+                                if queued is not None:
+                                    queued.cancel()
+                            break
+                        continue
+
+                    consecutive_blocks = 0
+
+                    # Analyze results
+                    website = _extract_business_website(results, biz_name)
+
+                    if website:
+                        # Found a real website — disqualify this lead
+                        business.website_url = website
+                        raw["google_search_verified"] = True
+                        raw["google_search_result"] = "has_website"
+                        raw["google_search_website"] = website
+                        raw["google_search_query"] = query_used
+                        raw["google_search_result_count"] = len(results)
+                        websites_found += 1
+                        logger.debug(
+                            "Google found website for '%s': %s", biz_name, website,
+                        )
+                    else:
+                        # No business website in results — genuine lead candidate
+                        raw["google_search_verified"] = True
+                        raw["google_search_result"] = "no_website"
+                        raw["google_search_query"] = query_used
+                        raw["google_search_result_count"] = len(results)
+                        no_website_confirmed += 1
 
-                for q in search_queries:
-                    results = _search_google(q, country=country, max_results=10)
-                    query_used = q
-                    if results:
-                        consecutive_blocks = 0
-                        break
-                    # Check if this was a block vs genuine no results
-                    # (empty results from _search_google could be a block)
-                    time.sleep(2.0 + random.uniform(0, 1.5))
-
-                raw = dict(business.raw) if business.raw else {}
-
-                if not results:
-                    # Could be blocked or genuine no results — mark as inconclusive
-                    raw["google_search_verified"] = True
-                    raw["google_search_result"] = "no_results"
-                    raw["google_search_query"] = query_used
-                    business.raw = raw
                     business.scored_at = None
-                    inconclusive += 1
-                    blocked += 1
-                    consecutive_blocks += 1
                     processed += 1
-                    # Longer wait if potentially blocked
-                    time.sleep(4.0 + random.uniform(0, 2.0))
-                    continue
-
-                # Analyze results
-                website = _extract_business_website(results, biz_name)
-
-                if website:
-                    # Found a real website — disqualify this lead
-                    business.website_url = website
-                    raw["google_search_verified"] = True
-                    raw["google_search_result"] = "has_website"
-                    raw["google_search_website"] = website
-                    raw["google_search_query"] = query_used
-                    raw["google_search_result_count"] = len(results)
-                    business.raw = raw
-                    websites_found += 1
-                    logger.debug(
-                        "Google found website for '%s': %s", biz_name, website,
-                    )
-                else:
-                    # No business website in results — genuine lead candidate
-                    raw["google_search_verified"] = True
-                    raw["google_search_result"] = "no_website"
-                    raw["google_search_query"] = query_used
-                    raw["google_search_result_count"] = len(results)
-                    business.raw = raw
-                    no_website_confirmed += 1
-
-                business.scored_at = None
-                processed += 1
-
-                if processed % 25 == 0:
-                    session.flush()
-                    logger.info(
-                        "Google verification progress: %d/%d processed, "
-                        "%d have websites, %d confirmed no website",
-                        processed, len(rows), websites_found, no_website_confirmed,
-                    )
-
-                # Conservative rate limiting for Google (3-5 seconds between requests)
-                time.sleep(3.0 + random.uniform(0, 2.0))
+
+                    if processed % 25 == 0:
+                        session.flush()
+                        logger.info(
+                            "Google verification progress: %d/%d processed, "
+                            "%d have websites, %d confirmed no website",
+                            processed, len(rows), websites_found, no_website_confirmed,
+                        )
 
             details = {
                 "min_score": min_score,
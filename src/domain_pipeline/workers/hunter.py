@@ -8,11 +8,18 @@ Get API key at: https://hunter.io/users/sign_up
 from __future__ import annotations
 
 import logging
+import threading
 import time
+import uuid
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import partial
 from typing import Any, Optional
 
 import requests
-from sqlalchemy import exists, not_, or_, select
+from requests.adapters import HTTPAdapter
+from sqlalchemy import case, exists, select
 
 from ..config import load_config
 from ..db import session_scope
@@ -26,14 +33,39 @@ JOB_NAME = "hunter_email_enrichment"
 
 DOMAIN_SEARCH_URL = "https://api.hunter.io/v2/domain-search"
 
+# Concurrent domain searches. Each worker waits CALL_DELAY_SECONDS after
+# every call, keeping the total well under Hunter's per-second rate limit;
+# after the first 429 the client drops to one call at a time.
+SEARCH_WORKERS = 5
+CALL_DELAY_SECONDS = 0.5
+# Serial retries of a rate-limited search, waiting RATE_LIMIT_BACKOFF_SECONDS
+# times the attempt number between them.
+RATE_LIMIT_RETRIES = 3
+RATE_LIMIT_BACKOFF_SECONDS = 2.0
+
+# Returned by HunterClient._domain_search for a 429 response.
+_RATE_LIMITED = object()
+
+
+class HunterRateLimited(RuntimeError):
+    """Hunter kept answering 429 after the serial retries."""
+
 
 class HunterClient:
-    """Hunter.io API client."""
+    """Hunter.io API client. ``domain_search`` is safe to call from several threads."""
 
     def __init__(self, api_key: str) -> None:
         self.api_key = api_key
         self.session = requests.Session()
+        # Single API host; keep a few warm connections for back-to-back
+        # domain searches instead of reconnecting per call.
+        self.session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=SEARCH_WORKERS))
         self._calls_made = 0
+        self._calls_lock = threading.Lock()
+        # Set on the first 429; from then on calls are serialized (each
+        # holding _serial_lock through its CALL_DELAY_SECONDS pause).
+        self._rate_limited = False
+        self._serial_lock = threading.Lock()
 
     @property
     def calls_made(self) -> int:
@@ -42,19 +74,42 @@ class HunterClient:
     def domain_search(self, domain: str) -> Optional[dict[str, Any]]:
         """Search for emails associated with a domain.
 
-        Returns the API response data or None on failure.
+        Returns the API response data or None on failure. A rate-limited
+        search is retried serially with backoff; raises HunterRateLimited
+        if Hunter still answers 429, so the caller can leave the business
+        queued instead of recording an empty result.
         """
+        if not self._rate_limited:
+            result = self._domain_search(domain)
+            if result is not _RATE_LIMITED:
+                return result
+        with self._serial_lock:
+            result = self._domain_search(domain)
+            for attempt in range(1, RATE_LIMIT_RETRIES + 1):
+                if result is not _RATE_LIMITED:
+                    break
+                time.sleep(RATE_LIMIT_BACKOFF_SECONDS * attempt)
+                result = self._domain_search(domain)
+            time.sleep(CALL_DELAY_SECONDS)
+        if result is _RATE_LIMITED:
+            raise HunterRateLimited(f"Hunter.io rate limited searching {domain}")
+        return result
+
+    def _domain_search(self, domain: str) -> Any:
         try:
             resp = self.session.get(
                 DOMAIN_SEARCH_URL,
                 params={"domain": domain, "api_key": self.api_key},
                 timeout=10,
             )
-            self._calls_made += 1
+            with self._calls_lock:
+                self._calls_made += 1
 
             if resp.status_code == 429:
-                logger.warning("Hunter.io rate limited")
-                return None
+                if not self._rate_limited:
+                    logger.warning("Hunter.io rate limited; falling back to serial calls")
+                self._rate_limited = True
+                return _RATE_LIMITED
 
             if resp.status_code == 402:
                 logger.warning("Hunter.io quota exhausted")
@@ -75,6 +130,33 @@ class HunterClient:
             return None
 
 
+def _search_business_domains(
+    client: HunterClient,
+    domain_names: list[str],
+) -> tuple[Optional[dict[str, Any]], Optional[str], bool]:
+    """Search a business's non-public domains until Hunter returns data.
+
+    Runs on a worker thread. Returns (hunter_result, searched_domain,
+    rate_limited); rate_limited means a search was cut short by 429s, so
+    the business has not really been checked.
+    """
+    hunter_result = None
+    searched_domain = None
+    for domain_name in domain_names:
+        if not domain_name or is_public_email_domain(domain_name.lower()):
+            continue
+        searched_domain = domain_name.lower()
+        try:
+            hunter_result = client.domain_search(searched_domain)
+        except HunterRateLimited as exc:
+            logger.warning("%s; leaving business queued", exc)
+            return None, searched_domain, True
+        time.sleep(CALL_DELAY_SECONDS)
+        if hunter_result:
+            break
+    return hunter_result, searched_domain, False
+
+
 def run_batch(
     limit: Optional[int] = None,
     scope: Optional[str] = None,
@@ -116,21 +198,21 @@ def run_batch(
         try:
             # Find leads with domains but not yet Hunter-enriched
             # Prioritize those with phone but no email (need email for outreach)
-            has_email = exists(
-                select(BusinessContact.id)
-                .where(BusinessContact.business_id == Business.id)
+            # Email-holding businesses are collected once (index-only scan on
+            # the partial email index) and outer-joined, rather than running a
+            # correlated EXISTS per candidate inside the ORDER BY.
+            email_biz = (
+                select(BusinessContact.business_id)
                 .where(BusinessContact.contact_type == "email")
+                .distinct()
+                .cte("email_biz")
             )
 
             stmt = (
                 select(Business)
+                .outerjoin(email_biz, email_biz.c.business_id == Business.id)
                 .where(Business.lead_score >= 30)
-                .where(
-                    or_(
-                        Business.raw.is_(None),
-                        not_(Business.raw.has_key("hunter_enriched")),
-                    )
-                )
+                .where(Business.hunter_enriched_at.is_(None))
                 # Must have at least one non-public domain
                 .where(
                     exists(
@@ -140,7 +222,7 @@ def run_batch(
                     )
                 )
                 .order_by(
-                    has_email.asc(),  # No-email businesses first
+                    case((email_biz.c.business_id.is_(None), 0), else_=1),  # No-email businesses first
                     Business.lead_score.desc(),
                 )
             )
@@ -156,84 +238,94 @@ def run_batch(
                 })
                 return {"processed": 0, "emails_found": 0, "contacts_created": 0, "api_calls": 0}
 
+            # Load every candidate's domains in one round-trip
+            domains_by_biz: dict[uuid.UUID, list[str]] = defaultdict(list)
+            for business_id, domain_name in session.execute(
+                select(BusinessDomainLink.business_id, Domain.domain)
+                .join(Domain, Domain.id == BusinessDomainLink.domain_id)
+                .where(BusinessDomainLink.business_id.in_([b.id for b in businesses]))
+            ):
+                domains_by_biz[business_id].append(domain_name)
+
+            # Existing email contacts for the batch, for duplicate checks
+            emails_by_biz: dict[uuid.UUID, set[str]] = defaultdict(set)
+            for business_id, value in session.execute(
+                select(BusinessContact.business_id, BusinessContact.value)
+                .where(BusinessContact.business_id.in_([b.id for b in businesses]))
+                .where(BusinessContact.contact_type == "email")
+            ):
+                emails_by_biz[business_id].add(value)
+
             processed = 0
             emails_found = 0
             contacts_created = 0
+            rate_limited = 0
+
+            # API calls run on worker threads; results come back in business
+            # order and all session work stays on this thread.
+            with ThreadPoolExecutor(max_workers=SEARCH_WORKERS) as executor:
+                searches = executor.map(
+                    partial(_search_business_domains, client),
+                    [domains_by_biz.get(business.id, []) for business in businesses],
+                )
 
-            for business in businesses:
-                # Get domains for this business
-                domain_rows = session.execute(
-                    select(Domain.domain)
-                    .join(BusinessDomainLink, BusinessDomainLink.domain_id == Domain.id)
-                    .where(BusinessDomainLink.business_id == business.id)
-                ).scalars().all()
-
-                hunter_result = None
-                searched_domain = None
-
-                for domain_name in domain_rows:
-                    if not domain_name or is_public_email_domain(domain_name.lower()):
+                for business, (hunter_result, searched_domain, was_rate_limited) in zip(businesses, searches):
+                    if was_rate_limited:
+                        # Not stamped, so the next run retries it
+                        rate_limited += 1
                         continue
-                    searched_domain = domain_name.lower()
-                    hunter_result = client.domain_search(searched_domain)
-                    if hunter_result:
-                        break
-                    time.sleep(0.5)
-
-                raw = dict(business.raw) if business.raw else {}
-                raw["hunter_enriched"] = True
-
-                if hunter_result and hunter_result.get("emails"):
-                    found_emails = hunter_result["emails"]
-                    raw["hunter_domain"] = searched_domain
-                    raw["hunter_emails_count"] = len(found_emails)
-                    raw["hunter_organization"] = hunter_result.get("organization")
-                    business.raw = raw
-
-                    for email_data in found_emails:
-                        email = (email_data.get("value") or "").strip().lower()
-                        if not email:
-                            continue
-                        emails_found += 1
-
-                        # Only add high-confidence emails
-                        confidence = email_data.get("confidence", 0)
-                        if confidence < 50:
-                            continue
-
-                        existing = session.execute(
-                            select(BusinessContact.id)
-                            .where(BusinessContact.business_id == business.id)
-                            .where(BusinessContact.contact_type == "email")
-                            .where(BusinessContact.value == email)
-                        ).scalar()
-
-                        if not existing:
-                            session.add(BusinessContact(
-                                business_id=business.id,
-                                contact_type="email",
-                                value=email,
-                                source="hunter",
-                            ))
-                            contacts_created += 1
-                else:
-                    raw["hunter_domain"] = searched_domain
-                    raw["hunter_emails_count"] = 0
-                    business.raw = raw
-
-                business.scored_at = None
-                processed += 1
-                if processed % 10 == 0:
-                    session.flush()
-                    logger.info(
-                        "Hunter enrichment: %d/%d, %d emails found, %d contacts created",
-                        processed, len(businesses), emails_found, contacts_created,
-                    )
-                time.sleep(0.5)
+
+                    if business.raw is None:
+                        business.raw = {}
+                    raw = business.raw
+                    raw["hunter_enriched"] = True
+                    business.hunter_enriched_at = datetime.now(timezone.utc)
+
+                    if hunter_result and hunter_result.get("emails"):
+                        found_emails = hunter_result["emails"]
+                        raw["hunter_domain"] = searched_domain
+                        raw["hunter_emails_count"] = len(found_emails)
+                        raw["hunter_organization"] = hunter_result.get("organization")
+
+                        existing_emails = emails_by_biz[business.id]
+                        for email_data in found_emails:
+                            email = (email_data.get("value") or "").strip().lower()
+                            if not email:
+                                continue
+                            emails_found += 1
+
+                            # Only add high-confidence emails
+                            confidence = email_data.get("confidence", 0)
+                            if confidence < 50:
+                                continue
+
+                            # Also guards against duplicates within one Hunter response
+                            if email not in existing_emails:
+                                existing_emails.add(email)
+                                session.add(BusinessContact(
+                                    business_id=business.id,
+                                    contact_type="email",
+                                    value=email,
+                                    source="hunter",
+                                ))
+                                contacts_created += 1
+                    else:
+                        raw["hunter_domain"] = searched_domain
+                        raw["hunter_emails_count"] = 0
+
+                    business.scored_at = None
+                    processed += 1
+                    if processed % 10 == 0:
+                        session.flush()
+                        logger.info(
+                            "Hunter enrichment: %d/%d, %d emails found, %d contacts created",
+                            processed, len(businesses), emails_found, contacts_created,
+                        )
 
             details = {
                 "emails_found": emails_found,
                 "contacts_created": contacts_created,
+                "rate_limited": rate_limited,
                 "api_calls": client.calls_made,
             }
             complete_job(session, run, processed_count=processed, details=details)
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import re
 from datetime import datetime, timezone
 from typing import Optional
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 
 from ..config import load_config
 from ..db import session_scope
@@ -17,13 +18,27 @@ from ..models import (
     Organization,
 )
 
-ROLE_PREFIXES = {"info", "admin", "sales", "support", "contact"}
-HIGH_PRIORITY_CATEGORIES = {"trades", "contractors"}
-MEDIUM_PRIORITY_CATEGORIES = {"professional_services", "retail", "health", "food", "auto"}
+ROLE_PREFIXES = frozenset({"info", "admin", "sales", "support", "contact"})
+HIGH_PRIORITY_CATEGORIES = frozenset({"trades", "contractors"})
+MEDIUM_PRIORITY_CATEGORIES = frozenset({"professional_services", "retail", "health", "food", "auto"})
+
+_DISQUALIFIED_STATUSES = frozenset({"hosted", "parked"})
+_STATUS_SCORES = {
+    "verified_unhosted": 20,
+    "checked": 15,
+    "mx_missing": 15,
+    "no_mx": 15,
+    "enriched": 20,
+    "unregistered_candidate": 10,
+}
+_EMAIL_PREFIX_RE = re.compile(r"([^@]+)@")
+
+# Contacts scored (and written back) per round-trip.
+SCORE_CHUNK_SIZE = 1000
 
 
 def _score_contact(contact: Contact, domain: Domain, features: dict) -> tuple[float, dict]:
-    if domain.status in {"hosted", "parked"}:
+    if domain.status in _DISQUALIFIED_STATUSES:
         return 0.0, {
             "domain_status": domain.status,
             "disqualified": True,
@@ -43,20 +58,15 @@ def _score_contact(contact: Contact, domain: Domain, features: dict) -> tuple[fl
     if contact.source == "role":
         score += 10
 
-    if contact.email and "@" in contact.email:
-        prefix = contact.email.split("@", 1)[0].lower()
-        if prefix in ROLE_PREFIXES:
-            score += 10
-            reasons["role_prefix"] = prefix
+    if contact.email:
+        match = _EMAIL_PREFIX_RE.match(contact.email)
+        if match:
+            prefix = match.group(1).lower()
+            if prefix in ROLE_PREFIXES:
+                score += 10
+                reasons["role_prefix"] = prefix
 
-    if domain.status == "verified_unhosted":
-        score += 20
-    elif domain.status in {"checked", "mx_missing", "no_mx"}:
-        score += 15
-    elif domain.status == "enriched":
-        score += 20
-    elif domain.status == "unregistered_candidate":
-        score += 10
+    score += _STATUS_SCORES.get(domain.status, 0)
 
     if features.get("has_no_website_business"):
         score += 25
@@ -64,10 +74,10 @@ def _score_contact(contact: Contact, domain: Domain, features: dict) -> tuple[fl
     if features.get("has_phone"):
         score += 20
 
-    categories = set(features.get("categories", []))
-    if categories & HIGH_PRIORITY_CATEGORIES:
+    categories = features.get("categories") or ()
+    if not HIGH_PRIORITY_CATEGORIES.isdisjoint(categories):
         score += 25
-    elif categories & MEDIUM_PRIORITY_CATEGORIES:
+    elif not MEDIUM_PRIORITY_CATEGORIES.isdisjoint(categories):
         score += 10
     elif categories:
         score += 5
@@ -75,6 +85,56 @@ def _score_contact(contact: Contact, domain: Domain, features: dict) -> tuple[fl
     return min(score, 100.0), reasons
 
 
+def _load_domain_features(session, domain_ids: list) -> dict:
+    """Business-derived scoring features (categories, has-no-website, has-phone) per domain."""
+    link_rows = session.execute(
+        select(BusinessDomainLink.domain_id, Business.id, Business.category, Business.website_url)
+        .join(Business, Business.id == BusinessDomainLink.business_id)
+        .where(BusinessDomainLink.domain_id.in_(domain_ids))
+    ).all()
+
+    features_by_domain: dict = {
+        domain_id: {
+            "categories": set(),
+            "has_no_website_business": False,
+            "has_phone": False,
+            "business_ids": set(),
+        }
+        for domain_id in domain_ids
+    }
+
+    for domain_id, business_id, category, website_url in link_rows:
+        feature = features_by_domain[domain_id]
+        feature["business_ids"].add(business_id)
+        if category:
+            feature["categories"].add(category)
+        if not website_url:
+            feature["has_no_website_business"] = True
+
+    all_business_ids = sorted(
+        {
+            business_id
+            for feature in features_by_domain.values()
+            for business_id in feature["business_ids"]
+        }
+    )
+
+    phone_business_ids: set = set()
+    if all_business_ids:
+        phone_rows = session.execute(
+            select(BusinessContact.business_id)
+            .where(BusinessContact.business_id.in_(all_business_ids))
+            .where(BusinessContact.contact_type == "phone")
+        ).all()
+        phone_business_ids = {business_id for business_id, in phone_rows}
+
+    for feature in features_by_domain.values():
+        feature["has_phone"] = not feature["business_ids"].isdisjoint(phone_business_ids)
+        feature.pop("business_ids", None)
+
+    return features_by_domain
+
+
 def run_batch(limit: Optional[int] = None, force_rescore: bool = False) -> int:
     config = load_config()
     # When limit is None, use config batch size; when limit <= 0, process all items
@@ -99,74 +159,26 @@ def run_batch(limit: Optional[int] = None, force_rescore: bool = False) -> int:
             if not force_rescore:
                 stmt = stmt.where(Contact.scored_at.is_(None))
 
-            rows = session.execute(stmt).all()
-            if not rows:
-                complete_job(session, run, processed_count=0)
-                return 0
-
-            domain_ids = sorted({domain.id for _, _, domain in rows})
-            link_rows = session.execute(
-                select(BusinessDomainLink.domain_id, Business.id, Business.category, Business.website_url)
-                .join(Business, Business.id == BusinessDomainLink.business_id)
-                .where(BusinessDomainLink.domain_id.in_(domain_ids))
-            ).all()
-
-            features_by_domain: dict = {
-                domain_id: {
-                    "categories": set(),
-                    "has_no_website_business": False,
-                    "has_phone": False,
-                    "business_ids": set(),
-                }
-                for domain_id in domain_ids
-            }
-
-            for domain_id, business_id, category, website_url in link_rows:
-                feature = features_by_domain[domain_id]
-                feature["business_ids"].add(business_id)
-                if category:
-                    feature["categories"].add(category)
-                if not website_url:
-                    feature["has_no_website_business"] = True
-
-            all_business_ids = sorted(
-                {
-                    business_id
-                    for feature in features_by_domain.values()
-                    for business_id in feature["business_ids"]
-                }
-            )
-
-            phone_business_ids: set = set()
-            if all_business_ids:
-                phone_rows = session.execute(
-                    select(BusinessContact.business_id)
-                    .where(BusinessContact.business_id.in_(all_business_ids))
-                    .where(BusinessContact.contact_type == "phone")
-                ).all()
-                phone_business_ids = {business_id for business_id, in phone_rows}
-
-            for feature in features_by_domain.values():
-                feature["has_phone"] = any(
-                    business_id in phone_business_ids for business_id in feature["business_ids"]
-                )
-                feature.pop("business_ids", None)
-
+            # Stream the candidates and score them a chunk at a time: one
+            # feature lookup and one executemany UPDATE per chunk.
+            result = session.execute(stmt.execution_options(yield_per=SCORE_CHUNK_SIZE))
             processed = 0
-            for contact, _, domain in rows:
-                features = features_by_domain.get(
-                    domain.id,
-                    {
-                        "categories": set(),
-                        "has_no_website_business": False,
-                        "has_phone": False,
-                    },
+            for rows in result.partitions():
+                features_by_domain = _load_domain_features(
+                    session, sorted({domain.id for _, _, domain in rows})
                 )
-                score, reasons = _score_contact(contact, domain, features)
-                contact.lead_score = score
-                contact.score_reasons = reasons
-                contact.scored_at = datetime.now(timezone.utc)
-                processed += 1
+                scored_at = datetime.now(timezone.utc)
+                updates = []
+                for contact, _, domain in rows:
+                    score, reasons = _score_contact(contact, domain, features_by_domain[domain.id])
+                    updates.append({
+                        "id": contact.id,
+                        "lead_score": score,
+                        "score_reasons": reasons,
+                        "scored_at": scored_at,
+                    })
+                session.execute(update(Contact), updates)
+                processed += len(updates)
 
             complete_job(session, run, processed_count=processed, details={"force_rescore": force_rescore})
             return processed
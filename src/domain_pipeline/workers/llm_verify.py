@@ -10,19 +10,29 @@ to ~90% conclusive (analyzing real search data).
 """
 from __future__ import annotations
 
-import json
+import hashlib
 import logging
+import re
+import threading
 import time
-from typing import Optional
+from collections import deque
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Callable, Optional
 
 from tenacity import retry, wait_exponential, stop_after_attempt, retry_if_result
 
+import orjson
+import redis
 import requests
-from sqlalchemy import not_, or_, select
+from requests.adapters import HTTPAdapter
+from sqlalchemy import and_, not_, or_, select, tuple_, update
 
 from ..db import session_scope
 from ..jobs import complete_job, fail_job, start_job
 from ..models import Business, City
+from .web_search_verify import _get_domain_from_url
 
 logger = logging.getLogger(__name__)
 
@@ -30,32 +40,265 @@ JOB_NAME = "llm_verify_websites"
 
 # SearXNG URL for fetching search context
 SEARXNG_URL = "http://localhost:8888/search"
+# SearXNG answers only once every queried engine has returned, so a short
+# list of fast engines bounds the wait; the top results are all we keep.
+SEARXNG_ENGINES = "google,bing,duckduckgo"
+SEARXNG_MAX_RESULTS = 15
+
+# Businesses analysed concurrently; the provider's requests-per-minute cap
+# below is what actually bounds throughput.
+LLM_WORKERS = 8
+# SearXNG lookups run on their own pool, up to SEARCH_PREFETCH businesses
+# ahead of the LLM window, so a slow search never stalls a paced LLM slot.
+SEARCH_WORKERS = 16
+SEARCH_PREFETCH = 64
+# Rows claimed (FOR UPDATE SKIP LOCKED) and committed per chunk, so an
+# unlimited run never holds locks on the whole queue for its duration.
+LLM_VERIFY_CLAIM_SIZE = 100
+_PROVIDER_RPM = {"gemini": 30, "groq": 300}
+DEFAULT_RPM = 120
+
+# Shared by all workers so SearXNG and the LLM provider hosts keep warm
+# keep-alive connections instead of a TCP/TLS handshake per call.
+_SESSION = requests.Session()
+_SESSION.headers["Connection"] = "keep-alive"
+_adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=0)
+_SESSION.mount("https://", _adapter)
+_SESSION.mount("http://", _adapter)
+
+# Response cache lifetimes (Redis, when REDIS_URL is configured).
+SEARCH_CACHE_TTL_SECONDS = 86400
+LLM_CACHE_TTL_SECONDS = 7 * 86400
 
 # Domains that are directories, NOT business websites
-DIRECTORY_INDICATORS = {
+DIRECTORY_INDICATORS = frozenset({
     "yelp.com", "yelp.ca", "facebook.com", "instagram.com", "linkedin.com",
     "twitter.com", "x.com", "yellowpages.com", "yellowpages.ca", "tripadvisor.com",
     "google.com", "maps.google.com", "mapquest.com", "foursquare.com",
     "youtube.com", "tiktok.com", "pinterest.com", "wikipedia.org",
     "booking.com", "zomato.com", "ubereats.com", "doordash.com",
     "bayut.com", "dubizzle.com", "canada411.ca",
-}
+})
+
+# Prompt budget: own-site candidates carry the signal; a few directory
+# listings are kept only as evidence that the business exists.
+MAX_CANDIDATE_RESULTS = 8
+MAX_DIRECTORY_RESULTS = 3
+
+# Constant across calls, and sent ahead of the per-business prompt so
+# providers with automatic prefix caching can reuse it.
+_SYSTEM_PROMPT = (
+    "You are an expert web researcher analyzing search engine results to determine "
+    "if a specific business has its own official website.\n\n"
+    "RULES:\n"
+    "- A real website is a domain the business owns (e.g. joespizza.com, villagecobbler.ca)\n"
+    "- Directory listings (Yelp, Facebook, YellowPages, Google Maps, TripAdvisor, etc.) are NOT real websites\n"
+    "- Social media pages (instagram.com/business, facebook.com/business) are NOT real websites\n"
+    "- If a search result URL contains the business name and is NOT a directory, it's likely their website\n"
+    "- Chain/franchise businesses (McDonald's, Subway, etc.) should be marked 'has_website'\n\n"
+    "Search results are tab-separated rows of: url (without scheme or www.), title, snippet.\n\n"
+    "Return ONLY a JSON object with:\n"
+    "- status: 'has_website' if search results show they have an official site, "
+    "'no_website' if results clearly show no official site exists, "
+    "or 'not_sure' if evidence is insufficient\n"
+    "- website_url: the official website URL if found, otherwise null\n"
+    "- reason: brief explanation (1 sentence)"
+)
+
+
+_DURATION_PART_RE = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def _parse_reset_seconds(value: Optional[str]) -> Optional[float]:
+    """Seconds until a rate-limit window resets, from a header value.
+
+    Accepts delta-seconds ("12.5"), epoch seconds or milliseconds
+    (OpenRouter), and Go-style durations ("1m2.5s", "120ms"; Groq).
+    """
+    if not value:
+        return None
+    try:
+        number = float(value)
+    except ValueError:
+        parts = _DURATION_PART_RE.findall(value)
+        if not parts:
+            return None
+        return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in parts)
+    if number > 1e12:
+        return max(number / 1000.0 - time.time(), 0.0)
+    if number > 1e9:
+        return max(number - time.time(), 0.0)
+    return number
+
+
+class _ProviderPacer:
+    """Spaces LLM calls across worker threads for one provider.
+
+    Never faster than ``rpm``; slowed further when the provider's rate-limit
+    headers say the remaining quota must stretch over the rest of the window,
+    and held back for ``Retry-After`` after a 429.
+    """
+
+    def __init__(self, rpm: float) -> None:
+        self._base_interval = 60.0 / rpm if rpm > 0 else 0.0
+        self._min_interval = self._base_interval
+        self._next_allowed = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_allowed)
+            self._next_allowed = slot + self._min_interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+    def observe(self, resp: requests.Response) -> None:
+        headers = resp.headers
+        if resp.status_code == 429:
+            retry_after = _parse_reset_seconds(headers.get("Retry-After"))
+            if retry_after:
+                with self._lock:
+                    self._next_allowed = max(self._next_allowed, time.monotonic() + retry_after)
+            return
+
+        remaining = headers.get("X-RateLimit-Remaining-Requests") or headers.get("X-RateLimit-Remaining")
+        reset = _parse_reset_seconds(
+            headers.get("X-RateLimit-Reset-Requests") or headers.get("X-RateLimit-Reset")
+        )
+        if remaining is None or reset is None:
+            return
+        try:
+            remaining_calls = float(remaining)
+        except ValueError:
+            return
+        with self._lock:
+            self._min_interval = max(self._base_interval, reset / max(remaining_calls, 1.0))
+
+
+class _ResponseCache:
+    """Redis cache for SearXNG results and LLM verdicts, shared across runs.
+
+    A no-op without a Redis client. Thread-safe; Redis errors count as
+    misses so a cache outage never fails a batch.
+    """
+
+    def __init__(self, redis_client: Optional[redis.Redis]) -> None:
+        self._redis = redis_client
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Any:
+        value = None
+        if self._redis is not None:
+            try:
+                cached = self._redis.get(key)
+            except redis.RedisError as exc:
+                logger.warning("Response cache read failed: %s", exc)
+                cached = None
+            if cached is not None:
+                value = orjson.loads(cached)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any, ttl_seconds: int) -> None:
+        if self._redis is None:
+            return
+        try:
+            self._redis.set(key, orjson.dumps(value), ex=ttl_seconds)
+        except redis.RedisError as exc:
+            logger.warning("Response cache write failed: %s", exc)
+
+
+class _SingleFlight:
+    """Collapses concurrent calls with the same key into one execution.
+
+    The first caller runs ``fn``; callers arriving while it is in flight
+    block on its Future and get the same result (or exception).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._inflight: dict[str, Future] = {}
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+        if not owner:
+            return future.result()
+        try:
+            future.set_result(fn())
+        except BaseException as exc:
+            future.set_exception(exc)
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+        return future.result()
 
 
-def _fetch_search_context(business_name: str, city_name: str | None) -> list[dict]:
+# Shared by every batch in the process; keys carry a searxng:/llm: prefix.
+_INFLIGHT = _SingleFlight()
+
+
+def _cache_key(prefix: str, payload: Any) -> str:
+    digest = hashlib.sha256(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)).hexdigest()
+    return f"{prefix}:{digest}"
+
+
+def _fetch_search_context(
+    business_name: str,
+    city_name: str | None,
+    cache: Optional[_ResponseCache] = None,
+) -> list[dict]:
     """Fetch search results from SearXNG for LLM analysis."""
+    key = _cache_key("searxng", [business_name, city_name])
+
+    def fetch() -> list[dict]:
+        if cache is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+
+        results = _fetch_searxng(business_name, city_name)
+        # Empty lists are also what a failed request returns; don't pin those.
+        if cache is not None and results:
+            cache.set(key, results, SEARCH_CACHE_TTL_SECONDS)
+        return results
+
+    # Identically named businesses in one city run the same query; let
+    # concurrent callers share one round-trip. Copies keep them independent.
+    return list(_INFLIGHT.do(key, fetch))
+
+
+def _fetch_searxng(business_name: str, city_name: str | None) -> list[dict]:
     query = f"{business_name} {city_name}" if city_name else business_name
     try:
-        resp = requests.get(
+        resp = _SESSION.get(
             SEARXNG_URL,
-            params={"q": query, "format": "json", "categories": "general"},
-            timeout=10,
+            params={
+                "q": query,
+                "format": "json",
+                "categories": "general",
+                "engines": SEARXNG_ENGINES,
+            },
+            timeout=(3, 10),
         )
         if resp.status_code != 200:
             return []
-        data = resp.json()
+        data = orjson.loads(resp.content)
         results = []
-        for item in data.get("results", [])[:15]:
+        for item in data.get("results", [])[:SEARXNG_MAX_RESULTS]:
             results.append({
                 "title": item.get("title", ""),
                 "url": item.get("url", ""),
@@ -66,18 +309,166 @@ def _fetch_search_context(business_name: str, city_name: str | None) -> list[dic
         return []
 
 
+@dataclass(frozen=True)
+class _ProviderSpec:
+    """How to call one LLM provider: endpoint, auth, payload and reply shape."""
+
+    url: Callable[[str], str]
+    headers: Callable[[str], dict]
+    build_payload: Callable[[str, str], dict]
+    extract_content: Callable[[dict], str]
+
+
+def _bearer_headers(api_key: str) -> dict:
+    return {"Content-Type": "application/json", "Authorization": f"Bearer {api_key}"}
+
+
+def _chat_payload(model: str, sys_prompt: str, user_prompt: str) -> dict:
+    return {
+        "model": model,
+        "response_format": {"type": "json_object"},
+        "messages": [
+            {"role": "system", "content": sys_prompt},
+            {"role": "user", "content": user_prompt}
+        ],
+        "temperature": 0.1
+    }
+
+
+def _chat_content(data: dict) -> str:
+    return data["choices"][0]["message"]["content"]
+
+
+def _gemini_payload(sys_prompt: str, user_prompt: str) -> dict:
+    return {
+        "system_instruction": {"parts": [{"text": sys_prompt}]},
+        "contents": [{"parts": [{"text": user_prompt}]}],
+        "generationConfig": {
+            "temperature": 0.1,
+            "responseMimeType": "application/json"
+        }
+    }
+
+
+def _gemini_content(data: dict) -> str:
+    return data["candidates"][0]["content"]["parts"][0]["text"]
+
+
+_PROVIDERS: dict[str, _ProviderSpec] = {
+    "openrouter": _ProviderSpec(
+        url=lambda api_key: "https://openrouter.ai/api/v1/chat/completions",
+        headers=_bearer_headers,
+        build_payload=partial(_chat_payload, "google/gemini-2.5-flash"),
+        extract_content=_chat_content,
+    ),
+    "gemini": _ProviderSpec(
+        url=lambda api_key: (
+            "https://generativelanguage.googleapis.com/v1beta/models/"
+            f"gemini-2.5-flash:generateContent?key={api_key}"
+        ),
+        headers=lambda api_key: {"Content-Type": "application/json"},
+        build_payload=_gemini_payload,
+        extract_content=_gemini_content,
+    ),
+    "groq": _ProviderSpec(
+        url=lambda api_key: "https://api.groq.com/openai/v1/chat/completions",
+        headers=_bearer_headers,
+        build_payload=partial(_chat_payload, "llama-3.3-70b-versatile"),
+        extract_content=_chat_content,
+    ),
+}
+
+
+def _is_directory_url(url: str) -> bool:
+    domain = _get_domain_from_url(url)
+    labels = domain.split(".")
+    return any(".".join(labels[i:]) in DIRECTORY_INDICATORS for i in range(len(labels)))
+
+
 def _format_search_results(results: list[dict]) -> str:
-    """Format search results into a concise text block for the LLM."""
+    """Format search results into a compact tab-separated block for the LLM.
+
+    Possible own sites come first with snippets; directory and social
+    listings are trimmed to a few rows without snippets.
+    """
     if not results:
         return "No search results found."
-    lines = []
-    for i, r in enumerate(results, 1):
-        lines.append(f"{i}. [{r['title']}]({r['url']})")
-        if r.get("snippet"):
-            lines.append(f"   {r['snippet']}")
+    candidates = []
+    listings = []
+    for r in results:
+        if _is_directory_url(r["url"]):
+            if len(listings) < MAX_DIRECTORY_RESULTS:
+                listings.append(r)
+        elif len(candidates) < MAX_CANDIDATE_RESULTS:
+            candidates.append(r)
+
+    # One tab-separated row per hit: url, title, snippet
+    lines = [
+        f"{_compact_url(r['url'])}\t{_tsv_field(r['title'])}\t{_tsv_field(r.get('snippet'))}"
+        for r in candidates
+    ]
+    if listings:
+        lines.append("Directory/social listings:")
+        for r in listings:
+            lines.append(f"{_compact_url(r['url'])}\t{_tsv_field(r['title'])}")
     return "\n".join(lines)
 
 
+_SLUG_STRIP_RE = re.compile(r"[^a-z0-9]")
+
+
+def _pre_classify(business_name: str, results: list[dict]) -> Optional[dict]:
+    """Decide clear-cut cases from the search results alone, without the LLM.
+
+    has_website when two of the top five hits are one non-directory host
+    whose name contains the business slug; no_website when at least three
+    hits came back and every one of the top ten is a directory listing.
+    Returns None when the LLM should decide.
+    """
+    if not results:
+        return None
+
+    biz_slug = _SLUG_STRIP_RE.sub("", business_name.lower())
+    if len(biz_slug) >= 4:
+        matches: dict[str, int] = {}
+        for r in results[:5]:
+            host = _get_domain_from_url(r["url"])
+            if not host or _is_directory_url(r["url"]):
+                continue
+            if any(biz_slug in label for label in host.split(".")[:-1]):
+                matches[host] = matches.get(host, 0) + 1
+                if matches[host] >= 2:
+                    return {
+                        "status": "has_website",
+                        "website_url": f"https://{host}",
+                        "reason": "domain_match",
+                        "pre_classified": True,
+                    }
+
+    top = results[:10]
+    if len(top) >= 3 and all(_is_directory_url(r["url"]) for r in top):
+        return {
+            "status": "no_website",
+            "website_url": None,
+            "reason": "directory_listings_only",
+            "pre_classified": True,
+        }
+    return None
+
+
+def _compact_url(url: str) -> str:
+    """Drop the scheme, ``www.`` and trailing slash; the LLM only needs host and path."""
+    _, sep, rest = url.partition("://")
+    rest = rest if sep else url
+    if rest.startswith("www."):
+        rest = rest[4:]
+    return rest.rstrip("/")
+
+
+def _tsv_field(value: Optional[str]) -> str:
+    return " ".join((value or "").split())
+
+
 def is_error_status(result):
     return isinstance(result, dict) and result.get("status") == "error"
 
@@ -93,32 +484,19 @@ def _analyze_with_llm(
     search_results: list[dict],
     api_key: str,
     provider: str,
+    cache: Optional[_ResponseCache] = None,
+    pacer: Optional[_ProviderPacer] = None,
 ) -> dict:
     """Ask an LLM to analyze search results and determine if the business has a website.
 
-    Returns a dict with: status ("has_website", "no_website", "not_sure"), website_url, reason
+    Returns a dict with: status ("has_website", "no_website", "not_sure"), website_url, reason.
+    With ``cache``, identical prompts to the same provider reuse the stored verdict.
+    With ``pacer``, each API attempt (including retries) waits for its slot.
     """
     location = city_name if city_name else "unknown location"
     biz_category = category if category else "business"
     search_text = _format_search_results(search_results)
 
-    sys_prompt = (
-        "You are an expert web researcher analyzing search engine results to determine "
-        "if a specific business has its own official website.\n\n"
-        "RULES:\n"
-        "- A real website is a domain the business owns (e.g. joespizza.com, villagecobbler.ca)\n"
-        "- Directory listings (Yelp, Facebook, YellowPages, Google Maps, TripAdvisor, etc.) are NOT real websites\n"
-        "- Social media pages (instagram.com/business, facebook.com/business) are NOT real websites\n"
-        "- If a search result URL contains the business name and is NOT a directory, it's likely their website\n"
-        "- Chain/franchise businesses (McDonald's, Subway, etc.) should be marked 'has_website'\n\n"
-        "Return ONLY a JSON object with:\n"
-        "- status: 'has_website' if search results show they have an official site, "
-        "'no_website' if results clearly show no official site exists, "
-        "or 'not_sure' if evidence is insufficient\n"
-        "- website_url: the official website URL if found, otherwise null\n"
-        "- reason: brief explanation (1 sentence)"
-    )
-
     user_prompt = (
         f"Business: {business_name}\n"
         f"Location: {location}\n"
@@ -126,78 +504,114 @@ def _analyze_with_llm(
         f"Search Results:\n{search_text}"
     )
 
-    headers = {"Content-Type": "application/json"}
+    key = _cache_key("llm", {
+        "provider": provider,
+        "system": _SYSTEM_PROMPT,
+        "user": user_prompt,
+        "temperature": 0.1,
+    })
+    if cache is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+    # Same prompt in flight on another thread: wait for its verdict.
+    return dict(_INFLIGHT.do(key, partial(
+        _request_verdict, business_name, user_prompt,
+        api_key, provider, key, cache, pacer,
+    )))
+
+
+def _request_verdict(
+    business_name: str,
+    user_prompt: str,
+    api_key: str,
+    provider: str,
+    key: str,
+    cache: Optional[_ResponseCache],
+    pacer: Optional[_ProviderPacer],
+) -> dict:
+    """Send one prompt to the provider and normalise its verdict."""
+    if pacer is not None:
+        pacer.acquire()
 
     try:
-        if provider == "openrouter":
-            url = "https://openrouter.ai/api/v1/chat/completions"
-            headers["Authorization"] = f"Bearer {api_key}"
-            payload = {
-                "model": "google/gemini-2.5-flash",
-                "response_format": {"type": "json_object"},
-                "messages": [
-                    {"role": "system", "content": sys_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                "temperature": 0.1
-            }
-            resp = requests.post(url, headers=headers, json=payload, timeout=30)
-            resp.raise_for_status()
-            data = resp.json()
-            content = data["choices"][0]["message"]["content"]
-
-        elif provider == "gemini":
-            url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-flash:generateContent?key={api_key}"
-            payload = {
-                "system_instruction": {"parts": [{"text": sys_prompt}]},
-                "contents": [{"parts": [{"text": user_prompt}]}],
-                "generationConfig": {
-                    "temperature": 0.1,
-                    "responseMimeType": "application/json"
-                }
-            }
-            resp = requests.post(url, headers=headers, json=payload, timeout=30)
-            resp.raise_for_status()
-            data = resp.json()
-            content = data["candidates"][0]["content"]["parts"][0]["text"]
-
-        elif provider == "groq":
-            url = "https://api.groq.com/openai/v1/chat/completions"
-            headers["Authorization"] = f"Bearer {api_key}"
-            payload = {
-                "model": "llama-3.3-70b-versatile",
-                "response_format": {"type": "json_object"},
-                "messages": [
-                    {"role": "system", "content": sys_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                "temperature": 0.1
-            }
-            resp = requests.post(url, headers=headers, json=payload, timeout=30)
-            resp.raise_for_status()
-            data = resp.json()
-            content = data["choices"][0]["message"]["content"]
-
-        else:
+        spec = _PROVIDERS.get(provider)
+        if spec is None:
             raise ValueError(f"Unknown provider: {provider}")
+        resp = _SESSION.post(
+            spec.url(api_key),
+            headers=spec.headers(api_key),
+            data=orjson.dumps(spec.build_payload(_SYSTEM_PROMPT, user_prompt)),
+            timeout=30,
+        )
+        if pacer is not None:
+            pacer.observe(resp)
+        resp.raise_for_status()
+        content = spec.extract_content(orjson.loads(resp.content))
 
-        result = json.loads(content)
+        result = orjson.loads(content)
 
         status = result.get("status", "not_sure")
         if status not in ("has_website", "no_website", "not_sure"):
             status = "not_sure"
 
-        return {
+        verdict = {
             "status": status,
             "website_url": result.get("website_url"),
             "reason": result.get("reason", "")
         }
+        if cache is not None:
+            cache.set(key, verdict, LLM_CACHE_TTL_SECONDS)
+        return verdict
 
     except Exception as exc:
         logger.warning("LLM analysis failed for '%s' using %s: %s", business_name, provider, exc)
         return {"status": "error", "error": str(exc)}
 
 
+def _verify_one(
+    biz_name: str,
+    city_name: Optional[str],
+    category: str,
+    search: Future,
+    api_key: str,
+    provider: str,
+    pacer: _ProviderPacer,
+    abort: threading.Event,
+    cache: _ResponseCache,
+) -> Optional[tuple[list[dict], dict | Exception]]:
+    """Classify one business from its prefetched search context, via the LLM if needed.
+
+    Runs on a worker thread; touches no ORM state. Returns
+    (search_results, result) where result is the analysis dict or the
+    exception it raised, or None if the batch was aborted first.
+    """
+    if abort.is_set():
+        return None
+    try:
+        search_results = search.result()
+    except CancelledError:
+        return None
+    verdict = _pre_classify(biz_name, search_results)
+    if verdict is not None:
+        return search_results, verdict
+    try:
+        result = _analyze_with_llm(
+            business_name=biz_name,
+            city_name=city_name,
+            category=category,
+            search_results=search_results,
+            api_key=api_key,
+            provider=provider,
+            cache=cache,
+            pacer=pacer,
+        )
+    except Exception as exc:
+        return search_results, exc
+    return search_results, result
+
+
 def run_batch(
     limit: Optional[int] = None,
     min_score: float = 30.0,
@@ -266,156 +680,232 @@ def run_batch(
                         not_(Business.raw.has_key("llm_verified")),
                     )
                 )
-                .order_by(Business.lead_score.desc(), Business.created_at)
+                .order_by(Business.lead_score.desc(), Business.created_at, Business.id)
             )
 
-            if batch_size is not None:
-                stmt = stmt.limit(batch_size)
-
-            rows = session.execute(stmt).all()
-
-            if not rows:
-                complete_job(session, run, processed_count=0, details={
-                    "min_score": min_score,
-                    "websites_found": 0,
-                    "no_website_confirmed": 0,
-                    "not_sure": 0,
-                    "errors": 0,
-                    "provider": provider
-                })
-                return {
-                    "processed": 0,
-                    "websites_found": 0,
-                    "no_website_confirmed": 0,
-                    "not_sure": 0,
-                    "errors": 0,
-                    "provider": provider
-                }
-
             processed = 0
+            claimed = 0
             websites_found = 0
             no_website_confirmed = 0
             not_sure = 0
             errors = 0
+            llm_skipped = 0
             consecutive_rate_limits = 0
             MAX_CONSECUTIVE_RATE_LIMITS = 3  # Bail out after 3 consecutive 429s
 
-            for business, city in rows:
-                city_name = city.name if city else None
-                biz_name = (business.name or "").strip()
-                biz_category = (business.category or "").strip()
-
-                if not biz_name:
-                    processed += 1
-                    continue
-
-                raw = dict(business.raw) if business.raw else {}
-
-                # Step 1: Fetch search results from SearXNG
-                search_results = _fetch_search_context(biz_name, city_name)
-
-                # Step 2: Ask LLM to analyze the search results
-                try:
-                    result = _analyze_with_llm(
-                        business_name=biz_name,
-                        city_name=city_name,
-                        category=biz_category,
-                        search_results=search_results,
-                        api_key=api_key,
-                        provider=provider
-                    )
-                    consecutive_rate_limits = 0  # Reset on success
-                except Exception as llm_exc:
-                    # Handle rate limits and other API errors gracefully —
-                    # mark as error and continue with next business instead
-                    # of crashing the entire batch.
-                    logger.warning(
-                        "LLM analysis exception for '%s': %s — skipping",
-                        biz_name, llm_exc,
+            # Searches and LLM calls run on worker threads behind the
+            # provider's pacer; results are applied here, in row
+            # order, so the session stays on this thread.
+            pacer = _ProviderPacer(_PROVIDER_RPM.get(provider, DEFAULT_RPM))
+            cache = _ResponseCache(
+                redis.Redis.from_url(config.redis_url) if config.redis_url else None
+            )
+            abort = threading.Event()
+            last_key: Optional[tuple] = None
+            with ThreadPoolExecutor(max_workers=SEARCH_WORKERS) as search_executor, \
+                    ThreadPoolExecutor(max_workers=LLM_WORKERS) as executor:
+                while not abort.is_set():
+                    claim_size = LLM_VERIFY_CLAIM_SIZE
+                    if batch_size is not None:
+                        claim_size = min(claim_size, batch_size - claimed)
+                    if claim_size <= 0:
+                        break
+
+                    # Claim the next chunk for this transaction so concurrent
+                    # runs each take a distinct set; City sits on the nullable
+                    # side of the outer join and can't be locked. Paging on the
+                    # sort key moves past rows this run left unverified.
+                    chunk_stmt = stmt
+                    if last_key is not None:
+                        last_score, last_created, last_id = last_key
+                        chunk_stmt = chunk_stmt.where(or_(
+                            Business.lead_score < last_score,
+                            and_(
+                                Business.lead_score == last_score,
+                                tuple_(Business.created_at, Business.id) > (last_created, last_id),
+                            ),
+                        ))
+                    chunk_stmt = chunk_stmt.limit(claim_size).with_for_update(
+                        skip_locked=True, of=Business,
                     )
-                    raw["llm_verified"] = True
-                    raw["llm_verify_result"] = "error"
-                    raw["llm_error"] = str(llm_exc)[:200]
-                    raw["llm_error_count"] = raw.get("llm_error_count", 0) + 1
-                    business.raw = raw
-                    business.scored_at = None
-                    errors += 1
-                    processed += 1
-                    # If we're hitting rate limits, bail out early
-                    if "429" in str(llm_exc) or "rate" in str(llm_exc).lower():
-                        consecutive_rate_limits += 1
-                        if consecutive_rate_limits >= MAX_CONSECUTIVE_RATE_LIMITS:
+                    rows = session.execute(chunk_stmt).all()
+                    if not rows:
+                        break
+                    claimed += len(rows)
+                    last = rows[-1][0]
+                    last_key = (last.lead_score, last.created_at, last.id)
+
+                    # Row updates are collected here and written in one
+                    # executemany UPDATE per chunk instead of flushing per
+                    # business.
+                    updates: list[dict] = []
+                    row_iter = iter(rows)
+                    searching: deque = deque()
+                    pending: deque = deque()
+                    while True:
+                        # Keep searches running ahead of the LLM window
+                        while len(searching) < SEARCH_PREFETCH:
+                            row = next(row_iter, None)
+                            if row is None:
+                                break
+                            business, city = row
+                            biz_name = (business.name or "").strip()
+                            city_name = city.name if city else None
+                            search = None
+                            if biz_name:
+                                search = search_executor.submit(
+                                    _fetch_search_context, biz_name, city_name, cache,
+                                )
+                            searching.append((business, biz_name, city_name, search))
+
+                        # Keep a bounded window of businesses in flight
+                        while len(pending) < LLM_WORKERS * 2 and searching:
+                            business, biz_name, city_name, search = searching.popleft()
+                            future = None
+                            if search is not None:
+                                future = executor.submit(
+                                    _verify_one,
+                                    biz_name,
+                                    city_name,
+                                    (business.category or "").strip(),
+                                    search,
+                                    api_key,
+                                    provider,
+                                    pacer,
+                                    abort,
+                                    cache,
+                                )
+                            pending.append((business, biz_name, future))
+
+                        if not pending:
+                            break
+
+                        business, biz_name, future = pending.popleft()
+                        if future is None:
+                            processed += 1
+                            continue
+
+                        outcome = future.result()
+                        if outcome is None:
+                            # Skipped after an abort; left unverified for the next run
+                            continue
+                        search_results, result = outcome
+
+                        raw = dict(business.raw) if business.raw else {}
+                        website_url = business.website_url
+
+                        if isinstance(result, Exception):
+                            # Handle rate limits and other API errors gracefully —
+                            # mark as error and continue with next business instead
+                            # of crashing the entire batch.
                             logger.warning(
-                                "LLM verify: %d consecutive rate limits — "
-                                "aborting batch early (%d/%d processed)",
-                                consecutive_rate_limits, processed, len(rows),
+                                "LLM analysis exception for '%s': %s — skipping",
+                                biz_name, result,
+                            )
+                            raw["llm_verified"] = True
+                            raw["llm_verify_result"] = "error"
+                            raw["llm_error"] = str(result)[:200]
+                            raw["llm_error_count"] = raw.get("llm_error_count", 0) + 1
+                            updates.append({
+                                "id": business.id,
+                                "raw": raw,
+                                "website_url": website_url,
+                                "scored_at": None,
+                            })
+                            errors += 1
+                            processed += 1
+                            # If we're hitting rate limits, bail out early
+                            if "429" in str(result) or "rate" in str(result).lower():
+                                consecutive_rate_limits += 1
+                                if consecutive_rate_limits >= MAX_CONSECUTIVE_RATE_LIMITS:
+                                    logger.warning(
+                                        "LLM verify: %d consecutive rate limits — "
+                                        "aborting batch early (%d/%d processed)",
+                                        consecutive_rate_limits, processed, claimed,
+                                    )
+                                    abort.set()
+                                    for _, _, queued in pending:
+                                        if queued is not None:
+                                            queued.cancel()
+                                    for _, _, _, queued in searching:
+                                        if queued is not None:
+                                            queued.cancel()
+                                    break
+                            continue
+
+                        consecutive_rate_limits = 0  # Reset on success
+                        status = result.get("status")
+                        if result.get("pre_classified"):
+                            llm_skipped += 1
+
+                        if status == "error":
+                            raw["llm_verified"] = True
+                            raw["llm_error"] = result.get("error")
+                            raw["llm_error_count"] = raw.get("llm_error_count", 0) + 1
+                            raw["llm_verify_result"] = "error"
+                            errors += 1
+
+                        elif status == "has_website":
+                            website = result.get("website_url")
+                            if website:
+                                website_url = website
+
+                            raw["llm_verified"] = True
+                            raw["llm_verify_result"] = "has_website"
+                            raw["llm_website"] = website
+                            raw["llm_reason"] = result.get("reason")
+                            raw["llm_search_results_count"] = len(search_results)
+                            websites_found += 1
+
+                        elif status == "no_website":
+                            raw["llm_verified"] = True
+                            raw["llm_verify_result"] = "no_website"
+                            raw["llm_reason"] = result.get("reason")
+                            raw["llm_search_results_count"] = len(search_results)
+                            no_website_confirmed += 1
+
+                        else:  # not_sure
+                            raw["llm_verified"] = True
+                            raw["llm_verify_result"] = "not_sure"
+                            raw["llm_reason"] = result.get("reason")
+                            raw["llm_search_results_count"] = len(search_results)
+                            not_sure += 1
+
+                        updates.append({
+                            "id": business.id,
+                            "raw": raw,
+                            "website_url": website_url,
+                            "scored_at": None,
+                        })
+                        processed += 1
+
+                        if processed % 10 == 0:
+                            logger.info(
+                                "LLM analysis progress (%s): %d/%d processed, "
+                                "%d websites found, %d confirmed no website",
+                                provider, processed, claimed, websites_found, no_website_confirmed,
                             )
-                            break
-                    continue
-
-                status = result.get("status")
-
-                if status == "error":
-                    raw["llm_verified"] = True
-                    raw["llm_error"] = result.get("error")
-                    raw["llm_error_count"] = raw.get("llm_error_count", 0) + 1
-                    raw["llm_verify_result"] = "error"
-                    business.raw = raw
-                    errors += 1
-
-                elif status == "has_website":
-                    website = result.get("website_url")
-                    if website:
-                        business.website_url = website
-
-                    raw["llm_verified"] = True
-                    raw["llm_verify_result"] = "has_website"
-                    raw["llm_website"] = website
-                    raw["llm_reason"] = result.get("reason")
-                    raw["llm_search_results_count"] = len(search_results)
-                    business.raw = raw
-                    websites_found += 1
-
-                elif status == "no_website":
-                    raw["llm_verified"] = True
-                    raw["llm_verify_result"] = "no_website"
-                    raw["llm_reason"] = result.get("reason")
-                    raw["llm_search_results_count"] = len(search_results)
-                    business.raw = raw
-                    no_website_confirmed += 1
-
-                else:  # not_sure
-                    raw["llm_verified"] = True
-                    raw["llm_verify_result"] = "not_sure"
-                    raw["llm_reason"] = result.get("reason")
-                    raw["llm_search_results_count"] = len(search_results)
-                    business.raw = raw
-                    not_sure += 1
-
-                business.scored_at = None
-                processed += 1
-
-                if processed % 10 == 0:
-                    session.flush()
-                    logger.info(
-                        "LLM analysis progress (%s): %d/%d processed, "
-                        "%d websites found, %d confirmed no website",
-                        provider, processed, len(rows), websites_found, no_website_confirmed,
-                    )
 
-                # Rate limiting
-                if provider == "gemini":
-                    time.sleep(2.0)
-                else:
-                    time.sleep(0.5)
+                    # Commit each chunk so its results are durable and its
+                    # row locks are released before the next claim.
+                    if updates:
+                        session.execute(update(Business), updates)
+                    session.commit()
 
+            logger.info(
+                "LLM verify response cache: %d hits, %d misses",
+                cache.hits, cache.misses,
+            )
             details = {
                 "min_score": min_score,
                 "websites_found": websites_found,
                 "no_website_confirmed": no_website_confirmed,
                 "not_sure": not_sure,
                 "errors": errors,
-                "provider": provider
+                "llm_skipped": llm_skipped,
+                "provider": provider,
+                "cache_hits": cache.hits,
+                "cache_misses": cache.misses,
             }
             complete_job(session, run, processed_count=processed, details=details)
 
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import re
-from typing import Any, Iterable
+from functools import lru_cache
+from typing import Any
 
 # Some OSM exports contain bidi markers around phone numbers (e.g. U+2066 .. U+2069).
 _BIDI_MARKS = dict.fromkeys(map(ord, "\u2066\u2067\u2068\u2069\u200e\u200f"), None)
 
-_INVALID_VALUES = {
+_INVALID_VALUES = frozenset({
     "-",
     "n/a",
     "na",
@@ -14,10 +15,10 @@ _INVALID_VALUES = {
     "null",
     "unknown",
     "0",
-}
+})
 
 # Common OSM tag keys for phone/email contact details.
-_PHONE_KEYS = {
+_PHONE_KEYS = frozenset({
     "phone",
     "contact:phone",
     "mobile",
@@ -28,11 +29,18 @@ _PHONE_KEYS = {
     "contact:tel",
     "whatsapp",
     "contact:whatsapp",
-}
-_EMAIL_KEYS = {
+})
+_EMAIL_KEYS = frozenset({
     "email",
     "contact:email",
-}
+})
+
+# Namespaced variants: "contact:<sub>[:...]" and "<head>:..." (e.g. "phone:mobile").
+_PHONE_SUBKEYS = frozenset({"phone", "mobile", "telephone", "tel", "whatsapp"})
+_PHONE_PREFIX_HEADS = frozenset({"phone", "mobile", "telephone"})
+
+# Exact-key fast path for _classify_key.
+_KEY_KINDS = {**dict.fromkeys(_PHONE_KEYS, "phone"), **dict.fromkeys(_EMAIL_KEYS, "email")}
 
 # Phone fields are often "a;b", "a, b", or "a / b" and occasionally "a: b".
 _PHONE_SPLIT_RE = re.compile(r"(?:\s*/\s*)|(?:\s*[,;:\n]\s*)|\s+or\s+", re.IGNORECASE)
@@ -46,7 +54,14 @@ def _strip_bidi(value: str) -> str:
 def _clean_value(value: Any) -> str | None:
     if value is None:
         return None
-    text = _strip_bidi(str(value)).strip()
+    return _clean_text(value if isinstance(value, str) else str(value))
+
+
+# Contact values repeat heavily across an import (chain stores, shared
+# switchboards), so cleaning is memoized on the raw string.
+@lru_cache(maxsize=65536)
+def _clean_text(value: str) -> str | None:
+    text = _strip_bidi(value).strip()
     if not text:
         return None
     if text.lower() in _INVALID_VALUES:
@@ -54,51 +69,45 @@ def _clean_value(value: Any) -> str | None:
     return text
 
 
-def _collect_tag_values(tags: dict[str, Any], key_predicate) -> Iterable[str]:
-    for key, value in tags.items():
-        if not value:
-            continue
-        normalized_key = str(key).strip().lower()
-        if key_predicate(normalized_key):
-            cleaned = _clean_value(value)
-            if cleaned:
-                yield cleaned
-
-
 def _is_phone_key(normalized_key: str) -> bool:
     if normalized_key in _PHONE_KEYS:
         return True
-    if normalized_key.startswith("contact:"):
-        parts = normalized_key.split(":")
-        return len(parts) >= 2 and parts[1] in {"phone", "mobile", "telephone", "tel", "whatsapp"}
-    if normalized_key.startswith("phone:"):
-        return True
-    if normalized_key.startswith("mobile:"):
-        return True
-    if normalized_key.startswith("telephone:"):
-        return True
-    return False
+    head, sep, tail = normalized_key.partition(":")
+    if not sep:
+        return False
+    if head == "contact":
+        return tail.partition(":")[0] in _PHONE_SUBKEYS
+    return head in _PHONE_PREFIX_HEADS
 
 
 def _is_email_key(normalized_key: str) -> bool:
     if normalized_key in _EMAIL_KEYS:
         return True
-    if normalized_key.startswith("contact:"):
-        parts = normalized_key.split(":")
-        return len(parts) >= 2 and parts[1] == "email"
-    if normalized_key.startswith("email:"):
-        return True
-    return False
+    head, sep, tail = normalized_key.partition(":")
+    if not sep:
+        return False
+    if head == "contact":
+        return tail.partition(":")[0] == "email"
+    return head == "email"
 
 
-def _split_and_clean(value: str, splitter: re.Pattern[str]) -> list[str]:
-    parts = []
-    for raw in splitter.split(value):
-        cleaned = _clean_value(raw)
-        if not cleaned:
-            continue
-        parts.append(cleaned)
-    return parts
+@lru_cache(maxsize=4096)
+def _classify_raw_key(key: str) -> str | None:
+    # Only a few thousand distinct tag keys exist, so this is a dict hit
+    # for nearly every tag after warm-up.
+    return _classify_key(key.strip().lower())
+
+
+def _classify_key(normalized_key: str) -> str | None:
+    """Return "phone", "email", or None for a lowercased OSM tag key."""
+    kind = _KEY_KINDS.get(normalized_key)
+    if kind is not None:
+        return kind
+    if _is_phone_key(normalized_key):
+        return "phone"
+    if _is_email_key(normalized_key):
+        return "email"
+    return None
 
 
 def extract_osm_contacts(tags: dict[str, Any]) -> list[tuple[str, str]]:
@@ -106,36 +115,52 @@ def extract_osm_contacts(tags: dict[str, Any]) -> list[tuple[str, str]]:
 
     The lead pipeline primarily considers phone/email as "contact" because those are
     outreach-ready. We normalize common tag variants and split multiple values.
+    Phones are returned before emails, each in tag order.
     """
 
-    contacts: list[tuple[str, str]] = []
+    phones: list[tuple[str, str]] = []
+    emails: list[tuple[str, str]] = []
     seen: set[tuple[str, str]] = set()
+    seen_add = seen.add
 
-    phone_values = list(_collect_tag_values(tags, _is_phone_key))
-    for phone_value in phone_values:
-        # Strip common URI prefixes if present.
-        cleaned = phone_value
-        if cleaned.lower().startswith("tel:"):
-            cleaned = cleaned[4:].strip()
-        for part in _split_and_clean(cleaned, _PHONE_SPLIT_RE):
-            pair = ("phone", part)
-            if pair not in seen:
-                contacts.append(pair)
-                seen.add(pair)
-
-    email_values = list(_collect_tag_values(tags, _is_email_key))
-    for email_value in email_values:
-        cleaned = email_value
-        if cleaned.lower().startswith("mailto:"):
-            cleaned = cleaned[7:].strip()
-        for part in _split_and_clean(cleaned, _EMAIL_SPLIT_RE):
-            normalized = part.strip().lower().strip(";,")
-            if "@" not in normalized:
-                continue
-            pair = ("email", normalized)
-            if pair not in seen:
-                contacts.append(pair)
-                seen.add(pair)
-
-    return contacts
+    # Single pass over the tags: classify, clean, split and dedupe in place.
+    for key, value in tags.items():
+        if not value:
+            continue
+        kind = _classify_raw_key(key if isinstance(key, str) else str(key))
+        if kind is None:
+            continue
+        text = _clean_value(value)
+        if not text:
+            continue
 
+        if kind == "phone":
+            # Strip common URI prefixes if present.
+            if text[:4].lower() == "tel:":
+                text = text[4:].strip()
+            for part in _PHONE_SPLIT_RE.split(text):
+                # Bidi marks are already gone from the whole value.
+                part = part.strip()
+                if not part or part.lower() in _INVALID_VALUES:
+                    continue
+                pair = ("phone", part)
+                if pair not in seen:
+                    phones.append(pair)
+                    seen_add(pair)
+        else:
+            if text[:7].lower() == "mailto:":
+                text = text[7:].strip()
+            for part in _EMAIL_SPLIT_RE.split(text):
+                part = part.strip()
+                if not part or part.lower() in _INVALID_VALUES:
+                    continue
+                normalized = part.lower().strip(";,")
+                if "@" not in normalized:
+                    continue
+                pair = ("email", normalized)
+                if pair not in seen:
+                    emails.append(pair)
+                    seen_add(pair)
+
+    phones.extend(emails)
+    return phones
@@ -1,18 +1,27 @@
 from __future__ import annotations
 
+import gzip
+import hashlib
+import io
 import json
 import os
 import time
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Any, Optional
 
+import orjson
 import requests
-from sqlalchemy import select
-from sqlalchemy.dialects.postgresql import insert
+from requests.adapters import HTTPAdapter
+from sqlalchemy import select, text
+from sqlalchemy.dialects.postgresql import JSONB, insert
 
 from ..config import load_config
-from ..db import session_scope
+from ..db import _json_serializer, session_scope
 from ..models import Business, BusinessContact, City
 from .osm_contacts import extract_osm_contacts
 
@@ -126,13 +135,25 @@ def resolve_free_text_area(location_text: str) -> AreaConfig:
 
 
 def build_area_clause(area_tags: dict[str, str]) -> str:
-    parts = [f'"{k}"="{v}"' for k, v in area_tags.items()]
-    return "[" + "][".join(parts) + "]"
+    return _area_clause(tuple(area_tags.items()))
 
 
 def build_filter_clause(tags: dict[str, str]) -> str:
+    return _filter_clause(tuple(tags.items()))
+
+
+# The filter set is fixed for an import but rendered for every bbox tile;
+# memoized on the tag items so each clause is formatted once.
+@lru_cache(maxsize=1024)
+def _area_clause(items: tuple[tuple[str, str], ...]) -> str:
+    parts = [f'"{k}"="{v}"' for k, v in items]
+    return "[" + "][".join(parts) + "]"
+
+
+@lru_cache(maxsize=1024)
+def _filter_clause(items: tuple[tuple[str, Optional[str]], ...]) -> str:
     parts = []
-    for key, value in tags.items():
+    for key, value in items:
         if value in ("*", None):
             parts.append(f'"{key}"')
         else:
@@ -159,9 +180,11 @@ def build_query(
         lines.insert(1, f"area{area_clause}->.searchArea;")
         search_area = "(area.searchArea)"
 
-    for filt in filters:
+    # Categories often share tag filters; emit each distinct one once.
+    clauses = dict.fromkeys(build_filter_clause(filt.tags) for filt in filters)
+    for clause in clauses:
         for element_type in element_types:
-            lines.append(f"  {element_type}[\"name\"]{build_filter_clause(filt.tags)}{search_area};")
+            lines.append(f"  {element_type}[\"name\"]{clause}{search_area};")
 
     lines.append(");")
     lines.append("out center tags;")
@@ -221,63 +244,107 @@ def get_or_create_city(session, area: AreaConfig) -> City:
     return city
 
 
-def match_category(filters: list[CategoryFilter], tags: dict[str, Any]) -> Optional[str]:
-    for filt in filters:
-        match = True
-        for key, value in filt.tags.items():
-            if value in ("*", None):
-                if key not in tags:
-                    match = False
-                    break
-            elif tags.get(key) != value:
-                match = False
+class CategoryMatcher:
+    """First-match category lookup over an ordered list of filters.
+
+    Single-tag filters are indexed by ``(key, value)`` and by key for
+    wildcards, so an element costs one or two dict lookups per tag instead
+    of a scan over every filter. Multi-tag filters are still checked in
+    order, but only those ranked ahead of the best indexed hit.
+    """
+
+    def __init__(self, filters: list[CategoryFilter]) -> None:
+        self._filters = filters
+        self._exact: dict[tuple[str, str], int] = {}
+        self._wildcard: dict[str, int] = {}
+        self._complex: list[tuple[int, CategoryFilter]] = []
+        for position, filt in enumerate(filters):
+            if len(filt.tags) == 1:
+                ((key, value),) = filt.tags.items()
+                if value in ("*", None):
+                    self._wildcard.setdefault(key, position)
+                else:
+                    self._exact.setdefault((key, value), position)
+            else:
+                self._complex.append((position, filt))
+
+    def match(self, tags: dict[str, Any]) -> Optional[str]:
+        best: Optional[int] = None
+        exact = self._exact
+        wildcard = self._wildcard
+        for key, value in tags.items():
+            position = wildcard.get(key)
+            if position is not None and (best is None or position < best):
+                best = position
+            position = exact.get((key, value))
+            if position is not None and (best is None or position < best):
+                best = position
+
+        for position, filt in self._complex:
+            if best is not None and position > best:
+                break
+            if _filter_matches(filt, tags):
+                best = position
                 break
-        if match:
-            if filt.category.startswith("any_"):
-                return None
-            return filt.category
-    return None
+
+        if best is None:
+            return None
+        category = self._filters[best].category
+        if category.startswith("any_"):
+            return None
+        return category
+
+
+def _filter_matches(filt: CategoryFilter, tags: dict[str, Any]) -> bool:
+    for key, value in filt.tags.items():
+        if value in ("*", None):
+            if key not in tags:
+                return False
+        elif tags.get(key) != value:
+            return False
+    return True
+
+
+def match_category(filters: list[CategoryFilter], tags: dict[str, Any]) -> Optional[str]:
+    return CategoryMatcher(filters).match(tags)
+
+
+_AMENITY_TO_CATEGORY = {
+    **dict.fromkeys(("restaurant", "cafe", "fast_food", "food_court", "bar", "pub"), "food"),
+    **dict.fromkeys(("clinic", "hospital", "doctors", "dentist", "pharmacy"), "health"),
+    **dict.fromkeys(("school", "college", "university", "kindergarten"), "education"),
+    **dict.fromkeys(("bank", "bureau_de_change", "atm"), "finance"),
+    "place_of_worship": "religious",
+    **dict.fromkeys(("fuel", "car_wash", "car_rental", "car_repair"), "auto"),
+}
+
+# Checked in order once craft/construction/amenity/healthcare don't apply.
+_FALLBACK_KEYS = (
+    ("shop", "retail"),
+    ("tourism", "hospitality"),
+    ("leisure", "recreation"),
+    ("office", "professional_services"),
+    ("industrial", "industrial"),
+)
 
 
 def classify_business(tags: dict[str, Any]) -> str:
-    craft = tags.get("craft")
-    if craft:
+    if tags.get("craft"):
         return "trades"
 
     if tags.get("office") == "construction_company" or tags.get("company") == "construction":
         return "contractors"
 
-    amenity = tags.get("amenity")
-    if amenity in {
-        "restaurant",
-        "cafe",
-        "fast_food",
-        "food_court",
-        "bar",
-        "pub",
-    }:
-        return "food"
-    if amenity in {"clinic", "hospital", "doctors", "dentist", "pharmacy"} or tags.get("healthcare"):
+    category = _AMENITY_TO_CATEGORY.get(tags.get("amenity"))
+    # A healthcare tag outranks every amenity group except food.
+    if tags.get("healthcare") and category != "food":
         return "health"
-    if amenity in {"school", "college", "university", "kindergarten"}:
-        return "education"
-    if amenity in {"bank", "bureau_de_change", "atm"}:
-        return "finance"
-    if amenity in {"place_of_worship"}:
-        return "religious"
-    if amenity in {"fuel", "car_wash", "car_rental", "car_repair"}:
-        return "auto"
-
-    if tags.get("shop"):
-        return "retail"
-    if tags.get("tourism"):
-        return "hospitality"
-    if tags.get("leisure"):
-        return "recreation"
-    if tags.get("office"):
-        return "professional_services"
-    if tags.get("industrial"):
-        return "industrial"
+    if category is not None:
+        return category
+
+    for key, fallback in _FALLBACK_KEYS:
+        if tags.get(key):
+            return fallback
 
     return "other"
 
@@ -286,6 +353,232 @@ def chunked(items: list[CategoryFilter], size: int) -> list[list[CategoryFilter]
     return [items[i : i + size] for i in range(0, len(items), size)]
 
 
+# Elements per existence SELECT / multi-row INSERT in insert_elements.
+INSERT_CHUNK_SIZE = 1000
+# Inserts of at least this many rows go through COPY (psycopg2 only).
+COPY_THRESHOLD = 100
+
+
+def _supports_copy(db) -> bool:
+    return db.get_bind().dialect.driver == "psycopg2"
+
+
+def _copy_insert(db, table, rows: list[dict[str, Any]], conflict_columns: list[str]) -> list[uuid.UUID]:
+    """Insert ``rows`` into ``table`` via COPY and return the ids actually inserted.
+
+    COPY can't skip conflicts, so rows are copied into a temporary staging
+    table and moved across with INSERT ... SELECT ... ON CONFLICT DO NOTHING.
+    """
+    columns = list(rows[0])
+    column_list = ", ".join(columns)
+    staging = f"osm_import_{table.name}_staging"
+    json_columns = {name for name in columns if isinstance(table.c[name].type, JSONB)}
+
+    buf = io.StringIO()
+    for row in rows:
+        fields = []
+        for name in columns:
+            value = row[name]
+            if value is None:
+                fields.append("")  # unquoted empty field is NULL in CSV COPY
+                continue
+            if name in json_columns:
+                value = _json_serializer(value)
+            fields.append('"' + str(value).replace('"', '""') + '"')
+        buf.write(",".join(fields))
+        buf.write("\n")
+    buf.seek(0)
+
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.execute(
+            f"CREATE TEMP TABLE IF NOT EXISTS {staging} "
+            f"(LIKE {table.name} INCLUDING DEFAULTS) ON COMMIT DROP"
+        )
+        cursor.execute(f"TRUNCATE {staging}")
+        cursor.copy_expert(f"COPY {staging} ({column_list}) FROM STDIN WITH (FORMAT csv)", buf)
+    finally:
+        cursor.close()
+
+    return db.execute(
+        text(
+            f"INSERT INTO {table.name} ({column_list}) "
+            f"SELECT {column_list} FROM {staging} "
+            f"ON CONFLICT ({', '.join(conflict_columns)}) DO NOTHING RETURNING id"
+        ).columns(table.c.id)
+    ).scalars().all()
+
+
+def insert_elements(
+    db,
+    elements: list[dict[str, Any]],
+    matcher: CategoryMatcher,
+    city_id: uuid.UUID,
+) -> int:
+    """Insert OSM elements not yet stored as businesses, with their contacts.
+
+    Works a chunk at a time: one SELECT for the source_ids already present,
+    one INSERT for the new businesses and one for their contacts. ON
+    CONFLICT DO NOTHING covers rows a concurrent import stored in between.
+    """
+    by_source_id: dict[str, dict[str, Any]] = {}
+    for element in elements:
+        by_source_id.setdefault(f"{element.get('type')}/{element.get('id')}", element)
+
+    inserted = 0
+    source_ids = list(by_source_id)
+    for start in range(0, len(source_ids), INSERT_CHUNK_SIZE):
+        chunk = source_ids[start : start + INSERT_CHUNK_SIZE]
+        existing = set(
+            db.execute(
+                select(Business.source_id).where(Business.source == "osm").where(Business.source_id.in_(chunk))
+            ).scalars()
+        )
+
+        business_rows = []
+        contacts_by_business: dict[uuid.UUID, list[tuple[str, str]]] = {}
+        for source_id in chunk:
+            if source_id in existing:
+                continue
+            element = by_source_id[source_id]
+            tags = element.get("tags", {})
+            lat, lon = element_location(element)
+            business_id = uuid.uuid4()
+            business_rows.append({
+                "id": business_id,
+                "source": "osm",
+                "source_id": source_id,
+                "name": tags.get("name"),
+                "category": matcher.match(tags) or classify_business(tags),
+                "website_url": extract_website(tags),
+                "address": extract_address(tags),
+                "lat": lat,
+                "lon": lon,
+                "raw": tags,
+                "city_id": city_id,
+            })
+            contacts_by_business[business_id] = extract_contacts(tags)
+
+        if not business_rows:
+            continue
+
+        use_copy = len(business_rows) >= COPY_THRESHOLD and _supports_copy(db)
+        if use_copy:
+            new_ids = _copy_insert(db, Business.__table__, business_rows, ["source", "source_id"])
+        else:
+            new_ids = db.execute(
+                insert(Business)
+                .on_conflict_do_nothing(index_elements=["source", "source_id"])
+                .returning(Business.id),
+                business_rows,
+            ).scalars().all()
+
+        contact_rows = [
+            {
+                "id": uuid.uuid4(),
+                "business_id": business_id,
+                "contact_type": contact_type,
+                "value": value,
+                "source": "osm",
+            }
+            for business_id in new_ids
+            for contact_type, value in contacts_by_business[business_id]
+        ]
+        contact_conflict = ["business_id", "contact_type", "value"]
+        if len(contact_rows) >= COPY_THRESHOLD and use_copy:
+            _copy_insert(db, BusinessContact.__table__, contact_rows, contact_conflict)
+        elif contact_rows:
+            db.execute(
+                insert(BusinessContact).on_conflict_do_nothing(index_elements=contact_conflict),
+                contact_rows,
+            )
+
+        inserted += len(new_ids)
+
+    return inserted
+
+
+def fetch_overpass(
+    session: requests.Session,
+    endpoints: list[str],
+    query: str,
+    *,
+    timeout: int,
+    retry_limit: int,
+    retry_delay: int,
+    pause: int,
+    area_name: str,
+    cache_dir: Optional[Path] = None,
+    cache_ttl: int = 0,
+) -> list[dict[str, Any]]:
+    """Run one Overpass query, trying each endpoint in turn, and return its elements.
+
+    Retries 429/504, connection errors and non-JSON bodies up to
+    ``retry_limit`` times per endpoint; sleeps ``pause`` seconds after a
+    successful response to stay polite to the server. With ``cache_dir``,
+    responses are stored gzipped per query and reused for ``cache_ttl``
+    seconds, so reruns skip Overpass entirely.
+    """
+    cache_path = None
+    if cache_dir is not None:
+        cache_key = hashlib.blake2b(query.encode("utf-8"), digest_size=16).hexdigest()
+        cache_path = cache_dir / f"{cache_key}.json.gz"
+        try:
+            if time.time() - cache_path.stat().st_mtime < cache_ttl:
+                return orjson.loads(gzip.decompress(cache_path.read_bytes())).get("elements", [])
+        except (OSError, orjson.JSONDecodeError):
+            pass  # missing, unreadable or corrupt: fetch it again
+
+    data = None
+    last_error = None
+    for endpoint in endpoints:
+        for attempt in range(1, retry_limit + 1):
+            try:
+                resp = session.post(endpoint, data=query.encode("utf-8"), timeout=timeout)
+            except requests.RequestException as exc:
+                last_error = exc
+                time.sleep(retry_delay)
+                continue
+
+            if resp.status_code in (429, 504):
+                last_error = RuntimeError(f"Overpass {endpoint} returned {resp.status_code}")
+                time.sleep(retry_delay)
+                continue
+
+            if resp.status_code != 200:
+                last_error = RuntimeError(f"Overpass {endpoint} returned {resp.status_code}")
+                break
+
+            try:
+                # orjson parses the body bytes directly, without first
+                # decoding the whole response into a str as resp.json() does.
+                data = orjson.loads(resp.content)
+                break
+            except orjson.JSONDecodeError:
+                snippet = resp.content[:200].decode("utf-8", "replace").replace("\n", " ")
+                last_error = RuntimeError(f"Non-JSON response from {endpoint}: {snippet}")
+                time.sleep(retry_delay)
+                continue
+
+        if data is not None:
+            break
+
+    if data is None:
+        raise RuntimeError(f"Overpass failed for area {area_name}: {last_error}")
+
+    if cache_path is not None:
+        # Write-then-rename so concurrent fetches never read a partial file.
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            tmp_path.write_bytes(gzip.compress(resp.content))
+            tmp_path.replace(cache_path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+
+    time.sleep(pause)
+    return data.get("elements", [])
+
+
 def import_osm(area: AreaConfig, categories: list[CategoryConfig]) -> int:
     config = load_config()
     
@@ -298,12 +591,27 @@ def import_osm(area: AreaConfig, categories: list[CategoryConfig]) -> int:
         else:
             endpoints = [config.overpass_endpoint]
 
+        concurrency = max(1, int(os.getenv("OVERPASS_CONCURRENCY", "2")))
+        # Optional on-disk response cache for reruns; disabled when unset.
+        cache_dir = None
+        cache_dir_env = os.getenv("OVERPASS_CACHE_DIR")
+        if cache_dir_env:
+            cache_dir = Path(cache_dir_env) / "overpass"
+            cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # Warm connections per endpoint, reused across filter chunks, bbox
+        # tiles and retries; retries are handled by fetch_overpass.
+        adapter = HTTPAdapter(pool_connections=len(endpoints), pool_maxsize=max(4, concurrency), max_retries=0)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
         filters: list[CategoryFilter] = []
         for category in categories:
             filters.extend(category.filters)
 
         inserted = 0
-        chunk_size = int(os.getenv("OVERPASS_FILTER_CHUNK", "3"))
+        # 0 (the default) sends every filter in one union query per bbox.
+        chunk_size = int(os.getenv("OVERPASS_FILTER_CHUNK", "0")) or max(1, len(filters))
         element_types_env = os.getenv("OVERPASS_ELEMENT_TYPES", "nwr")
         element_types = [entry.strip() for entry in element_types_env.split(",") if entry.strip()]
         retry_limit = int(os.getenv("OVERPASS_RETRIES", "3"))
@@ -333,99 +641,53 @@ def import_osm(area: AreaConfig, categories: list[CategoryConfig]) -> int:
         else:
             bbox_list = [None]
 
-        for bbox in bbox_list:
-            for filt_chunk in chunked(filters, chunk_size):
-                query = build_query(area, filt_chunk, config.overpass_timeout, element_types, bbox_override=bbox)
-
-                data = None
-                last_error = None
-                for endpoint in endpoints:
-                    for attempt in range(1, retry_limit + 1):
-                        try:
-                            resp = session.post(endpoint, data=query.encode("utf-8"), timeout=config.overpass_timeout)
-                        except requests.RequestException as exc:
-                            last_error = exc
-                            time.sleep(retry_delay)
-                            continue
-
-                        if resp.status_code in (429, 504):
-                            last_error = RuntimeError(f"Overpass {endpoint} returned {resp.status_code}")
-                            time.sleep(retry_delay)
-                            continue
-
-                        if resp.status_code != 200:
-                            last_error = RuntimeError(f"Overpass {endpoint} returned {resp.status_code}")
-                            break
-
-                        try:
-                            data = resp.json()
-                            break
-                        except ValueError:
-                            snippet = resp.text[:200].replace("\n", " ")
-                            last_error = RuntimeError(f"Non-JSON response from {endpoint}: {snippet}")
-                            time.sleep(retry_delay)
-                            continue
-
-                    if data is not None:
-                        break
+        matcher = CategoryMatcher(filters)
+        queries = [
+            build_query(area, filt_chunk, config.overpass_timeout, element_types, bbox_override=bbox)
+            for bbox in bbox_list
+            for filt_chunk in chunked(filters, chunk_size)
+        ]
+        fetch = partial(
+            fetch_overpass,
+            session,
+            endpoints,
+            timeout=config.overpass_timeout,
+            retry_limit=retry_limit,
+            retry_delay=retry_delay,
+            pause=int(os.getenv("OVERPASS_SLEEP", "1")),
+            area_name=area.name,
+            cache_dir=cache_dir,
+            cache_ttl=int(os.getenv("OVERPASS_CACHE_TTL", "86400")),
+        )
 
-                if data is None:
-                    raise RuntimeError(f"Overpass failed for area {area.name}: {last_error}")
+        # Tiles are fetched a few at a time so Overpass server time overlaps;
+        # inserts stay on this thread, in query order.
+        query_iter = iter(queries)
+        pending: deque = deque()
+        # Resolved on the first tile with elements, then reused for the rest
+        city_id: Optional[uuid.UUID] = None
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            while True:
+                while len(pending) < concurrency * 2:
+                    query = next(query_iter, None)
+                    if query is None:
+                        break
+                    pending.append(executor.submit(fetch, query))
+                if not pending:
+                    break
 
-                elements = data.get("elements", [])
+                try:
+                    elements = pending.popleft().result()
+                except Exception:
+                    for queued in pending:
+                        queued.cancel()
+                    raise
                 if not elements:
                     continue
 
                 with session_scope() as db:
-                    city = get_or_create_city(db, area)
-
-                    for element in elements:
-                        tags = element.get("tags", {})
-                        source_id = f"{element.get('type')}/{element.get('id')}"
-
-                        existing = (
-                            db.execute(
-                                select(Business.id).where(Business.source == "osm").where(Business.source_id == source_id)
-                            )
-                            .scalars()
-                            .first()
-                        )
-                        if existing:
-                            continue
-
-                        lat, lon = element_location(element)
-                        category = match_category(filters, tags) or classify_business(tags)
-                        website = extract_website(tags)
-                        address = extract_address(tags)
-
-                        business = Business(
-                            source="osm",
-                            source_id=source_id,
-                            name=tags.get("name"),
-                            category=category,
-                            website_url=website,
-                            address=address,
-                            lat=lat,
-                            lon=lon,
-                            raw=tags,
-                            city_id=city.id,
-                        )
-                        db.add(business)
-                        db.flush()
-
-                        contacts = extract_contacts(tags)
-                        for contact_type, value in contacts:
-                            db.add(
-                                BusinessContact(
-                                    business_id=business.id,
-                                    contact_type=contact_type,
-                                    value=value,
-                                    source="osm",
-                                )
-                            )
-
-                        inserted += 1
-
-                time.sleep(int(os.getenv("OVERPASS_SLEEP", "1")))
+                    if city_id is None:
+                        city_id = get_or_create_city(db, area).id
+                    inserted += insert_elements(db, elements, matcher, city_id)
 
         return inserted
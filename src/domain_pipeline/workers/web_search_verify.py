@@ -13,6 +13,7 @@ from __future__ import annotations
 import logging
 import re
 import time
+from functools import lru_cache
 from typing import Optional
 from urllib.parse import parse_qs, unquote, urlparse
 
@@ -32,7 +33,7 @@ JOB_NAME = "web_search_verify_websites"
 
 # Domains that are business directories or social media — NOT real business websites.
 # If a search result points here, the business doesn't necessarily own this URL.
-DIRECTORY_DOMAINS = {
+DIRECTORY_DOMAINS = frozenset({
     # Social media
     "facebook.com", "instagram.com", "twitter.com", "x.com",
     "linkedin.com", "tiktok.com", "youtube.com", "pinterest.com",
@@ -186,15 +187,33 @@ DIRECTORY_DOMAINS = {
     "walmart.com", "walmart.ca",
     "alibaba.com",
     "etsy.com",
-}
+})
 
 # Common public email domains — search results from these aren't business websites
-PUBLIC_EMAIL_DOMAINS_QUICK = {
+PUBLIC_EMAIL_DOMAINS_QUICK = frozenset({
     "gmail.com", "yahoo.com", "hotmail.com", "outlook.com",
     "aol.com", "icloud.com", "mail.com", "protonmail.com",
-}
+})
+
+# Patterns used per search result, compiled once at import.
+_POSSESSIVE_RE = re.compile(r"[''`]s?\b")
+_NON_ALNUM_SPACE_RE = re.compile(r"[^a-z0-9\s]")
+_WHITESPACE_RE = re.compile(r"\s+")
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]")
+_DATE_PATH_RE = re.compile(r"\d{4}[/-]\d{2}[/-]\d{2}")
+
+_NAME_STOP_WORDS = frozenset({
+    "the", "a", "an", "and", "of", "in", "at", "to", "for", "by", "le", "la", "les", "de", "du", "al",
+})
+
+_ARTICLE_PATH_INDICATORS = (
+    "/blog/", "/article/", "/news/", "/post/",
+    "/story/", "/review/", "/supplier", "/archives/",
+    "/magazine/", "/press/", "/media/", "/column/",
+)
 
 
+@lru_cache(maxsize=4096)
 def _get_domain_from_url(url: str) -> str:
     """Extract the root domain from a URL."""
     try:
@@ -213,28 +232,25 @@ def _is_directory_or_social(url: str) -> bool:
     domain = _get_domain_from_url(url)
     if not domain:
         return True  # Can't parse = skip
-    # Check exact match and parent domain match
-    for dir_domain in DIRECTORY_DOMAINS:
-        if domain == dir_domain or domain.endswith("." + dir_domain):
-            return True
-    return False
+    # Check exact match and parent domain match, one set lookup per suffix
+    labels = domain.split(".")
+    return any(".".join(labels[i:]) in DIRECTORY_DOMAINS for i in range(len(labels)))
 
 
 def _normalize_name(name: str) -> str:
     """Normalize a business name for comparison."""
     # Remove common suffixes and punctuation
     clean = name.lower().strip()
-    clean = re.sub(r"[''`]s?\b", "", clean)  # Remove possessives
-    clean = re.sub(r"[^a-z0-9\s]", " ", clean)  # Keep only letters/numbers
-    clean = re.sub(r"\s+", " ", clean).strip()
+    clean = _POSSESSIVE_RE.sub("", clean)  # Remove possessives
+    clean = _NON_ALNUM_SPACE_RE.sub(" ", clean)  # Keep only letters/numbers
+    clean = _WHITESPACE_RE.sub(" ", clean).strip()
     return clean
 
 
 def _name_words(name: str) -> set[str]:
     """Get significant words from a name (skip stop words)."""
-    stop_words = {"the", "a", "an", "and", "of", "in", "at", "to", "for", "by", "le", "la", "les", "de", "du", "al"}
     words = set(_normalize_name(name).split())
-    return words - stop_words
+    return words - _NAME_STOP_WORDS
 
 
 # Words too generic to confirm a domain belongs to a specific business.
@@ -297,7 +313,7 @@ def _domain_contains_name(domain: str, business_name: str) -> bool:
 
     # Remove TLD and hyphens from domain for comparison
     domain_base = domain.split(".")[0].lower().replace("-", "")
-    name_clean = re.sub(r"[^a-z0-9]", "", business_name.lower())
+    name_clean = _NON_ALNUM_RE.sub("", business_name.lower())
 
     # Strong match: full cleaned name is substring of domain
     # e.g. "sonidentistry" in "sonidentistry" or "villagecobbler" in "thevillagecobbler"
@@ -415,17 +431,12 @@ def _looks_like_article_url(url: str) -> bool:
             return False
 
         # Date-based paths: /2025/10/24/... or /2025-01-24-...
-        if re.search(r"\d{4}[/-]\d{2}[/-]\d{2}", path):
+        if _DATE_PATH_RE.search(path):
             return True
 
         # Common blog/article path indicators
-        article_indicators = [
-            "/blog/", "/article/", "/news/", "/post/",
-            "/story/", "/review/", "/supplier", "/archives/",
-            "/magazine/", "/press/", "/media/", "/column/",
-        ]
         path_lower = f"/{path.lower()}/"
-        if any(ind in path_lower for ind in article_indicators):
+        if any(ind in path_lower for ind in _ARTICLE_PATH_INDICATORS):
             return True
 
         segments = [s for s in path.split("/") if s]
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from domain_pipeline.workers.llm_verify import _parse_reset_seconds, _pre_classify
+
+
+def _hits(*urls: str) -> list[dict]:
+    return [{"url": url, "title": "", "snippet": ""} for url in urls]
+
+
+HAS_WEBSITE = {
+    "status": "has_website",
+    "website_url": "https://joesplumbing.com",
+    "reason": "domain_match",
+    "pre_classified": True,
+}
+NO_WEBSITE = {
+    "status": "no_website",
+    "website_url": None,
+    "reason": "directory_listings_only",
+    "pre_classified": True,
+}
+
+
+@pytest.mark.parametrize(
+    ("name", "results", "expected"),
+    [
+        ("Joe's Plumbing", [], None),
+        # Two of the top five on the business's own host
+        (
+            "Joe's Plumbing",
+            _hits("https://www.joesplumbing.com/", "https://yelp.com/biz/joes", "https://joesplumbing.com/contact"),
+            HAS_WEBSITE,
+        ),
+        # Slug may be part of a longer label
+        (
+            "Joe's Plumbing",
+            _hits("https://joesplumbingltd.ca/", "https://joesplumbingltd.ca/about"),
+            {**HAS_WEBSITE, "website_url": "https://joesplumbingltd.ca"},
+        ),
+        # A single own-site hit is left to the LLM
+        ("Joe's Plumbing", _hits("https://joesplumbing.com/", "https://example.org/"), None),
+        # The second hit sits outside the top five
+        (
+            "Joe's Plumbing",
+            _hits(
+                "https://joesplumbing.com/", "https://a.org/", "https://b.org/",
+                "https://c.org/", "https://d.org/", "https://joesplumbing.com/contact",
+            ),
+            None,
+        ),
+        # Hits on different hosts don't add up
+        ("Joe's Plumbing", _hits("https://joesplumbing.com/", "https://joesplumbing.net/"), None),
+        # Slug only in the TLD position doesn't count
+        ("Shop", _hits("https://example.shop/", "https://example.shop/a"), None),
+        # Directory hosts never count as the business's own site
+        (
+            "Yelp",
+            _hits("https://yelp.com/biz/a", "https://yelp.com/biz/b", "https://yelp.com/biz/c"),
+            NO_WEBSITE,
+        ),
+        # Slugs shorter than four characters skip the domain check
+        ("Abc", _hits("https://abc.com/", "https://abc.com/contact"), None),
+        # Directory-only: at least three results, all directories
+        (
+            "Joe's Plumbing",
+            _hits("https://www.yelp.com/biz/joes", "https://m.facebook.com/joes", "https://yellowpages.ca/joes"),
+            NO_WEBSITE,
+        ),
+        ("Joe's Plumbing", _hits("https://yelp.com/biz/joes", "https://facebook.com/joes"), None),
+        (
+            "Joe's Plumbing",
+            _hits("https://yelp.com/biz/joes", "https://facebook.com/joes", "https://example.org/joes"),
+            None,
+        ),
+        # Only the top ten are considered for the directory-only verdict
+        (
+            "Joe's Plumbing",
+            _hits(*[f"https://yelp.com/biz/{i}" for i in range(10)], "https://example.org/"),
+            NO_WEBSITE,
+        ),
+    ],
+)
+def test_pre_classify(name, results, expected):
+    assert _pre_classify(name, results) == expected
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (None, None),
+        ("", None),
+        ("12", 12.0),
+        ("12.5", 12.5),
+        ("0", 0.0),
+        ("1m30s", 90.0),
+        ("1m2.5s", 62.5),
+        ("120ms", 0.12),
+        ("2h", 7200.0),
+        ("abc", None),
+        ("soon", None),
+    ],
+)
+def test_parse_reset_seconds(value, expected):
+    result = _parse_reset_seconds(value)
+    if expected is None:
+        assert result is None
+    else:
+        assert result == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("scale", [1.0, 1000.0])
+def test_parse_reset_seconds_epoch(scale):
+    # Epoch seconds or milliseconds become seconds from now, never negative
+    assert _parse_reset_seconds(str((time.time() + 30) * scale)) == pytest.approx(30, abs=2)
+    assert _parse_reset_seconds(str((time.time() - 30) * scale)) == 0.0
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import random
+from pathlib import Path
+from typing import Any, Optional
+
+import pytest
+
+from domain_pipeline.workers.osm_import import (
+    CategoryFilter,
+    CategoryMatcher,
+    load_categories,
+    match_category,
+)
+
+CATEGORIES_PATH = Path(__file__).resolve().parents[2] / "config" / "categories.json"
+
+
+def _first_match(filters: list[CategoryFilter], tags: dict[str, Any]) -> Optional[str]:
+    """The original linear scan CategoryMatcher replaced."""
+    for filt in filters:
+        match = True
+        for key, value in filt.tags.items():
+            if value in ("*", None):
+                if key not in tags:
+                    match = False
+                    break
+            elif tags.get(key) != value:
+                match = False
+                break
+        if match:
+            if filt.category.startswith("any_"):
+                return None
+            return filt.category
+    return None
+
+
+TIE_FILTERS = [
+    CategoryFilter("bakery_craft", {"shop": "bakery", "craft": "*"}),
+    CategoryFilter("any_shop", {"shop": "*"}),
+    CategoryFilter("bakery", {"shop": "bakery"}),
+    CategoryFilter("cafe", {"amenity": "cafe"}),
+    CategoryFilter("food", {"amenity": "*"}),
+    CategoryFilter("cafe_again", {"amenity": "cafe"}),
+    CategoryFilter("plumber", {"craft": "plumber"}),
+    CategoryFilter("office_craft", {"office": "*", "craft": "*"}),
+    CategoryFilter("crafts", {"craft": "*"}),
+]
+
+
+@pytest.mark.parametrize(
+    ("tags", "expected"),
+    [
+        # Multi-tag filter ranked first wins over later single-tag hits
+        ({"shop": "bakery", "craft": "baker"}, "bakery_craft"),
+        # Earlier wildcard beats a later exact match; any_* maps to None
+        ({"shop": "bakery"}, None),
+        # Exact match ranked ahead of the wildcard on the same key
+        ({"amenity": "cafe"}, "cafe"),
+        ({"amenity": "restaurant"}, "food"),
+        # Lowest position wins regardless of tag order on the element
+        ({"craft": "plumber", "amenity": "pub"}, "food"),
+        ({"amenity": "pub", "craft": "plumber"}, "food"),
+        ({"craft": "plumber"}, "plumber"),
+        # Multi-tag filter ranked behind an indexed hit is not considered
+        ({"office": "it", "craft": "plumber"}, "plumber"),
+        ({"office": "it", "craft": "carpenter"}, "office_craft"),
+        ({"craft": "carpenter"}, "crafts"),
+        ({"name": "Nothing"}, None),
+        ({}, None),
+    ],
+)
+def test_matcher_first_match_order(tags, expected):
+    assert _first_match(TIE_FILTERS, tags) == expected
+    assert CategoryMatcher(TIE_FILTERS).match(tags) == expected
+    assert match_category(TIE_FILTERS, tags) == expected
+
+
+def test_matcher_empty_filter_matches_everything_in_position():
+    filters = [
+        CategoryFilter("cafe", {"amenity": "cafe"}),
+        CategoryFilter("catch_all", {}),
+        CategoryFilter("shop", {"shop": "*"}),
+    ]
+    matcher = CategoryMatcher(filters)
+    assert matcher.match({"amenity": "cafe"}) == "cafe"
+    assert matcher.match({"shop": "books"}) == "catch_all"
+    assert matcher.match({}) == "catch_all"
+
+
+def test_matcher_matches_linear_scan_on_configured_categories():
+    filters: list[CategoryFilter] = []
+    for category in load_categories(CATEGORIES_PATH).values():
+        filters.extend(category.filters)
+    filters.extend(TIE_FILTERS)
+
+    keys = sorted({key for filt in filters for key in filt.tags} | {"name"})
+    values = sorted({value for filt in filters for value in filt.tags.values() if value}) + ["yes", "other"]
+
+    matcher = CategoryMatcher(filters)
+    rng = random.Random(1234)
+    for _ in range(20000):
+        tags = {rng.choice(keys): rng.choice(values) for _ in range(rng.randint(0, 4))}
+        assert matcher.match(tags) == _first_match(filters, tags), tags
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import pytest
+
+from domain_pipeline.workers.osm_import import classify_business
+
+
+@pytest.mark.parametrize(
+    ("tags", "expected"),
+    [
+        ({}, "other"),
+        ({"name": "Somewhere"}, "other"),
+        ({"craft": "plumber", "amenity": "restaurant"}, "trades"),
+        ({"office": "construction_company"}, "contractors"),
+        ({"company": "construction", "shop": "hardware"}, "contractors"),
+        ({"amenity": "restaurant"}, "food"),
+        ({"amenity": "pub", "healthcare": "yes"}, "food"),
+        ({"amenity": "dentist"}, "health"),
+        ({"healthcare": "physiotherapist"}, "health"),
+        # A healthcare tag outranks every non-food amenity group
+        ({"amenity": "school", "healthcare": "yes"}, "health"),
+        ({"amenity": "fuel", "healthcare": "yes"}, "health"),
+        ({"amenity": "university"}, "education"),
+        ({"amenity": "atm"}, "finance"),
+        ({"amenity": "place_of_worship"}, "religious"),
+        ({"amenity": "car_repair"}, "auto"),
+        # Unknown amenity falls through to the fallback keys, in order
+        ({"amenity": "bench", "shop": "books"}, "retail"),
+        ({"shop": "books", "tourism": "hotel"}, "retail"),
+        ({"tourism": "hotel", "leisure": "fitness_centre"}, "hospitality"),
+        ({"leisure": "fitness_centre", "office": "it"}, "recreation"),
+        ({"office": "lawyer", "industrial": "factory"}, "professional_services"),
+        ({"industrial": "factory"}, "industrial"),
+        # Empty values don't count
+        ({"craft": "", "shop": ""}, "other"),
+    ],
+)
+def test_classify_business(tags, expected):
+    assert classify_business(tags) == expected
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import pytest
+
+from domain_pipeline.workers.osm_contacts import extract_osm_contacts
+
+
+@pytest.mark.parametrize(
+    ("tags", "expected"),
+    [
+        ({"name": "No Contacts", "shop": "bakery"}, []),
+        ({"phone": "+1 416 555 0100"}, [("phone", "+1 416 555 0100")]),
+        # Multi-value separators and the tel: prefix
+        (
+            {"phone": "tel:+1 416 555 0100; +1 416 555 0101 / +1 416 555 0102 or +1 416 555 0103"},
+            [
+                ("phone", "+1 416 555 0100"),
+                ("phone", "+1 416 555 0101"),
+                ("phone", "+1 416 555 0102"),
+                ("phone", "+1 416 555 0103"),
+            ],
+        ),
+        # Bidi marks stripped, placeholder values dropped
+        ({"phone": "⁦+971 4 555 0100⁩", "mobile": "n/a"}, [("phone", "+971 4 555 0100")]),
+        ({"phone": "-", "email": "none", "contact:phone": "0"}, []),
+        # Namespaced keys, case-insensitive keys, dedupe across keys
+        (
+            {
+                "Contact:Mobile": "+44 20 7946 0000",
+                "phone:mobile": "+44 20 7946 0001",
+                "contact:whatsapp": "+44 20 7946 0000",
+                "contact:website": "https://example.com",
+                "telephone": "+44 20 7946 0002",
+            },
+            [
+                ("phone", "+44 20 7946 0000"),
+                ("phone", "+44 20 7946 0001"),
+                ("phone", "+44 20 7946 0002"),
+            ],
+        ),
+        # Emails: mailto:, lowercased, split, values without @ dropped
+        (
+            {"contact:email": "mailto:Info@Example.com, sales@example.com;not-an-email"},
+            [("email", "info@example.com"), ("email", "sales@example.com")],
+        ),
+        ({"email:billing": "BILLING@example.com"}, [("email", "billing@example.com")]),
+        # Phones come before emails regardless of tag order
+        (
+            {"email": "hello@example.com", "name": "Cafe", "phone": "+1 604 555 0199"},
+            [("phone", "+1 604 555 0199"), ("email", "hello@example.com")],
+        ),
+        # Non-string values are stringified; empty values skipped
+        ({"phone": 4165550100, "mobile": "", "email": None}, [("phone", "4165550100")]),
+        # Unrelated keys that merely contain a contact word are ignored
+        ({"phone_booth": "yes", "emailed": "x@y.z", "contact:phoneme": "1"}, []),
+    ],
+)
+def test_extract_osm_contacts(tags, expected):
+    assert extract_osm_contacts(tags) == expected
+
+
+def test_extract_osm_contacts_is_stable_across_calls():
+    tags = {"phone": "+1 416 555 0100;+1 416 555 0100", "email": "A@b.co"}
+    first = extract_osm_contacts(tags)
+    assert first == [("phone", "+1 416 555 0100"), ("email", "a@b.co")]
+    assert extract_osm_contacts(tags) == first